@@ -0,0 +1,35 @@
+import argparse
+import json
+import logging
+import time
+from pathlib import Path
+
+from src.animation.animation import Animation
+from src.animation.animation_renderer import AnimationRenderer
+from src.model.precision import set_precision
+
+logging.basicConfig()
+logging.getLogger().setLevel(logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Render an animation as a numbered image sequence.")
+    parser.add_argument("spec", type=str,
+                        help="Описание анимации в JSON: параметры кадра options, easing и ключевые кадры keyframes.")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Количество процессов (по умолчанию — число ядер).")
+    args = parser.parse_args()
+
+    spec = json.loads(Path(args.spec).read_text(encoding="utf-8"))
+    renderer = AnimationRenderer(spec["options"], args.workers)
+    set_precision(renderer.config.get_precision())
+    animation = Animation.from_dict(spec, renderer.config.get_renderer(), renderer.config.get_rect())
+
+    start_time = time.time()
+    paths = renderer.render(animation)
+    logger.info("Animation rendered: %d frames, %.2f sec", len(paths), time.time() - start_time)
+
+
+if __name__ == "__main__":
+    main()
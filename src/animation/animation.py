@@ -0,0 +1,94 @@
+import bisect
+from typing import Any
+
+from src.animation.easing import Easing
+from src.animation.keyframe import Keyframe
+from src.model.affine_coef import AffineCoefficient
+from src.model.color import Color
+from src.model.rect import Rect
+from src.renderer.abstract_renderer import AbstractRenderer
+from src.transforms.affine_transformation import AffineTransformation
+from src.utils.random_utils import RandomStreams
+
+
+class Animation:
+    """
+    Класс Animation описывает анимацию ключевыми кадрами.
+
+    Кадры нумеруются с нуля, первый ключевой кадр — кадр 0, последний задаёт
+    длину анимации. Параметры промежуточного кадра интерполируются между
+    соседними ключевыми кадрами с законом изменения easing.
+    """
+
+    keyframes: list[Keyframe]
+    easing: Easing
+
+    def __init__(self, keyframes: list[Keyframe], easing: Easing = Easing.linear) -> None:
+        """
+        Создает анимацию.
+
+        :param keyframes: Ключевые кадры в любом порядке.
+        :param easing: Закон изменения параметров между ключевыми кадрами.
+        """
+        keyframes = sorted(keyframes, key=lambda keyframe: keyframe.frame)
+        if not keyframes or keyframes[0].frame != 0:
+            raise ValueError("Animation must start with a keyframe at frame 0.")
+        frames = [keyframe.frame for keyframe in keyframes]
+        if len(set(frames)) != len(frames):
+            raise ValueError("Keyframe numbers must be unique.")
+        self.keyframes = keyframes
+        self.easing = easing
+
+    @property
+    def frame_count(self) -> int:
+        return self.keyframes[-1].frame + 1
+
+    def frame(self, index: int) -> tuple[Rect, list[AffineTransformation]]:
+        """
+        Возвращает параметры кадра.
+
+        :param index: Номер кадра.
+        :return: Область мирового пространства и аффинные преобразования кадра.
+        """
+        if not 0 <= index < self.frame_count:
+            message = f"Frame {index} is out of range 0..{self.frame_count - 1}"
+            raise ValueError(message)
+        position = bisect.bisect_right([keyframe.frame for keyframe in self.keyframes], index) - 1
+        start = self.keyframes[position]
+        if start.frame == index:
+            return start.world, start.affine_transformations
+        end = self.keyframes[position + 1]
+        return start.interpolate(end, self.easing.apply((index - start.frame) / (end.frame - start.frame)))
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any], renderer: AbstractRenderer, world: Rect) -> "Animation":
+        """
+        Создает анимацию из описания.
+
+        Описание — словарь {"easing": "linear", "keyframes": [...]}. Ключевой
+        кадр задаётся номером frame, областью rect ([x, y, ширина, высота],
+        по умолчанию world) и преобразованиями: зерном seed, из которого
+        рендерер строит набор преобразований так же, как при обычном
+        рендеринге, или явным списком affines из словарей с коэффициентами
+        a-f и цветом color ([r, g, b]).
+
+        :param data: Описание анимации.
+        :param renderer: Рендерер, строящий преобразования по зерну.
+        :param world: Область мирового пространства по умолчанию.
+        :return: Анимация.
+        """
+        keyframes = []
+        for entry in data["keyframes"]:
+            rect = entry.get("rect")
+            keyframe_world = world if rect is None else Rect(*rect)
+            if "affines" in entry:
+                affine_transformations = [
+                    AffineTransformation(AffineCoefficient({name: affine[name] for name in Keyframe.COEFFICIENTS},
+                                                           Color(*affine["color"])))
+                    for affine in entry["affines"]
+                ]
+            else:
+                affine_transformations = renderer.generate_affine_transformations(
+                    RandomStreams(entry.get("seed")).affine_random())
+            keyframes.append(Keyframe(int(entry["frame"]), keyframe_world, affine_transformations))
+        return cls(keyframes, Easing(data.get("easing", Easing.linear.value)))
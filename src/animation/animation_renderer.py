@@ -0,0 +1,148 @@
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Optional
+
+from src.animation.animation import Animation
+from src.model.fractal_image import FractalImage
+from src.model.precision import Precision, set_precision
+from src.model.rect import Rect
+from src.processor.image_processor import ImageProcessor
+from src.renderer.abstract_renderer import AbstractRenderer
+from src.saver.fornat_image_saver import FormatImageSaver
+from src.transforms.affine_transformation import AffineTransformation
+from src.ui.command_line_args import CommandLineArgs
+from src.utils.random_utils import RandomStreams
+
+logger = logging.getLogger(__name__)
+
+
+class AnimationRenderer:
+    """
+    Класс AnimationRenderer рендерит кадры анимации в пуле процессов.
+
+    Единица параллельной работы — кадр. Рендерер, процессор и сохранение
+    создаются в каждом процессе пула один раз при его запуске и
+    используются для всех его кадров; в процесс передаются только область и
+    преобразования кадра. Все кадры используют одни и те же потоки
+    случайных чисел, поэтому траектории точек соседних кадров меняются
+    плавно вместе с параметрами, а шум не мерцает от кадра к кадру.
+
+    Кадры сохраняются как нумерованная последовательность
+    <saver.path>_00000.<формат>, которую можно собрать в видео, например
+    ffmpeg -i <saver.path>_%05d.png.
+    """
+
+    options: dict[str, Any]
+    config: CommandLineArgs
+    workers: int
+
+    def __init__(self, options: dict[str, Any], workers: Optional[int] = None) -> None:
+        """
+        Создает рендерер анимации.
+
+        :param options: Параметры рендеринга кадра (ключи — имена параметров командной строки без '--').
+        :param workers: Количество процессов (по умолчанию — число ядер).
+        :raises ValueError: Если параметры не подходят для рендеринга кадров в процессах.
+        """
+        if workers is not None and workers <= 0:
+            raise ValueError("Workers count must be greater than 0.")
+        config = CommandLineArgs.from_dict(options)
+        if config.get("renderer.type") == "process":
+            raise ValueError("Animation frames are rendered in processes; choose simple, multi or numpy renderer.")
+        if config.get("tile.size") is not None or config.get("checkpoint.path") is not None \
+                or config.get("mmap.dir") or config.get_int("progressive.passes") > 1:
+            raise ValueError("Animation does not support tiles, checkpoints, mmap and progressive passes.")
+        self.options = dict(options)
+        self.config = config
+        self.workers = workers or os.cpu_count() or 1
+
+    def frame_path(self, index: int) -> Path:
+        """
+        Возвращает путь файла кадра.
+
+        :param index: Номер кадра.
+        :return: Путь файла.
+        """
+        return Path(f"{self.config.get('saver.path')}_{index:05d}.{self.config.get('saver.format')}")
+
+    def render(self, animation: Animation) -> list[Path]:
+        """
+        Рендерит и сохраняет все кадры анимации.
+
+        :param animation: Анимация.
+        :return: Пути файлов кадров по порядку.
+        """
+        entropy = RandomStreams(self.config.get("seed")).entropy
+        logger.info("Seed: %d", entropy)
+        precision = self.config.get_precision()
+        with ProcessPoolExecutor(max_workers=min(self.workers, animation.frame_count), initializer=_init_worker,
+                                 initargs=(self.options, entropy, precision)) as executor:
+            tasks = []
+            for index in range(animation.frame_count):
+                world, affine_transformations = animation.frame(index)
+                tasks.append(executor.submit(_render_frame, world, affine_transformations, self.frame_path(index)))
+            paths = []
+            for index, task in enumerate(tasks):
+                paths.append(task.result())
+                logger.info("Frame %d/%d saved", index + 1, len(tasks))
+        return paths
+
+
+class _FrameWorker:
+    """
+    Состояние процесса пула: объекты, общие для всех кадров, которые рендерит процесс.
+    """
+
+    config: CommandLineArgs
+    renderer: AbstractRenderer
+    processor: ImageProcessor
+    saver: FormatImageSaver
+    streams: RandomStreams
+
+    def __init__(self, options: dict[str, Any], entropy: int) -> None:
+        self.config = CommandLineArgs.from_dict(options)
+        self.renderer = self.config.get_renderer()
+        self.processor = self.config.get_processor()
+        self.saver = FormatImageSaver(self.config.get("saver.format"), self.config.get_encoder_options())
+        self.streams = RandomStreams(entropy)
+
+    def render(self, world: Rect, affine_transformations: list[AffineTransformation], path: Path) -> Path:
+        # Размеры передаются в том же порядке, что и в FractalGenerator, чтобы кадр повторял обычный рендеринг
+        factor = self.config.get_int("processor.supersample")
+        image = FractalImage.create(self.config.get_int("image.height") * factor,
+                                    self.config.get_int("image.width") * factor,
+                                    channels=self.renderer.color_mode.channels)
+        self.renderer.render_image(image, world, affine_transformations, self.streams)
+        self.processor.processor(image)
+        self.saver.save(image, path)
+        return path
+
+
+_worker: Optional[_FrameWorker] = None
+
+
+def _init_worker(options: dict[str, Any], entropy: int, precision: Precision) -> None:
+    """
+    Создает состояние процесса пула.
+
+    :param options: Параметры рендеринга кадра.
+    :param entropy: Энтропия потоков случайных чисел анимации.
+    :param precision: Режим точности родительского процесса.
+    """
+    global _worker  # noqa: PLW0603
+    set_precision(precision)
+    _worker = _FrameWorker(options, entropy)
+
+
+def _render_frame(world: Rect, affine_transformations: list[AffineTransformation], path: Path) -> Path:
+    """
+    Рендерит и сохраняет кадр в процессе пула.
+
+    :param world: Область мирового пространства кадра.
+    :param affine_transformations: Аффинные преобразования кадра.
+    :param path: Путь файла кадра.
+    :return: Путь файла кадра.
+    """
+    return _worker.render(world, affine_transformations, path)
@@ -0,0 +1,25 @@
+from enum import Enum
+
+
+class Easing(Enum):
+    """
+    Закон изменения параметров между ключевыми кадрами.
+
+    linear меняет параметры равномерно, smooth замедляет изменение у
+    ключевых кадров (кубическая функция smoothstep), поэтому движение не
+    дёргается при проходе через ключевой кадр.
+    """
+
+    linear = "linear"
+    smooth = "smooth"
+
+    def apply(self, t: float) -> float:
+        """
+        Преобразует долю пути между ключевыми кадрами.
+
+        :param t: Доля пути от 0 до 1.
+        :return: Доля изменения параметров от 0 до 1.
+        """
+        if self is Easing.smooth:
+            return t * t * (3 - 2 * t)
+        return t
@@ -0,0 +1,54 @@
+from dataclasses import dataclass
+from typing import ClassVar
+
+from src.model.affine_coef import AffineCoefficient
+from src.model.color import Color
+from src.model.precision import Number, number
+from src.model.rect import Rect
+from src.transforms.affine_transformation import AffineTransformation
+
+
+@dataclass
+class Keyframe:
+    """
+    Ключевой кадр анимации: область мирового пространства и аффинные преобразования в кадре с номером frame.
+    """
+
+    COEFFICIENTS: ClassVar[tuple[str, ...]] = ("a", "b", "c", "d", "e", "f")
+
+    frame: int
+    world: Rect
+    affine_transformations: list[AffineTransformation]
+
+    def interpolate(self, other: "Keyframe", t: float) -> tuple[Rect, list[AffineTransformation]]:
+        """
+        Вычисляет параметры промежуточного кадра линейной интерполяцией.
+
+        Коэффициенты и цвета преобразований интерполируются попарно, поэтому
+        количество преобразований в ключевых кадрах должно совпадать.
+
+        :param other: Следующий ключевой кадр.
+        :param t: Доля пути от этого кадра к следующему (0 — этот кадр, 1 — следующий).
+        :return: Область мирового пространства и аффинные преобразования кадра.
+        """
+        if len(self.affine_transformations) != len(other.affine_transformations):
+            message = (f"Keyframes {self.frame} and {other.frame} have different affine counts: "
+                       f"{len(self.affine_transformations)} and {len(other.affine_transformations)}")
+            raise ValueError(message)
+        factor = number(t)
+        world = Rect(*(self._lerp(start, end, factor) for start, end in zip(
+            (self.world.x, self.world.y, self.world.width, self.world.height),
+            (other.world.x, other.world.y, other.world.width, other.world.height), strict=True)))
+        affine_transformations = []
+        for start, end in zip(self.affine_transformations, other.affine_transformations, strict=True):
+            coefficients = {name: self._lerp(getattr(start.affine_coef, name), getattr(end.affine_coef, name), factor)
+                            for name in self.COEFFICIENTS}
+            start_color, end_color = start.affine_coef.color, end.affine_coef.color
+            color = Color(*(round(channel + (end_channel - channel) * t) for channel, end_channel in zip(
+                (start_color.r, start_color.g, start_color.b), (end_color.r, end_color.g, end_color.b), strict=True)))
+            affine_transformations.append(AffineTransformation(AffineCoefficient(coefficients, color)))
+        return world, affine_transformations
+
+    @staticmethod
+    def _lerp(start: Number, end: Number, t: Number) -> Number:
+        return start + (end - start) * t
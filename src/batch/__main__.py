@@ -0,0 +1,38 @@
+import argparse
+import json
+import logging
+import sys
+import time
+from pathlib import Path
+
+from src.batch.batch_manifest import BatchManifest
+from src.batch.batch_runner import BatchRunner
+
+logging.basicConfig()
+logging.getLogger().setLevel(logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Render a batch of fractal images in one process.")
+    parser.add_argument("manifest", type=str, help="Манифест заданий (.json, .yaml или .yml).")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Количество процессов общего пула (по умолчанию — число ядер).")
+    parser.add_argument("--jobs", type=int, default=2, help="Количество одновременно выполняемых заданий.")
+    parser.add_argument("--report", type=str, default=None, help="Файл отчёта о заданиях в JSON.")
+    args = parser.parse_args()
+
+    jobs = BatchManifest.load(Path(args.manifest))
+    start_time = time.time()
+    results = BatchRunner(args.workers, args.jobs).run(jobs)
+    failed = [result for result in results if not result.ok]
+    logger.info("Batch done: %d jobs, %d failed, %.2f sec", len(results), len(failed), time.time() - start_time)
+
+    if args.report:
+        report = [result.to_dict() for result in results]
+        Path(args.report).write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
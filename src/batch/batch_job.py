@@ -0,0 +1,36 @@
+from dataclasses import dataclass
+from typing import Any
+
+from src.ui.command_line_args import CommandLineArgs
+
+
+@dataclass(frozen=True)
+class BatchJob:
+    """
+    Задание пакетного режима: параметры генерации одного изображения.
+
+    Ключи параметров совпадают с именами параметров командной строки без '--'.
+    """
+
+    name: str
+    options: dict[str, Any]
+    config: CommandLineArgs
+
+    @classmethod
+    def from_options(cls, options: dict[str, Any]) -> "BatchJob":
+        """
+        Создает задание из параметров.
+
+        :param options: Параметры задания.
+        :return: Задание, названное по пути сохранения изображения.
+        """
+        config = CommandLineArgs.from_dict(options)
+        return cls(f"{config.get('saver.path')}.{config.get('saver.format')}", options, config)
+
+    @property
+    def points(self) -> int:
+        """
+        Возвращает оценку объёма работы задания: количество точек, отображаемых на изображение.
+        """
+        return (self.config.get_int("samples") * max(self.config.get_int("iterSamples") - 1, 0)
+                * self.config.get_int("symmetry"))
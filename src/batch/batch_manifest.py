@@ -0,0 +1,70 @@
+import json
+from pathlib import Path
+
+from src.batch.batch_job import BatchJob
+
+
+class BatchManifest:
+    """
+    Класс BatchManifest загружает список заданий пакетного режима.
+
+    Манифест — JSON или YAML (для YAML нужен пакет PyYAML) одного из видов:
+    список параметров заданий или объект {"defaults": {...}, "jobs": [...]},
+    где параметры defaults дополняют параметры каждого задания. Ключи
+    совпадают с именами параметров командной строки без '--', например
+    {"image.width": 800, "seed": 7, "transformations.DiskTrans": true}.
+    """
+
+    YAML_SUFFIXES = (".yaml", ".yml")
+
+    @classmethod
+    def load(cls, path: Path) -> list[BatchJob]:
+        """
+        Загружает задания из файла манифеста.
+
+        :param path: Путь манифеста (.json, .yaml или .yml).
+        :return: Список заданий в порядке манифеста.
+        """
+        text = path.read_text(encoding="utf-8")
+        if path.suffix.lower() in cls.YAML_SUFFIXES:
+            try:
+                import yaml
+            except ImportError as err:
+                raise ValueError("YAML manifests require the PyYAML package.") from err
+            return cls.parse(yaml.safe_load(text))
+        return cls.parse(json.loads(text))
+
+    @staticmethod
+    def parse(data: object) -> list[BatchJob]:
+        """
+        Создает задания из разобранного манифеста.
+
+        Все задания проверяются сразу, чтобы ошибка в одном из них обнаружилась до начала рендеринга.
+
+        :param data: Список параметров заданий или словарь с ключами defaults и jobs.
+        :return: Список заданий.
+        :raises TypeError: Если манифест или задание не имеют нужной структуры.
+        :raises ValueError: Если параметры задания некорректны.
+        """
+        if isinstance(data, list):
+            defaults, jobs = {}, data
+        elif isinstance(data, dict) and isinstance(data.get("jobs"), list):
+            defaults, jobs = data.get("defaults") or {}, data["jobs"]
+        else:
+            raise TypeError("Manifest must be a list of jobs or an object with a 'jobs' list.")
+
+        result = []
+        for index, options in enumerate(jobs):
+            if not isinstance(options, dict):
+                message = f"Batch job {index} must be an object, got {type(options).__name__}"
+                raise TypeError(message)
+            try:
+                result.append(BatchJob.from_options({**defaults, **options}))
+            except SystemExit as err:
+                # argparse завершает процесс при неверных параметрах; пакету нужна ошибка конкретного задания
+                message = f"Invalid options of batch job {index}: {options}"
+                raise ValueError(message) from err
+
+        if len({job.config.get_precision() for job in result}) > 1:
+            raise ValueError("All batch jobs must use the same precision.")
+        return result
@@ -0,0 +1,92 @@
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from src.batch.batch_job import BatchJob
+from src.generator.fractal_generator import FractalGenerator
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class BatchResult:
+    """
+    Результат задания пакетного режима.
+    """
+
+    name: str
+    seconds: float
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"name": self.name, "seconds": self.seconds, "error": self.error}
+
+
+class BatchRunner:
+    """
+    Класс BatchRunner выполняет задания пакетного режима в одном процессе.
+
+    Все задания выполняет один генератор с общим пулом процессов, поэтому
+    запуск интерпретатора, разбор параметров и создание пула оплачиваются
+    один раз на весь пакет. Задания запускаются от самого трудоёмкого к
+    самому лёгкому по concurrency одновременно: пока одно задание объединяет
+    гистограммы, обрабатывает и сохраняет изображение, части сэмплов
+    следующего уже стоят в очереди пула и занимают освободившиеся ядра.
+
+    Общий пул использует рендерер process; задания с другими рендерерами
+    выполняются в потоках родительского процесса. Ошибка задания
+    записывается в его результат и не прерывает пакет.
+    """
+
+    workers: int
+    concurrency: int
+
+    def __init__(self, workers: Optional[int] = None, concurrency: int = 2) -> None:
+        """
+        Создает исполнителя пакета.
+
+        :param workers: Количество процессов общего пула (по умолчанию — число ядер).
+        :param concurrency: Количество одновременно выполняемых заданий.
+        """
+        if workers is not None and workers <= 0:
+            raise ValueError("Workers count must be greater than 0.")
+        if concurrency <= 0:
+            raise ValueError("Concurrency must be greater than 0.")
+        self.workers = workers or os.cpu_count() or 1
+        self.concurrency = concurrency
+
+    def run(self, jobs: list[BatchJob]) -> list[BatchResult]:
+        """
+        Выполняет задания.
+
+        :param jobs: Задания.
+        :return: Результаты в порядке заданий.
+        """
+        order = sorted(range(len(jobs)), key=lambda index: jobs[index].points, reverse=True)
+        results: list[Optional[BatchResult]] = [None] * len(jobs)
+        with ProcessPoolExecutor(max_workers=self.workers) as pool, \
+                ThreadPoolExecutor(max_workers=self.concurrency) as drivers:
+            generator = FractalGenerator(pool)
+            tasks = {index: drivers.submit(self._run_job, generator, jobs[index]) for index in order}
+            for index, task in tasks.items():
+                results[index] = task.result()
+        return [result for result in results if result is not None]
+
+    @staticmethod
+    def _run_job(generator: FractalGenerator, job: BatchJob) -> BatchResult:
+        start = time.perf_counter()
+        try:
+            generator.execute(job.config)
+        except Exception as err:
+            logger.exception("Batch job %s failed", job.name)
+            return BatchResult(job.name, time.perf_counter() - start, f"{type(err).__name__}: {err}")
+        seconds = time.perf_counter() - start
+        logger.info("Batch job %s done in %.2f sec", job.name, seconds)
+        return BatchResult(job.name, seconds)
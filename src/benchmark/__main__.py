@@ -0,0 +1,121 @@
+import argparse
+import itertools
+import json
+import logging
+import sys
+from pathlib import Path
+
+from src.benchmark.benchmark_case import BenchmarkCase
+from src.benchmark.benchmark_runner import BenchmarkRunner
+from src.benchmark.report_comparator import ReportComparator
+from src.ui.command_line_args import CommandLineArgs
+
+logging.basicConfig()
+logging.getLogger().setLevel(logging.WARNING)
+
+
+def parse_size(value: str) -> tuple[int, int]:
+    """
+    Разбирает размер изображения вида WIDTHxHEIGHT.
+
+    :param value: Строка размера, например '256x256'.
+    :return: Пара (ширина, высота).
+    """
+    try:
+        width, height = (int(part) for part in value.lower().split("x"))
+    except ValueError as err:
+        message = f"Invalid size: {value}, expected WIDTHxHEIGHT"
+        raise argparse.ArgumentTypeError(message) from err
+    return width, height
+
+
+def parse_variations(value: str) -> tuple[str, ...]:
+    """
+    Разбирает набор вариаций, перечисленных через запятую (например, 'DiskTrans,SphericalTrans').
+
+    :param value: Строка набора вариаций.
+    :return: Кортеж имён вариаций.
+    """
+    names = tuple(name.strip() for name in value.split(",") if name.strip())
+    unknown = [name for name in names if name not in CommandLineArgs.TRANSFORMATIONS]
+    if not names or unknown:
+        message = f"Invalid variations: {value}, expected names from {', '.join(CommandLineArgs.TRANSFORMATIONS)}"
+        raise argparse.ArgumentTypeError(message)
+    return names
+
+
+def build_cases(args: argparse.Namespace) -> list[BenchmarkCase]:
+    """
+    Строит случаи бенчмарка как декартово произведение заданных параметров.
+
+    :param args: Разобранные аргументы команды run.
+    :return: Список случаев.
+    """
+    return [
+        BenchmarkCase(renderer_type, width, height, samples, iter_per_sample, symmetry, variations)
+        for renderer_type, (width, height), samples, iter_per_sample, symmetry, variations in itertools.product(
+            args.renderers, args.sizes, args.samples, args.iterSamples, args.symmetry, args.variations
+        )
+    ]
+
+
+def run(args: argparse.Namespace) -> int:
+    runner = BenchmarkRunner(repeat=args.repeat, seed=args.seed, image_format=args.format,
+                             measure_memory=not args.noMemory)
+    report = runner.run(build_cases(args))
+    text = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+    return 0
+
+
+def compare(args: argparse.Namespace) -> int:
+    baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+    current = json.loads(Path(args.current).read_text(encoding="utf-8"))
+    regressions = ReportComparator(args.threshold, args.memoryThreshold).compare(baseline, current)
+    for regression in regressions:
+        print(f"SLOWDOWN {regression}")
+    if not regressions:
+        print("No slowdowns found.")
+    return 1 if regressions else 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Fractal renderer benchmark.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="Замерить стадии и вывести отчёт в JSON.")
+    run_parser.add_argument("--renderers", nargs="+", default=["simple", "numpy"],
+                            choices=sorted(BenchmarkRunner.RENDERERS), help="Типы рендереров.")
+    run_parser.add_argument("--sizes", nargs="+", type=parse_size, default=[(128, 128)],
+                            help="Размеры изображения вида WIDTHxHEIGHT.")
+    run_parser.add_argument("--samples", nargs="+", type=int, default=[50], help="Количество выборок.")
+    run_parser.add_argument("--iterSamples", nargs="+", type=int, default=[500],
+                            help="Количество итераций на выборку.")
+    run_parser.add_argument("--symmetry", nargs="+", type=int, default=[1], help="Уровни симметрии.")
+    run_parser.add_argument("--variations", nargs="+", type=parse_variations, default=[("LinearTrans",)],
+                            help="Наборы вариаций, имена в наборе через запятую (например, DiskTrans,HeartTrans).")
+    run_parser.add_argument("--repeat", type=int, default=3, help="Количество запусков каждого случая.")
+    run_parser.add_argument("--seed", type=int, default=0, help="Зерно рендеринга.")
+    run_parser.add_argument("--format", type=str, default="png", help="Формат сохранения изображения.")
+    run_parser.add_argument("--noMemory", action="store_true", help="Не замерять пиковую память.")
+    run_parser.add_argument("--output", type=str, default=None, help="Файл отчёта (по умолчанию — stdout).")
+    run_parser.set_defaults(handler=run)
+
+    compare_parser = commands.add_parser("compare", help="Сравнить два отчёта и найти замедления.")
+    compare_parser.add_argument("baseline", type=str, help="Базовый отчёт.")
+    compare_parser.add_argument("current", type=str, help="Текущий отчёт.")
+    compare_parser.add_argument("--threshold", type=float, default=0.1,
+                                help="Допустимый относительный рост времени стадии.")
+    compare_parser.add_argument("--memoryThreshold", type=float, default=None,
+                                help="Допустимый относительный рост пиковой памяти (по умолчанию — threshold).")
+    compare_parser.set_defaults(handler=compare)
+
+    args = parser.parse_args()
+    sys.exit(args.handler(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True)
+class BenchmarkCase:
+    """
+    Параметры одного замера бенчмарка.
+
+    Имя случая собирается из параметров и служит ключом при сравнении отчётов.
+    """
+
+    renderer_type: str
+    width: int
+    height: int
+    samples: int
+    iter_per_sample: int
+    symmetry: int
+    variations: tuple[str, ...]
+
+    @property
+    def name(self) -> str:
+        return (f"{self.renderer_type}/{self.width}x{self.height}/samples={self.samples}"
+                f"/iter={self.iter_per_sample}/symmetry={self.symmetry}/{'+'.join(self.variations)}")
+
+    @property
+    def points(self) -> int:
+        """
+        Возвращает количество точек, которые рендерер отображает на изображение (с учётом симметрии).
+        """
+        return self.samples * max(self.iter_per_sample - 1, 0) * self.symmetry
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "renderer_type": self.renderer_type,
+            "width": self.width,
+            "height": self.height,
+            "samples": self.samples,
+            "iter_per_sample": self.iter_per_sample,
+            "symmetry": self.symmetry,
+            "variations": list(self.variations),
+        }
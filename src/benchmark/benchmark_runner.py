@@ -0,0 +1,182 @@
+import os
+import platform
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable, Iterable
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any, Final, Optional
+
+import numpy as np
+
+from src.benchmark.benchmark_case import BenchmarkCase
+from src.model.rect import Rect
+from src.processor.log_gamma_correction_image_processor import LogGammaCorrectionImageProcessor
+from src.renderer.abstract_renderer import AbstractRenderer
+from src.renderer.multi_thread_renderer import MultiThreadRenderer
+from src.renderer.numpy_renderer import NumpyRenderer
+from src.renderer.process_renderer import ProcessRenderer
+from src.renderer.single_thread_renderer import SingleThreadRenderer
+from src.saver.fornat_image_saver import FormatImageSaver
+from src.ui.command_line_args import CommandLineArgs
+
+
+class BenchmarkRunner:
+    """
+    Класс BenchmarkRunner замеряет скорость стадий генерации фрактала.
+
+    Для каждого случая стадии рендеринга, обработки и сохранения замеряются
+    отдельно: время — лучшее из repeat запусков без трассировки памяти,
+    пиковая память — в отдельном запуске под tracemalloc, чтобы трассировка
+    не искажала время. Память дочерних процессов рендерера process
+    tracemalloc не видит.
+    """
+
+    STAGES: Final[tuple[str, ...]] = ("render", "process", "save")
+
+    RENDERERS: Final[dict[str, type[AbstractRenderer]]] = {
+        "simple": SingleThreadRenderer,
+        "multi": MultiThreadRenderer,
+        "numpy": NumpyRenderer,
+        "process": ProcessRenderer,
+    }
+
+    repeat: int
+    seed: int
+    world: Rect
+    steps: int
+    affine_count: int
+    gamma: float
+    image_format: str
+    measure_memory: bool
+
+    def __init__(self, repeat: int = 3, seed: int = 0, world: Optional[Rect] = None, steps: int = 20,
+                 affine_count: int = 5, gamma: float = 2.2, image_format: str = "png", *,
+                 measure_memory: bool = True) -> None:
+        """
+        Создает исполнителя бенчмарка.
+
+        :param repeat: Количество запусков каждого случая для замера времени.
+        :param seed: Зерно рендеринга, чтобы все запуски считали одно и то же изображение.
+        :param world: Прямоугольник мирового пространства (по умолчанию [-1, 1] x [-1, 1]).
+        :param steps: Шаги нормализации рендерера.
+        :param affine_count: Количество аффинных преобразований.
+        :param gamma: Параметр гамма-коррекции.
+        :param image_format: Формат сохранения изображения.
+        :param measure_memory: Замерять ли пиковую память стадий.
+        """
+        if repeat <= 0:
+            raise ValueError("Repeat count must be greater than 0.")
+        self.repeat = repeat
+        self.seed = seed
+        self.world = world or Rect(-1, -1, 2, 2)
+        self.steps = steps
+        self.affine_count = affine_count
+        self.gamma = gamma
+        self.image_format = image_format
+        self.measure_memory = measure_memory
+
+    def run(self, cases: Iterable[BenchmarkCase]) -> dict[str, Any]:
+        """
+        Выполняет все случаи и собирает отчёт.
+
+        :param cases: Случаи бенчмарка.
+        :return: Отчёт, пригодный для сохранения в JSON.
+        """
+        return {
+            "environment": self.environment(),
+            "settings": {
+                "repeat": self.repeat,
+                "seed": self.seed,
+                "steps": self.steps,
+                "affine_count": self.affine_count,
+                "gamma": self.gamma,
+                "image_format": self.image_format,
+            },
+            "cases": [self.run_case(case) for case in cases],
+        }
+
+    def run_case(self, case: BenchmarkCase) -> dict[str, Any]:
+        """
+        Замеряет один случай.
+
+        :param case: Случай бенчмарка.
+        :return: Результат случая: время и пиковая память стадий, скорость рендеринга.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / f"benchmark.{self.image_format}"
+            timings = [self._run_stages(case, path, self._time_stage) for _ in range(self.repeat)]
+            memory = self._run_stages(case, path, self._trace_stage) if self.measure_memory else {}
+
+        stages = {}
+        for stage in self.STAGES:
+            seconds = [timing[stage] for timing in timings]
+            stages[stage] = {
+                "seconds": min(seconds),
+                "mean_seconds": sum(seconds) / len(seconds),
+                "peak_memory_bytes": memory.get(stage),
+            }
+        render_seconds = stages["render"]["seconds"]
+        return {
+            "name": case.name,
+            "params": case.to_dict(),
+            "points": case.points,
+            "points_per_second": case.points / render_seconds if render_seconds > 0 else None,
+            "stages": stages,
+        }
+
+    def create_renderer(self, case: BenchmarkCase) -> AbstractRenderer:
+        """
+        Создает рендерер для случая.
+
+        :param case: Случай бенчмарка.
+        :return: Экземпляр рендерера.
+        """
+        renderer_class = self.RENDERERS.get(case.renderer_type)
+        if renderer_class is None:
+            message = f"Unknown renderer type: {case.renderer_type}"
+            raise ValueError(message)
+        variations = [CommandLineArgs.TRANSFORMATIONS[name]() for name in case.variations]
+        return renderer_class(self.steps, self.affine_count, case.samples, case.iter_per_sample, case.symmetry,
+                              variations, seed=self.seed)
+
+    @staticmethod
+    def environment() -> dict[str, Any]:
+        """
+        Возвращает описание окружения, в котором выполнялся бенчмарк.
+        """
+        return {
+            "created": datetime.now(tz=UTC).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+        }
+
+    def _run_stages(self, case: BenchmarkCase, path: Path,
+                    measure: Callable[[Callable[[], Any]], tuple[Any, float]]) -> dict[str, float]:
+        renderer = self.create_renderer(case)
+        processor = LogGammaCorrectionImageProcessor(self.gamma)
+        saver = FormatImageSaver(self.image_format)
+
+        image, render = measure(lambda: renderer.render(case.width, case.height, self.world))
+        _, process = measure(lambda: processor.processor(image))
+        _, save = measure(lambda: saver.save(image, path))
+        return {"render": render, "process": process, "save": save}
+
+    @staticmethod
+    def _time_stage(stage: Callable[[], Any]) -> tuple[Any, float]:
+        start = time.perf_counter()
+        result = stage()
+        return result, time.perf_counter() - start
+
+    @staticmethod
+    def _trace_stage(stage: Callable[[], Any]) -> tuple[Any, int]:
+        tracemalloc.start()
+        try:
+            result = stage()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        return result, peak
@@ -0,0 +1,83 @@
+from dataclasses import dataclass
+from typing import Any, Optional
+
+
+@dataclass(frozen=True)
+class Regression:
+    """
+    Замедление (или рост памяти) стадии случая по сравнению с базовым отчётом.
+    """
+
+    case: str
+    stage: str
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline
+
+    def __str__(self) -> str:
+        return (f"{self.case} [{self.stage}] {self.metric}: {self.baseline:.6g} -> {self.current:.6g} "
+                f"(x{self.ratio:.2f})")
+
+
+class ReportComparator:
+    """
+    Класс ReportComparator сравнивает два отчёта бенчмарка.
+
+    Случаи сопоставляются по имени. Стадия считается замедлившейся, если её
+    время выросло больше чем в (1 + threshold) раз; аналогично для пиковой
+    памяти с порогом memory_threshold. Случаи, которых нет в одном из
+    отчётов, не сравниваются.
+    """
+
+    threshold: float
+    memory_threshold: float
+
+    def __init__(self, threshold: float = 0.1, memory_threshold: Optional[float] = None) -> None:
+        """
+        Создает сравнение отчётов.
+
+        :param threshold: Допустимый относительный рост времени стадии (0.1 — на 10%).
+        :param memory_threshold: Допустимый относительный рост пиковой памяти (по умолчанию равен threshold).
+        """
+        if threshold < 0:
+            raise ValueError("Threshold must not be negative.")
+        self.threshold = threshold
+        self.memory_threshold = threshold if memory_threshold is None else memory_threshold
+
+    def compare(self, baseline: dict[str, Any], current: dict[str, Any]) -> list[Regression]:
+        """
+        Находит замедления в текущем отчёте относительно базового.
+
+        :param baseline: Базовый отчёт.
+        :param current: Текущий отчёт.
+        :return: Список замедлений (пустой, если их нет).
+        """
+        baseline_cases = {case["name"]: case for case in baseline["cases"]}
+        regressions = []
+        for case in current["cases"]:
+            baseline_case = baseline_cases.get(case["name"])
+            if baseline_case is None:
+                continue
+            for stage, result in case["stages"].items():
+                baseline_result = baseline_case["stages"].get(stage)
+                if baseline_result is None:
+                    continue
+                regressions.extend(self._check(case["name"], stage, "seconds", baseline_result, result,
+                                               self.threshold))
+                regressions.extend(self._check(case["name"], stage, "peak_memory_bytes", baseline_result, result,
+                                               self.memory_threshold))
+        return regressions
+
+    @staticmethod
+    def _check(case: str, stage: str, metric: str, baseline: dict[str, Any], current: dict[str, Any],
+               threshold: float) -> list[Regression]:
+        baseline_value, current_value = baseline.get(metric), current.get(metric)
+        if not baseline_value or current_value is None:
+            return []
+        if current_value > baseline_value * (1 + threshold):
+            return [Regression(case, stage, metric, baseline_value, current_value)]
+        return []
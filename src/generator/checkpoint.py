@@ -0,0 +1,169 @@
+import json
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, ClassVar
+
+import numpy as np
+
+from src.model.affine_coef import AffineCoefficient
+from src.model.color import Color
+from src.model.fractal_image import FractalImage
+from src.model.precision import get_precision
+from src.model.rect import Rect
+from src.renderer.abstract_renderer import AbstractRenderer
+from src.transforms.affine_transformation import AffineTransformation
+from src.utils.random_utils import RandomStreams
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Checkpoint:
+    """
+    Состояние прерываемого рендеринга.
+
+    Хранит накопленные попадания и суммы цветов, аффинные преобразования, энтропию
+    потоков случайных чисел и количество отрендеренных сэмплов. Поток
+    случайных чисел сэмпла определяется энтропией и индексом сэмпла, поэтому
+    этого достаточно, чтобы продолжить рендеринг с сэмпла samples_done так,
+    будто он не прерывался. Параметры рендерера, влияющие на накопленное
+    изображение, сохраняются для проверки совместимости при продолжении.
+    """
+
+    FORMAT_VERSION: ClassVar[int] = 2
+    COEFFICIENTS: ClassVar[tuple[str, ...]] = ("a", "b", "c", "d", "e", "f")
+
+    image: FractalImage
+    world: Rect
+    affine_transformations: list[AffineTransformation]
+    entropy: int
+    samples_done: int
+    settings: dict[str, Any]
+
+    @classmethod
+    def start(cls, renderer: AbstractRenderer, width: int, height: int, world: Rect) -> "Checkpoint":
+        """
+        Создает состояние нового рендеринга: пустое изображение и аффинные преобразования из зерна рендерера.
+
+        :param renderer: Рендерер.
+        :param width: Ширина изображения.
+        :param height: Высота изображения.
+        :param world: Прямоугольник мирового пространства.
+        :return: Состояние без отрендеренных сэмплов.
+        """
+        streams = RandomStreams(renderer.seed)
+        logger.info("Seed: %d", streams.entropy)
+        affine_transformations = renderer.generate_affine_transformations(streams.affine_random())
+        image = FractalImage.create(width, height, channels=renderer.color_mode.channels)
+        return cls(image, world, affine_transformations, streams.entropy, 0,
+                   cls.renderer_settings(renderer))
+
+    @staticmethod
+    def renderer_settings(renderer: AbstractRenderer) -> dict[str, Any]:
+        """
+        Возвращает параметры рендерера, которые должны совпадать при продолжении рендеринга.
+
+        Кроме параметров итераций сохраняются потоки случайных чисел рендерера
+        (см. AbstractRenderer.stream_settings) и режим точности: с другими
+        потоками продолжение смешало бы в изображении несовместимые траектории.
+
+        :param renderer: Рендерер.
+        :return: Словарь параметров.
+        """
+        return {
+            "steps_for_normalization": renderer.steps_for_normalization,
+            "iter_per_sample": renderer.iter_per_sample,
+            "symmetry": renderer.symmetry,
+            "variations": [type(variation).__name__ for variation in renderer.variations],
+            "weights": renderer.weights.to_dict(),
+            "color_mode": renderer.color_mode.value,
+            "precision": get_precision().value,
+            **renderer.stream_settings(),
+        }
+
+    @property
+    def streams(self) -> RandomStreams:
+        """
+        Возвращает потоки случайных чисел рендеринга.
+        """
+        return RandomStreams(self.entropy)
+
+    def check_compatible(self, renderer: AbstractRenderer, width: int, height: int, world: Rect) -> None:
+        """
+        Проверяет, что рендеринг можно продолжить с данными параметрами.
+
+        :param renderer: Рендерер.
+        :param width: Ширина изображения.
+        :param height: Высота изображения.
+        :param world: Прямоугольник мирового пространства.
+        :raises ValueError: Если параметры не совпадают с параметрами сохранённого рендеринга.
+        """
+        if (self.image.width, self.image.height) != (width, height):
+            message = f"Checkpoint image is {self.image.width}x{self.image.height}, requested {width}x{height}"
+            raise ValueError(message)
+        if self._rect_values(self.world) != self._rect_values(world):
+            message = f"Checkpoint world {self._rect_values(self.world)} differs from {self._rect_values(world)}"
+            raise ValueError(message)
+        settings = self.renderer_settings(renderer)
+        if settings != self.settings:
+            message = f"Checkpoint renderer settings {self.settings} differ from {settings}"
+            raise ValueError(message)
+
+    def save(self, path: Path) -> None:
+        """
+        Сохраняет состояние в сжатый файл .npz.
+
+        Файл перезаписывается атомарно: состояние пишется во временный файл,
+        который затем заменяет прежний.
+
+        :param path: Путь файла.
+        """
+        coefficients = np.array([[float(getattr(transformation.affine_coef, name)) for name in self.COEFFICIENTS]
+                                 for transformation in self.affine_transformations], dtype=np.float64)
+        colors = np.array([[transformation.affine_coef.color.r, transformation.affine_coef.color.g,
+                            transformation.affine_coef.color.b]
+                           for transformation in self.affine_transformations], dtype=np.uint8)
+        temporary_path = path.with_name(f"{path.name}.tmp")
+        with temporary_path.open("wb") as file:
+            np.savez_compressed(
+                file,
+                version=np.array(self.FORMAT_VERSION),
+                hits=self.image.hits,
+                sums=self.image.sums,
+                coefficients=coefficients.reshape(-1, len(self.COEFFICIENTS)),
+                colors=colors.reshape(-1, 3),
+                # Энтропия SeedSequence может не помещаться в int64, поэтому хранится строкой
+                entropy=np.array(str(self.entropy)),
+                samples_done=np.array(self.samples_done, dtype=np.int64),
+                world=np.array(self._rect_values(self.world), dtype=np.float64),
+                settings=np.array(json.dumps(self.settings)),
+            )
+        temporary_path.replace(path)
+
+    @classmethod
+    def load(cls, path: Path) -> "Checkpoint":
+        """
+        Загружает состояние из файла.
+
+        :param path: Путь файла.
+        :return: Состояние рендеринга.
+        """
+        with np.load(path, allow_pickle=False) as data:
+            version = int(data["version"])
+            if version != cls.FORMAT_VERSION:
+                message = f"Unsupported checkpoint version: {version}"
+                raise ValueError(message)
+            hits = data["hits"].astype(FractalImage.HITS_DTYPE)
+            image = FractalImage(hits, data["sums"], np.zeros(hits.shape, dtype=np.float64))
+            affine_transformations = [
+                AffineTransformation(AffineCoefficient(dict(zip(cls.COEFFICIENTS, row.tolist(), strict=True)),
+                                                       Color(*color.tolist())))
+                for row, color in zip(data["coefficients"], data["colors"], strict=True)
+            ]
+            return cls(image, Rect(*data["world"].tolist()), affine_transformations, int(str(data["entropy"])),
+                       int(data["samples_done"]), json.loads(str(data["settings"])))
+
+    @staticmethod
+    def _rect_values(rect: Rect) -> tuple[float, float, float, float]:
+        return float(rect.x), float(rect.y), float(rect.width), float(rect.height)
@@ -0,0 +1,54 @@
+import logging
+from pathlib import Path
+from typing import Optional
+
+from src.generator.checkpoint import Checkpoint
+from src.generator.pass_schedule import PassSchedule
+from src.model.fractal_image import FractalImage
+
+logger = logging.getLogger(__name__)
+
+
+class CheckpointWriter:
+    """
+    Класс CheckpointWriter периодически сохраняет состояние рендеринга.
+
+    Вызывается после каждого прохода рендерера и сохраняет состояние по
+    расписанию, а после последнего прохода — всегда, чтобы к завершённому
+    рендерингу можно было позже добавить сэмплы.
+    """
+
+    checkpoint: Checkpoint
+    path: Path
+    schedule: PassSchedule
+
+    def __init__(self, checkpoint: Checkpoint, path: Path,
+                 every_passes: Optional[int] = None, every_seconds: Optional[float] = None) -> None:
+        """
+        Создает запись состояния.
+
+        :param checkpoint: Состояние, изображение которого накапливает рендерер.
+        :param path: Путь файла состояния.
+        :param every_passes: Сохранять состояние каждые every_passes проходов.
+        :param every_seconds: Сохранять состояние, если с предыдущего сохранения прошло не меньше every_seconds секунд.
+        """
+        self.checkpoint = checkpoint
+        self.path = path
+        self.schedule = PassSchedule(every_passes, every_seconds)
+
+    def __call__(self, image: FractalImage, done: int, passes: int, samples_done: int) -> None:
+        """
+        Сохраняет состояние, если пора.
+
+        :param image: Накопленное изображение.
+        :param done: Номер завершённого прохода (с единицы).
+        :param passes: Общее количество проходов.
+        :param samples_done: Количество накопленных сэмплов.
+        """
+        self.checkpoint.samples_done = samples_done
+        if done < passes and not self.schedule.is_due(done):
+            return
+        self.checkpoint.image = image
+        self.checkpoint.save(self.path)
+        self.schedule.mark(done)
+        logger.info("Checkpoint (%d samples) saved to %s", samples_done, self.path)
@@ -0,0 +1,99 @@
+import logging
+import time
+from typing import Final, Optional
+
+import numpy as np
+
+from src.model.fractal_image import FractalImage
+
+logger = logging.getLogger(__name__)
+
+
+class ConvergenceMonitor:
+    """
+    Класс ConvergenceMonitor останавливает рендеринг, когда изображение перестаёт меняться.
+
+    Вызывается после каждого прохода рендерера как условие остановки. Мерой
+    изменения служит средняя абсолютная разность нормированной
+    логарифмической плотности log(1 + hits) / max по закрашенным пикселям
+    между соседними проходами: именно она определяет яркость после
+    логарифмической тональной коррекции. Рендеринг останавливается, когда
+    изменение меньше target или когда истёк бюджет времени seconds.
+    """
+
+    # Изменение измеряется между проходами, поэтому проходов нужно хотя бы два
+    MIN_PASSES: Final[int] = 2
+
+    target: Optional[float]
+    seconds: Optional[float]
+    change: Optional[float]
+    samples_done: int
+    converged: bool
+
+    def __init__(self, target: Optional[float] = None, seconds: Optional[float] = None) -> None:
+        """
+        Создает условие остановки; отсчёт бюджета времени начинается с создания.
+
+        :param target: Изменение между проходами, при котором изображение считается сошедшимся.
+        :param seconds: Бюджет времени рендеринга в секундах.
+        """
+        if target is None and seconds is None:
+            raise ValueError("Convergence needs a target change or a time budget.")
+        if target is not None and target <= 0:
+            raise ValueError("Convergence target must be greater than 0.")
+        if seconds is not None and seconds <= 0:
+            raise ValueError("Time budget must be greater than 0.")
+        self.target = target
+        self.seconds = seconds
+        self.change = None
+        self.samples_done = 0
+        self.converged = False
+        self._previous: Optional[np.ndarray] = None
+        self._start = time.monotonic()
+
+    def __call__(self, image: FractalImage, samples_done: int) -> bool:
+        """
+        Сравнивает изображение с предыдущим проходом.
+
+        :param image: Накопленное изображение.
+        :param samples_done: Количество накопленных сэмплов.
+        :return: True, если рендеринг пора остановить.
+        """
+        self.samples_done = samples_done
+        density = self.density(image)
+        if self._previous is not None:
+            hit = image.hits > 0
+            self.change = float(np.abs(density[hit] - self._previous[hit]).mean()) if hit.any() else 0.0
+            logger.debug("Convergence change after %d samples: %.6f", samples_done, self.change)
+        self._previous = density
+        self.converged = self.target is not None and self.change is not None and self.change < self.target
+        return self.converged or (self.seconds is not None and time.monotonic() - self._start >= self.seconds)
+
+    @staticmethod
+    def density(image: FractalImage) -> np.ndarray:
+        """
+        Возвращает нормированную логарифмическую плотность попаданий.
+
+        :param image: Изображение.
+        :return: Массив float32 значений от 0 до 1 формы (height, width).
+        """
+        density = np.log1p(image.hits, dtype=np.float32)
+        peak = density.max(initial=0.0)
+        if peak > 0:
+            density /= peak
+        return density
+
+    def report(self, samples: int) -> None:
+        """
+        Записывает в лог, сколько сэмплов понадобилось.
+
+        :param samples: Запрошенное количество сэмплов.
+        """
+        if self.converged:
+            reason = "converged"
+        elif self.samples_done < samples:
+            reason = "time budget exhausted"
+        else:
+            reason = "sample budget exhausted"
+        change = "n/a" if self.change is None else f"{self.change:.6f}"
+        logger.info("Convergence: %s after %d of %d samples (change %s)", reason, self.samples_done, samples, change)
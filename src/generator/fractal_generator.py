@@ -1,14 +1,31 @@
+import cProfile
+import dataclasses
 import logging
 import time
+from concurrent.futures import Executor
 from pathlib import Path
+from typing import Any, Optional
 
+from src.generator.checkpoint import Checkpoint
+from src.generator.checkpoint_writer import CheckpointWriter
+from src.generator.convergence_monitor import ConvergenceMonitor
+from src.generator.preview_writer import PreviewWriter
+from src.generator.render_cache import RenderCache
+from src.generator.tiled_generator import TiledGenerator
 from src.model.fractal_image import FractalImage
+from src.model.precision import set_precision
 from src.model.rect import Rect
 from src.processor.image_processor import ImageProcessor
 from src.processor.log_gamma_correction_image_processor import LogGammaCorrectionImageProcessor
-from src.renderer.abstract_renderer import AbstractRenderer
+from src.processor.supersampling_kernel import SupersamplingKernel
+from src.processor.timed_image_processor import TimedImageProcessor
+from src.renderer.abstract_renderer import AbstractRenderer, PassCallback, StopCondition
+from src.saver.encoder_options import EncoderOptions
 from src.saver.fornat_image_saver import FormatImageSaver
+from src.saver.image_format import ImageFormat
 from src.ui.command_line_args import CommandLineArgs
+from src.utils.random_utils import RandomStreams
+from src.utils.render_metrics import RenderMetrics
 
 logger = logging.getLogger(__name__)
 
@@ -19,43 +36,363 @@ class FractalGenerator:
 
     MILLI_TO_SEC = 1000
 
+    executor: Optional[Executor]
+
+    def __init__(self, executor: Optional[Executor] = None) -> None:
+        """
+        Создает генератор.
+
+        :param executor: Общий пул процессов для рендерера process (по умолчанию пул создаётся на каждый рендеринг).
+        """
+        self.executor = executor
+
     def run(self, config: CommandLineArgs) -> None:
         """
         Запускает процесс генерации и сохранения фрактального изображения.
 
+        Ошибки генерации записываются в лог.
+
         :param config: Объект Config для получения параметров конфигурации.
         """
         try:
-            logger.info("Fractal image generating...")
+            self.execute(config)
+        except Exception:
+            logger.exception("Error during fractal generation")
+
+    def execute(self, config: CommandLineArgs) -> None:
+        """
+        Генерирует и сохраняет фрактальное изображение.
+
+        С --metrics.path время этапов и счётчики рендеринга сохраняются в
+        JSON-отчёт, с --profile весь запуск выполняется под cProfile, а
+        статистика сохраняется в файл для pstats. Метрики собираются отдельно
+        для каждого вызова: пакетный режим выполняет задания на одном
+        генераторе одновременно.
+
+        :param config: Объект Config для получения параметров конфигурации.
+        :raises Exception: Если генерация или сохранение завершились ошибкой.
+        """
+        started = time.perf_counter()
+        metrics_path = config.get("metrics.path")
+        metrics = RenderMetrics() if metrics_path else None
+        profile_path = config.get("profile")
+        if profile_path:
+            profiler = cProfile.Profile()
+            try:
+                profiler.runcall(self.generate_image, config, metrics)
+            finally:
+                profiler.dump_stats(profile_path)
+                logger.info("Profile saved to %s", profile_path)
+        else:
+            self.generate_image(config, metrics)
+        if metrics is not None:
+            metrics.write(Path(metrics_path), time.perf_counter() - started)
+            logger.info("Metrics saved to %s", metrics_path)
+
+    def create_renderer(self, config: CommandLineArgs, metrics: Optional[RenderMetrics] = None) -> AbstractRenderer:
+        """
+        Создает рендерер по параметрам и подключает к нему метрики.
 
-            start_time = time.time()
+        :param config: Объект Config для получения параметров конфигурации.
+        :param metrics: Метрики запуска или None.
+        :return: Рендерер.
+        """
+        renderer = config.get_renderer(self.executor)
+        renderer.metrics = metrics
+        return renderer
+
+    @staticmethod
+    def create_processor(config: CommandLineArgs, metrics: Optional[RenderMetrics] = None) -> ImageProcessor:
+        """
+        Создает цепочку процессоров; если собираются метрики, её время добавляется к этапу tone_mapping.
+
+        :param config: Объект Config для получения параметров конфигурации.
+        :param metrics: Метрики запуска или None.
+        :return: Процессор изображения.
+        """
+        processor = config.get_processor()
+        return processor if metrics is None else TimedImageProcessor(processor, metrics)
+
+    def generate_image(self, config: CommandLineArgs, metrics: Optional[RenderMetrics] = None) -> None:
+        """
+        Генерирует и сохраняет фрактальное изображение без профилирования и записи метрик.
 
+        :param config: Объект Config для получения параметров конфигурации.
+        :param metrics: Метрики запуска, в которые добавляется время этапов, или None.
+        """
+        logger.info("Fractal image generating...")
+        set_precision(config.get_precision())
+
+        path = Path(f"{config.get('saver.path')}.{config.get('saver.format')}")
+        if config.get("tile.size") is not None:
+            self.run_tiled(config, path, metrics)
+            return
+        processor = self.create_processor(config, metrics)
+        # При суперсэмплинге рендерер накапливает попадания в увеличенном изображении
+        factor = config.get_int("processor.supersample")
+        passes = config.get_int("progressive.passes")
+        callbacks: list[PassCallback] = []
+        if passes > 1:
+            callbacks.append(PreviewWriter(
+                processor,
+                FormatImageSaver(config.get("saver.format"), EncoderOptions.fast()),
+                path.with_name(f"{path.stem}.preview{path.suffix}"),
+                config.get("progressive.previewPasses"),
+                config.get("progressive.previewSeconds"),
+            ))
+
+        start_time = time.time()
+        convergence = self.create_convergence(config)
+        if convergence is not None:
+            passes = config.get_int("convergence.passes")
+
+        checkpoint_path = config.get("checkpoint.path")
+        mmap_dir = config.get("mmap.dir")
+        if checkpoint_path is None:
+            if config.get("resume"):
+                raise ValueError("--resume requires --checkpoint.path")
+            cache = self.create_cache(config)
+            if cache is not None:
+                self.generate_cached(config, cache, processor, path, passes, self._chain(callbacks), convergence,
+                                     metrics)
+                logger.info("Time: %.2f sec", (time.time() - start_time))
+                return
             image = self.generate(
-                config.get_int("image.height"),
-                config.get_int("image.width"),
+                config.get_int("image.height") * factor,
+                config.get_int("image.width") * factor,
+                config.get_rect(),
+                self.create_renderer(config, metrics),
+                processor,
+                passes,
+                self._chain(callbacks),
+                Path(mmap_dir) if mmap_dir else None,
+                convergence,
+            )
+        else:
+            if mmap_dir:
+                raise ValueError("Memory-mapped accumulators do not support checkpoints.")
+            image = self.generate_resumable(
+                config.get_int("image.height") * factor,
+                config.get_int("image.width") * factor,
                 config.get_rect(),
-                config.get_renderer(),
-                LogGammaCorrectionImageProcessor(config.get_float("processor.gamma"))
+                self.create_renderer(config, metrics),
+                processor,
+                Path(checkpoint_path),
+                resume=bool(config.get("resume")),
+                passes=passes,
+                callbacks=callbacks,
+                every_passes=config.get("checkpoint.everyPasses"),
+                every_seconds=config.get("checkpoint.everySeconds"),
+                until=convergence,
             )
 
-            end_time = time.time()
+        end_time = time.time()
+        if convergence is not None:
+            convergence.report(config.get_int("samples"))
+
+        logger.info("Fractal image generated successfully.")
+        logger.info("Time: %.2f sec", (end_time - start_time))
+
+
+        saver = FormatImageSaver(config.get("saver.format"), config.get_encoder_options(), metrics)
+        saver.save(image, path)
+        image.flush()
+
+        logger.info("Fractal image saved successfully.")
+
+    @staticmethod
+    def create_convergence(config: CommandLineArgs) -> Optional[ConvergenceMonitor]:
+        """
+        Создает условие остановки по сходимости, если задана цель или бюджет времени.
+
+        :param config: Объект Config для получения параметров конфигурации.
+        :return: Условие остановки или None.
+        """
+        target = config.get("convergence.target")
+        seconds = config.get("convergence.seconds")
+        if target is None and seconds is None:
+            return None
+        if config.get_int("convergence.passes") < ConvergenceMonitor.MIN_PASSES:
+            message = f"Convergence needs at least {ConvergenceMonitor.MIN_PASSES} passes."
+            raise ValueError(message)
+        return ConvergenceMonitor(target, seconds)
+
+    def create_cache(self, config: CommandLineArgs) -> Optional[RenderCache]:
+        """
+        Создает кэш результатов рендеринга, если он задан и применим к параметрам.
+
+        Рендеринг без зерна не кэшируется: повторный запрос без зерна должен
+        дать новое изображение. Отображённые в память массивы не кэшируются.
+        Рендеринг с бюджетом времени не кэшируется: его результат зависит от
+        скорости машины.
+
+        :param config: Объект Config для получения параметров конфигурации.
+        :return: Кэш или None.
+        """
+        cache_dir = config.get("cache.dir")
+        if not cache_dir:
+            return None
+        if config.get("seed") is None:
+            logger.info("Render cache skipped: render has no seed")
+            return None
+        if config.get("mmap.dir"):
+            logger.info("Render cache skipped: memory-mapped accumulators are not cached")
+            return None
+        if config.get("convergence.seconds") is not None:
+            logger.info("Render cache skipped: render has a time budget")
+            return None
+        return RenderCache(Path(cache_dir), config.get_int("cache.maxBytes"))
+
+    def generate_cached(self, config: CommandLineArgs, cache: RenderCache, processor: ImageProcessor, path: Path,
+                        passes: int = 1, on_pass: Optional[PassCallback] = None,
+                        convergence: Optional[ConvergenceMonitor] = None,
+                        metrics: Optional[RenderMetrics] = None) -> None:
+        """
+        Генерирует и сохраняет изображение, используя кэш результатов рендеринга.
+
+        Если в кэше есть файл с теми же параметрами рендеринга, обработки и
+        сохранения, он копируется в path. Иначе, если в кэше есть
+        накопленное изображение с теми же параметрами рендеринга, оно только
+        обрабатывается и сохраняется. Иначе изображение рендерится, и в кэш
+        попадают и накопленное изображение, и файл. Отчёт о сходимости
+        пишется только после нового рендеринга.
 
+        :param config: Объект Config для получения параметров конфигурации.
+        :param cache: Кэш результатов рендеринга.
+        :param processor: Объект ImageProcessor для обработки изображения.
+        :param path: Путь итогового файла.
+        :param passes: Количество проходов рендеринга.
+        :param on_pass: Функция, вызываемая после каждого прохода.
+        :param convergence: Монитор сходимости, останавливающий рендеринг, или None.
+        :param metrics: Метрики запуска или None.
+        """
+        renderer = self.create_renderer(config, metrics)
+        render_key = cache.key(self.render_spec(config, renderer))
+        output_key = cache.key(self.output_spec(config, render_key))
+        if cache.load_output(output_key, path):
+            logger.info("Fractal image served from render cache.")
+            return
+
+        image = cache.load_image(render_key)
+        if image is None:
+            factor = config.get_int("processor.supersample")
+            image = renderer.render(config.get_int("image.height") * factor, config.get_int("image.width") * factor,
+                                    config.get_rect(), passes, on_pass, until=convergence)
+            cache.store_image(render_key, image)
+            if convergence is not None:
+                convergence.report(config.get_int("samples"))
             logger.info("Fractal image generated successfully.")
-            logger.info("Time: %.2f sec", (end_time - start_time))
+        else:
+            logger.info("Fractal histogram loaded from render cache.")
+        processor.processor(image)
 
+        saver = FormatImageSaver(config.get("saver.format"), config.get_encoder_options(), metrics)
+        saver.save(image, path)
+        cache.store_output(output_key, path)
+        logger.info("Fractal image saved successfully.")
 
-            saver = FormatImageSaver(config.get("saver.format"))
-            saver.save(
-                image,
-                Path(f"{config.get('saver.path')}.{config.get('saver.format')}")
-            )
+    @staticmethod
+    def render_spec(config: CommandLineArgs, renderer: AbstractRenderer) -> dict[str, Any]:
+        """
+        Возвращает параметры, от которых зависит накопленное изображение.
+
+        Аффинные преобразования выводятся из зерна так же, как при рендеринге,
+        и входят в параметры явно.
+
+        :param config: Объект Config для получения параметров конфигурации.
+        :param renderer: Рендерер.
+        :return: Параметры, сериализуемые в JSON.
+        """
+        streams = RandomStreams(renderer.seed)
+        affine_transformations = renderer.generate_affine_transformations(streams.affine_random())
+        world = config.get_rect()
+        return {
+            "renderer": config.get("renderer.type"),
+            "batch_size": getattr(renderer, "batch_size", None),
+            "width": config.get_int("image.width"),
+            "height": config.get_int("image.height"),
+            "supersample": config.get_int("processor.supersample"),
+            "world": [float(world.x), float(world.y), float(world.width), float(world.height)],
+            "precision": config.get_precision().value,
+            "entropy": str(streams.entropy),
+            "samples": renderer.samples,
+            "affines": [[*(float(getattr(transformation.affine_coef, name)) for name in Checkpoint.COEFFICIENTS),
+                         transformation.affine_coef.color.r, transformation.affine_coef.color.g,
+                         transformation.affine_coef.color.b]
+                        for transformation in affine_transformations],
+            **Checkpoint.renderer_settings(renderer),
+            **FractalGenerator.convergence_spec(config),
+        }
+
+    @staticmethod
+    def convergence_spec(config: CommandLineArgs) -> dict[str, Any]:
+        """
+        Возвращает параметры остановки по сходимости, от которых зависит накопленное изображение.
+
+        :param config: Объект Config для получения параметров конфигурации.
+        :return: Пустой словарь без остановки по сходимости, иначе цель и количество проходов.
+        """
+        target = config.get("convergence.target")
+        if target is None:
+            return {}
+        return {"convergence": {"target": float(target), "passes": config.get_int("convergence.passes")}}
+
+    @staticmethod
+    def output_spec(config: CommandLineArgs, render_key: str) -> dict[str, Any]:
+        """
+        Возвращает параметры, от которых зависит итоговый файл: накопленное изображение, обработка и сохранение.
+
+        :param config: Объект Config для получения параметров конфигурации.
+        :param render_key: Хеш параметров рендеринга.
+        :return: Параметры, сериализуемые в JSON.
+        """
+        processing = ("processor.gamma", "processor.supersample", "processor.supersampleKernel",
+                      "processor.densityRadius", "processor.densityCurve", "processor.densityMinRadius",
+                      "palette.name", "palette.size")
+        return {
+            "render": render_key,
+            "processing": {name: config.get(name) for name in processing},
+            "format": ImageFormat.parse(config.get("saver.format")).value,
+            "encoder": dataclasses.asdict(config.get_encoder_options()),
+        }
+
+    def run_tiled(self, config: CommandLineArgs, path: Path, metrics: Optional[RenderMetrics] = None) -> None:
+        """
+        Генерирует изображение по тайлам и сшивает его в PNG.
+
+        :param config: Объект Config для получения параметров конфигурации.
+        :param path: Путь итогового файла.
+        :param metrics: Метрики запуска или None.
+        """
+        if ImageFormat.parse(config.get("saver.format")) is not ImageFormat.png:
+            raise ValueError("Tiled rendering supports only png output.")
+        if config.get("checkpoint.path") is not None or config.get_int("progressive.passes") > 1 \
+                or config.get("mmap.dir") or self.create_convergence(config) is not None:
+            raise ValueError("Tiled rendering does not support checkpoints, progressive passes, convergence and mmap.")
+        if config.get_int("processor.supersample") != 1 or config.get_float("processor.densityRadius") > 0 \
+                or config.get("processor.supersampleKernel") != SupersamplingKernel.box.value:
+            raise ValueError("Tiled rendering does not support supersampling and density estimation.")
+        processor = LogGammaCorrectionImageProcessor(config.get_float("processor.gamma"), palette=config.get_palette())
+        tile_dir = config.get("tile.dir")
+        generator = TiledGenerator(self.create_renderer(config, metrics), processor, config.get_int("tile.size"),
+                                   Path(tile_dir) if tile_dir else None)
+
+        start_time = time.time()
+        generator.generate(
+            config.get_int("image.height"),
+            config.get_int("image.width"),
+            config.get_rect(),
+            path,
+            config.get_encoder_options().png_compress_level,
+        )
+        logger.info("Fractal image generated and saved successfully.")
+        logger.info("Time: %.2f sec", (time.time() - start_time))
 
-            logger.info("Fractal image saved successfully.")
-        except Exception:
-            logger.exception("Error during fractal generation")
     @staticmethod
     def generate(width: int, height: int, area: Rect, renderer: AbstractRenderer,
-                 processor: ImageProcessor) -> FractalImage:
+                 processor: ImageProcessor, passes: int = 1,
+                 on_pass: Optional[PassCallback] = None, directory: Optional[Path] = None,
+                 until: Optional[StopCondition] = None) -> FractalImage:
         """
         Генерирует фрактальное изображение.
 
@@ -64,8 +401,70 @@ class FractalGenerator:
         :param area: Область для рендеринга.
         :param renderer: Объект Renderer для рендеринга изображения.
         :param processor: Объект ImageProcessor для обработки изображения.
+        :param passes: Количество проходов рендеринга.
+        :param on_pass: Функция, вызываемая после каждого прохода (например, запись превью).
+        :param directory: Каталог для отображённых в память массивов изображения.
+        :param until: Условие досрочной остановки, проверяемое после каждого прохода.
         :return: Объект FractalImage.
         """
-        image = renderer.render(width, height, area)
+        image = renderer.render(width, height, area, passes, on_pass, directory, until)
         processor.processor(image)
         return image
+
+    @classmethod
+    def generate_resumable(cls, width: int, height: int, area: Rect, renderer: AbstractRenderer,
+                           processor: ImageProcessor, checkpoint_path: Path, *, resume: bool = False,
+                           passes: int = 1, callbacks: Optional[list[PassCallback]] = None,
+                           every_passes: Optional[int] = None,
+                           every_seconds: Optional[float] = None,
+                           until: Optional[StopCondition] = None) -> FractalImage:
+        """
+        Генерирует фрактальное изображение, сохраняя состояние рендеринга в файл.
+
+        При resume рендеринг продолжается из файла состояния с первого
+        неотрендеренного сэмпла до renderer.samples, поэтому увеличенное число
+        сэмплов добавляет к прежнему изображению только недостающие.
+
+        :param width: Ширина изображения.
+        :param height: Высота изображения.
+        :param area: Область для рендеринга.
+        :param renderer: Объект Renderer для рендеринга изображения.
+        :param processor: Объект ImageProcessor для обработки изображения.
+        :param checkpoint_path: Путь файла состояния.
+        :param resume: Продолжить рендеринг из файла состояния.
+        :param passes: Количество проходов рендеринга.
+        :param callbacks: Дополнительные функции, вызываемые после каждого прохода.
+        :param every_passes: Сохранять состояние каждые every_passes проходов.
+        :param every_seconds: Сохранять состояние не реже чем раз в every_seconds секунд.
+        :param until: Условие досрочной остановки, проверяемое после каждого прохода.
+        :return: Объект FractalImage.
+        """
+        if resume:
+            checkpoint = Checkpoint.load(checkpoint_path)
+            checkpoint.check_compatible(renderer, width, height, area)
+            logger.info("Resuming from %s: %d of %d samples done", checkpoint_path, checkpoint.samples_done,
+                        renderer.samples)
+        else:
+            checkpoint = Checkpoint.start(renderer, width, height, area)
+        writer = CheckpointWriter(checkpoint, checkpoint_path, every_passes, every_seconds)
+        renderer.render_image(checkpoint.image, area, checkpoint.affine_transformations, checkpoint.streams,
+                              passes, cls._chain([*(callbacks or []), writer]), checkpoint.samples_done, until)
+        processor.processor(checkpoint.image)
+        return checkpoint.image
+
+    @staticmethod
+    def _chain(callbacks: list[PassCallback]) -> Optional[PassCallback]:
+        """
+        Объединяет функции, вызываемые после прохода, в одну.
+
+        :param callbacks: Список функций.
+        :return: Функция, вызывающая все функции по порядку, или None, если список пуст.
+        """
+        if not callbacks:
+            return None
+
+        def on_pass(image: FractalImage, done: int, passes: int, samples_done: int) -> None:
+            for callback in callbacks:
+                callback(image, done, passes, samples_done)
+
+        return on_pass
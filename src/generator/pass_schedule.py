@@ -0,0 +1,53 @@
+import time
+from typing import Optional
+
+
+class PassSchedule:
+    """
+    Расписание действий между проходами рендеринга.
+
+    Действие выполняется каждые every_passes проходов или если с предыдущего
+    выполнения прошло не меньше every_seconds секунд; если не задано ни то,
+    ни другое — после каждого прохода.
+    """
+
+    every_passes: Optional[int]
+    every_seconds: Optional[float]
+
+    def __init__(self, every_passes: Optional[int] = None, every_seconds: Optional[float] = None) -> None:
+        """
+        Создает расписание.
+
+        :param every_passes: Интервал в проходах.
+        :param every_seconds: Интервал в секундах.
+        """
+        if every_passes is not None and every_passes <= 0:
+            raise ValueError("Pass interval must be greater than 0.")
+        if every_seconds is not None and every_seconds <= 0:
+            raise ValueError("Time interval must be greater than 0.")
+        self.every_passes = every_passes
+        self.every_seconds = every_seconds
+        self._last_pass = 0
+        self._last_time = time.monotonic()
+
+    def is_due(self, done: int) -> bool:
+        """
+        Проверяет, пора ли выполнить действие после прохода.
+
+        :param done: Номер завершённого прохода (с единицы).
+        :return: True, если действие нужно выполнить.
+        """
+        if self.every_passes is None and self.every_seconds is None:
+            return True
+        if self.every_passes is not None and done - self._last_pass >= self.every_passes:
+            return True
+        return self.every_seconds is not None and time.monotonic() - self._last_time >= self.every_seconds
+
+    def mark(self, done: int) -> None:
+        """
+        Отмечает, что действие выполнено после прохода done.
+
+        :param done: Номер завершённого прохода.
+        """
+        self._last_pass = done
+        self._last_time = time.monotonic()
@@ -0,0 +1,67 @@
+import logging
+from pathlib import Path
+from typing import Optional
+
+from src.generator.pass_schedule import PassSchedule
+from src.model.fractal_image import FractalImage
+from src.processor.image_processor import ImageProcessor
+from src.saver.image_saver import ImageSaver
+
+logger = logging.getLogger(__name__)
+
+
+class PreviewWriter:
+    """
+    Класс PreviewWriter сохраняет промежуточные превью прогрессивного рендеринга.
+
+    Вызывается после каждого прохода рендерера и сохраняет превью каждые
+    every_passes проходов или, если с предыдущего превью прошло не меньше
+    every_seconds секунд; если не задано ни то, ни другое — после каждого
+    прохода. Превью строится по копии изображения, поэтому
+    процессор не портит накопленные попадания, а его стоимость зависит только
+    от размера изображения. Последний проход пропускается: итоговое
+    изображение сохраняется отдельно с полным качеством.
+    """
+
+    processor: ImageProcessor
+    saver: ImageSaver
+    path: Path
+    schedule: PassSchedule
+    saved: int
+
+    def __init__(self, processor: ImageProcessor, saver: ImageSaver, path: Path,
+                 every_passes: Optional[int] = None, every_seconds: Optional[float] = None) -> None:
+        """
+        Создает запись превью.
+
+        :param processor: Процессор, применяемый к копии изображения.
+        :param saver: Сохранение превью (обычно с быстрыми параметрами кодирования).
+        :param path: Путь файла превью; файл перезаписывается атомарно.
+        :param every_passes: Сохранять превью каждые every_passes проходов.
+        :param every_seconds: Сохранять превью, если с предыдущего прошло не меньше every_seconds секунд.
+        """
+        self.processor = processor
+        self.saver = saver
+        self.path = path
+        self.schedule = PassSchedule(every_passes, every_seconds)
+        self.saved = 0
+
+    def __call__(self, image: FractalImage, done: int, passes: int, samples_done: int) -> None:
+        """
+        Сохраняет превью, если пора.
+
+        :param image: Накопленное изображение.
+        :param done: Номер завершённого прохода (с единицы).
+        :param passes: Общее количество проходов.
+        :param samples_done: Количество накопленных сэмплов.
+        """
+        if done >= passes or not self.schedule.is_due(done):
+            return
+        preview = image.copy()
+        self.processor.processor(preview)
+        temporary_path = self.path.with_name(f"{self.path.name}.tmp")
+        self.saver.save(preview, temporary_path)
+        temporary_path.replace(self.path)
+        self.saved += 1
+        self.schedule.mark(done)
+        logger.info("Preview %d/%d (%d samples) saved to %s", done, passes, samples_done, self.path)
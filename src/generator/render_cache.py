@@ -0,0 +1,161 @@
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any, BinaryIO, Final, Optional
+
+import numpy as np
+
+from src.model.fractal_image import FractalImage
+
+logger = logging.getLogger(__name__)
+
+
+class RenderCache:
+    """
+    Класс RenderCache хранит результаты рендеринга на диске по хешу параметров.
+
+    Для каждого набора параметров рендеринга хранится накопленное
+    изображение (попадания и цвета до обработки), а для каждого набора
+    параметров рендеринга, обработки и сохранения — закодированный файл.
+    Повторный запрос с теми же параметрами копирует готовый файл, а запрос,
+    отличающийся только обработкой или форматом, обрабатывает и сохраняет
+    накопленное изображение без рендеринга.
+
+    Общий размер файлов ограничен max_bytes: при превышении удаляются
+    файлы, к которым дольше всего не обращались (время последнего
+    обращения хранится во времени изменения файла).
+    """
+
+    FORMAT_VERSION: Final[int] = 2
+    DEFAULT_MAX_BYTES: Final[int] = 1 << 30
+
+    directory: Path
+    max_bytes: int
+
+    def __init__(self, directory: Path, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        """
+        Создает кэш.
+
+        :param directory: Каталог кэша (создаётся при необходимости).
+        :param max_bytes: Максимальный общий размер файлов кэша в байтах.
+        """
+        if max_bytes <= 0:
+            raise ValueError("Cache size must be greater than 0.")
+        self.directory = directory
+        self.max_bytes = max_bytes
+        directory.mkdir(parents=True, exist_ok=True)
+
+    @classmethod
+    def key(cls, spec: dict[str, Any]) -> str:
+        """
+        Возвращает канонический хеш параметров.
+
+        :param spec: Параметры, сериализуемые в JSON.
+        :return: Шестнадцатеричный хеш SHA-256.
+        """
+        text = json.dumps({"version": cls.FORMAT_VERSION, **spec}, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def load_output(self, key: str, path: Path) -> bool:
+        """
+        Копирует закодированный файл из кэша.
+
+        :param key: Хеш параметров рендеринга, обработки и сохранения.
+        :param path: Путь, по которому нужно сохранить файл.
+        :return: True, если файл найден в кэше и скопирован.
+        """
+        cached = self._path(key, path.suffix)
+        try:
+            shutil.copyfile(cached, path)
+        except FileNotFoundError:
+            return False
+        self._touch(cached)
+        return True
+
+    def store_output(self, key: str, path: Path) -> None:
+        """
+        Сохраняет закодированный файл в кэш.
+
+        :param key: Хеш параметров рендеринга, обработки и сохранения.
+        :param path: Путь сохранённого файла.
+        """
+        with self._writer(self._path(key, path.suffix)) as file, path.open("rb") as source:
+            shutil.copyfileobj(source, file)
+        self.evict()
+
+    def load_image(self, key: str) -> Optional[FractalImage]:
+        """
+        Загружает накопленное изображение из кэша.
+
+        :param key: Хеш параметров рендеринга.
+        :return: Изображение или None, если его нет в кэше.
+        """
+        cached = self._path(key, ".npz")
+        try:
+            with np.load(cached, allow_pickle=False) as data:
+                hits, sums = data["hits"].astype(FractalImage.HITS_DTYPE), data["sums"]
+        except FileNotFoundError:
+            return None
+        self._touch(cached)
+        return FractalImage(hits, sums, np.zeros(hits.shape, dtype=np.float64))
+
+    def store_image(self, key: str, image: FractalImage) -> None:
+        """
+        Сохраняет накопленное изображение в кэш.
+
+        :param key: Хеш параметров рендеринга.
+        :param image: Изображение до обработки.
+        """
+        with self._writer(self._path(key, ".npz")) as file:
+            np.savez(file, hits=image.hits, sums=image.sums)
+        self.evict()
+
+    def evict(self) -> None:
+        """
+        Удаляет давно не использованные файлы, пока общий размер кэша превышает max_bytes.
+        """
+        entries = []
+        for path in self.directory.iterdir():
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            if path.is_file() and not path.name.startswith("."):
+                entries.append((stat.st_mtime_ns, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            logger.info("Evicted %s from render cache", path.name)
+
+    def _path(self, key: str, suffix: str) -> Path:
+        return self.directory / f"{key}{suffix}"
+
+    @staticmethod
+    def _touch(path: Path) -> None:
+        # Файл мог быть вытеснен другим процессом между чтением и обновлением времени
+        with contextlib.suppress(FileNotFoundError):
+            os.utime(path)
+
+    @staticmethod
+    @contextlib.contextmanager
+    def _writer(path: Path) -> Iterator[BinaryIO]:
+        """
+        Открывает файл кэша для записи: файл пишется во временный файл каталога и атомарно заменяет прежний.
+        """
+        descriptor, name = tempfile.mkstemp(dir=path.parent, prefix=".")
+        temporary_path = Path(name)
+        try:
+            with os.fdopen(descriptor, "wb") as file:
+                yield file
+            temporary_path.replace(path)
+        finally:
+            temporary_path.unlink(missing_ok=True)
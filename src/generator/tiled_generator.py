@@ -0,0 +1,124 @@
+import logging
+import tempfile
+from pathlib import Path
+from typing import Final, Optional
+
+import numpy as np
+
+from src.model.fractal_image import FractalImage
+from src.model.rect import Rect
+from src.processor.log_gamma_correction_image_processor import LogGammaCorrectionImageProcessor
+from src.renderer.abstract_renderer import AbstractRenderer
+from src.saver.png_stream_writer import PngStreamWriter
+from src.utils.random_utils import RandomStreams
+
+logger = logging.getLogger(__name__)
+
+
+class TiledGenerator:
+    """
+    Класс TiledGenerator генерирует изображения, которые не помещаются в память целиком.
+
+    Холст делится на тайлы tile_size x tile_size. Каждый тайл рендерится в
+    собственное изображение-окно: рендерер проходит те же траектории с тем же
+    зерном, что и для всего холста, и отбрасывает попадания вне тайла, поэтому
+    попадания тайлов в точности совпадают с соответствующими частями целого
+    изображения. Готовые тайлы сразу сохраняются в рабочий каталог.
+
+    После рендеринга всех тайлов известен общий максимум попаданий, по
+    которому тайлы обрабатываются согласованно, а затем построчно
+    сшиваются в PNG. Пиковая память определяется размером тайла (и шириной
+    строки холста при сшивании), а не размером холста.
+    """
+
+    # Количество строк, передаваемых в PNG за раз при сшивании
+    STITCH_ROWS: Final[int] = 64
+
+    renderer: AbstractRenderer
+    processor: LogGammaCorrectionImageProcessor
+    tile_size: int
+    work_dir: Optional[Path]
+
+    def __init__(self, renderer: AbstractRenderer, processor: LogGammaCorrectionImageProcessor, tile_size: int,
+                 work_dir: Optional[Path] = None) -> None:
+        """
+        Создает генератор с тайлами.
+
+        :param renderer: Рендерер.
+        :param processor: Процессор логарифмической и гамма-коррекции.
+        :param tile_size: Размер стороны тайла в пикселях.
+        :param work_dir: Каталог для временных файлов тайлов (по умолчанию — системный).
+        """
+        if tile_size <= 0:
+            raise ValueError("Tile size must be greater than 0.")
+        self.renderer = renderer
+        self.processor = processor
+        self.tile_size = tile_size
+        self.work_dir = work_dir
+
+    def generate(self, width: int, height: int, world: Rect, path: Path, compress_level: int = 6) -> None:
+        """
+        Генерирует изображение и сохраняет его в PNG.
+
+        :param width: Ширина холста.
+        :param height: Высота холста.
+        :param world: Прямоугольник мирового пространства.
+        :param path: Путь итогового PNG-файла.
+        :param compress_level: Уровень сжатия PNG (0-9).
+        """
+        streams = RandomStreams(self.renderer.seed)
+        logger.info("Seed: %d", streams.entropy)
+        affine_transformations = self.renderer.generate_affine_transformations(streams.affine_random())
+        tiles = self.split(width, height)
+
+        with tempfile.TemporaryDirectory(dir=self.work_dir) as directory:
+            work_dir = Path(directory)
+            max_hit_count = 0
+            for index, (x, y, tile_width, tile_height) in enumerate(tiles):
+                image = FractalImage.create(tile_width, tile_height, width, height, x, y,
+                                            self.renderer.color_mode.channels)
+                self.renderer.render_image(image, world, affine_transformations, streams)
+                max_hit_count = max(max_hit_count, int(image.hits.max()))
+                np.save(self._tile_path(work_dir, index, "hits"), image.hits)
+                np.save(self._tile_path(work_dir, index, "sums"), image.sums)
+                logger.info("Tile %d/%d rendered", index + 1, len(tiles))
+
+            processor = self.processor.with_max_hit_count(max_hit_count)
+            for index in range(len(tiles)):
+                hits = np.load(self._tile_path(work_dir, index, "hits"))
+                image = FractalImage(hits, np.load(self._tile_path(work_dir, index, "sums")),
+                                     np.zeros(hits.shape, dtype=np.float64))
+                processor.processor(image)
+                np.save(self._tile_path(work_dir, index, "rgb"), image.rgb)
+
+            self._stitch(work_dir, tiles, width, height, path, compress_level)
+
+    def split(self, width: int, height: int) -> list[tuple[int, int, int, int]]:
+        """
+        Делит холст на тайлы по строкам сверху вниз и слева направо.
+
+        :param width: Ширина холста.
+        :param height: Высота холста.
+        :return: Список тайлов (x, y, ширина, высота).
+        """
+        return [(x, y, min(self.tile_size, width - x), min(self.tile_size, height - y))
+                for y in range(0, height, self.tile_size)
+                for x in range(0, width, self.tile_size)]
+
+    def _stitch(self, work_dir: Path, tiles: list[tuple[int, int, int, int]], width: int, height: int,
+                path: Path, compress_level: int) -> None:
+        """
+        Сшивает обработанные тайлы в PNG, читая их через memmap по нескольку строк.
+        """
+        with PngStreamWriter(path, width, height, compress_level) as writer:
+            for band_y in range(0, height, self.tile_size):
+                band = [(index, tile) for index, tile in enumerate(tiles) if tile[1] == band_y]
+                rgbs = [np.load(self._tile_path(work_dir, index, "rgb"), mmap_mode="r") for index, _ in band]
+                band_height = band[0][1][3]
+                for row in range(0, band_height, self.STITCH_ROWS):
+                    writer.write_rows(np.concatenate([rgb[row:row + self.STITCH_ROWS] for rgb in rgbs], axis=1))
+                del rgbs
+
+    @staticmethod
+    def _tile_path(work_dir: Path, index: int, name: str) -> Path:
+        return work_dir / f"tile_{index}_{name}.npy"
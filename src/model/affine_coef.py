@@ -1,8 +1,10 @@
+import colorsys
 import random
 from decimal import Decimal
 from typing import Final
 
 from src.model.color import Color
+from src.model.precision import Number, number
 
 
 class AffineCoefficient:
@@ -10,33 +12,46 @@ class AffineCoefficient:
     Класс, представляющий коэффициенты для аффинного преобразования.
 
     Каждый объект содержит шесть коэффициентов (a, b, c, d, e, f) и цвет, связанный с преобразованием.
+    Координата цвета для окраски по палитре выводится из этого цвета.
     """
 
     MAX_COLOR_RANGE: Final[int] = 255
 
-    a: Decimal
-    b: Decimal
-    c: Decimal
-    d: Decimal
-    e: Decimal
-    f: Decimal
+    a: Number
+    b: Number
+    c: Number
+    d: Number
+    e: Number
+    f: Number
     color: Color
 
-    def __init__(self, coefficients: dict[str, Decimal], color: Color) -> None:
+    def __init__(self, coefficients: dict[str, float | Decimal], color: Color) -> None:
         """
         Инициализирует объект с коэффициентами и цветом.
 
         :param coefficients: Словарь с коэффициентами a, b, c, d, e, f.
         :param color: Цвет, представленный как кортеж (r, g, b).
         """
-        self.a = coefficients["a"]
-        self.b = coefficients["b"]
-        self.c = coefficients["c"]
-        self.d = coefficients["d"]
-        self.e = coefficients["e"]
-        self.f = coefficients["f"]
+        self.a = number(coefficients["a"])
+        self.b = number(coefficients["b"])
+        self.c = number(coefficients["c"])
+        self.d = number(coefficients["d"])
+        self.e = number(coefficients["e"])
+        self.f = number(coefficients["f"])
         self.color = color
 
+    @property
+    def color_coordinate(self) -> float:
+        """
+        Возвращает координату цвета преобразования для окраски по палитре: оттенок его цвета от 0 до 1.
+
+        Координата не требует отдельного случайного числа, поэтому наборы
+        преобразований, зерна и файлы состояния остаются прежними.
+        """
+        scale = self.MAX_COLOR_RANGE
+        hue, _, _ = colorsys.rgb_to_hsv(self.color.r / scale, self.color.g / scale, self.color.b / scale)
+        return hue
+
     @staticmethod
     def generate_random(random_instance: random.Random) -> "AffineCoefficient":
         """
@@ -48,21 +63,21 @@ class AffineCoefficient:
         :param random_instance: Экземпляр random, используемый для генерации случайных значений.
         :return: Новый объект AffineCoefficient с случайными коэффициентами и цветом.
         """
-        c = Decimal(random_instance.uniform(-1, 1))
-        f = Decimal(random_instance.uniform(-1, 1))
+        c = number(random_instance.uniform(-1, 1))
+        f = number(random_instance.uniform(-1, 1))
 
         while True:
-            a = Decimal(random_instance.uniform(-1, 1))
-            b = Decimal(random_instance.uniform(-1, 1))
-            d = Decimal(random_instance.uniform(-1, 1))
-            e = Decimal(random_instance.uniform(-1, 1))
+            a = number(random_instance.uniform(-1, 1))
+            b = number(random_instance.uniform(-1, 1))
+            d = number(random_instance.uniform(-1, 1))
+            e = number(random_instance.uniform(-1, 1))
             if AffineCoefficient.is_affine(a, b, d, e):
                 break
 
         color = Color(random_instance.randint(0, AffineCoefficient.MAX_COLOR_RANGE),
                  random_instance.randint(0, AffineCoefficient.MAX_COLOR_RANGE),
                  random_instance.randint(0, AffineCoefficient.MAX_COLOR_RANGE))
-        coefficients: dict[str, Decimal] = {
+        coefficients: dict[str, Number] = {
             "a": a,
             "b": b,
             "c": c,
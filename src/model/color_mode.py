@@ -0,0 +1,34 @@
+from enum import Enum
+from typing import Final
+
+# Доля, на которую координата цвета точки сдвигается к координате выбранного аффинного преобразования
+COLOR_SPEED: Final[float] = 0.5
+# Начальная координата цвета точки (за шаги нормализации она забывается)
+START_COORDINATE: Final[float] = 0.5
+
+
+class ColorMode(Enum):
+    """
+    Способ окраски попаданий.
+
+    В режиме rgb каждое попадание окрашивается цветом выбранного аффинного
+    преобразования, а пиксель накапливает суммы цветов по трём каналам.
+
+    В режиме palette каждое аффинное преобразование задаёт координату цвета
+    от 0 до 1 (AffineCoefficient.color_coordinate), точка переносит через
+    итерации собственную координату, которая на каждом шаге сдвигается к
+    координате выбранного преобразования, а пиксель накапливает сумму
+    координат в одном канале. Цвет пикселя берётся из палитры по средней
+    координате только при обработке изображения, поэтому смена палитры не
+    требует повторного рендеринга.
+    """
+
+    rgb = "rgb"
+    palette = "palette"
+
+    @property
+    def channels(self) -> int:
+        """
+        Возвращает количество каналов сумм цветов в изображении.
+        """
+        return 1 if self is ColorMode.palette else 3
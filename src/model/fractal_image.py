@@ -1,47 +1,214 @@
-from typing import Optional
+from pathlib import Path
+from typing import Final, Optional
 
+import numpy as np
+
+from src.model.color import Color
+from src.model.palette import Palette
 from src.model.pixel import Pixel
 from src.model.point import Point
+from src.model.precision import Number
 from src.model.rect import Rect
 
+# Количество каналов сумм цветов изображения RGB
+RGB_CHANNELS: Final[int] = 3
+
 
 class FractalImage:
     """
     Класс FractalImage представляет изображение фрактала.
 
-    Содержит массив пикселей, ширину и высоту изображения.
-    Является неизменяемым (immutable).
+    Хранит попадания, суммы цветов попаданий, цвет и нормализованные
+    значения пикселей в непрерывных массивах NumPy: hits (height, width),
+    sums (height, width, channels), rgb (height, width, 3) и normal
+    (height, width). Пиксели, возвращаемые pixel и resolve_pixel, являются
+    представлениями элементов этих массивов.
+
+    При рендеринге накапливаются только попадания и суммы цветов по каналам.
+    Сложение коммутативно, поэтому результат не зависит от порядка попаданий,
+    а изображения, накопленные в разных потоках, процессах или запусках,
+    объединяются простым сложением. Итоговый цвет (средний цвет попаданий)
+    вычисляется один раз при обработке (см. resolve_colors).
+
+    Изображение с тремя каналами накапливает суммы цветов RGB, изображение
+    с одним каналом — сумму координат цвета для окраски по палитре (см.
+    ColorMode).
+
+    Изображение может быть окном (тайлом) большего холста размера
+    canvas_width x canvas_height со смещением (offset_x, offset_y): точки
+    отображаются на холст, а попадания вне окна отбрасываются.
+
+    Массивы могут храниться в отображённых в память файлах .npy (см.
+    create_mapped): тогда их страницами управляет ОС, а накопленные данные
+    остаются на диске, даже если процесс завершится аварийно.
     """
 
-    data: list[Pixel]
+    # Количество пикселей, объединяемых за раз в merge
+    MERGE_BLOCK_PIXELS: Final[int] = 1 << 20
+    # Тип целых счётчиков попаданий: 32 бит переполняются на ярких пикселях длинных рендеров
+    HITS_DTYPE: Final[type[np.unsignedinteger]] = np.uint64
+
+    hits: np.ndarray
+    sums: np.ndarray
+    rgb: np.ndarray
+    normal: np.ndarray
     width: int
     height: int
+    canvas_width: int
+    canvas_height: int
+    offset_x: int
+    offset_y: int
+    directory: Optional[Path]
+
+    def __init__(self, hits: np.ndarray, sums: np.ndarray, normal: np.ndarray,
+                 canvas_width: Optional[int] = None, canvas_height: Optional[int] = None,
+                 offset_x: int = 0, offset_y: int = 0, rgb: Optional[np.ndarray] = None) -> None:
+        """
+        Инициализирует объект FractalImage массивами данных пикселей.
 
-    def __init__(self, data: list[Pixel], width: int, height: int) -> None:
+        :param hits: Массив попаданий формы (height, width).
+        :param sums: Массив сумм цветов попаданий формы (height, width, channels), float64.
+        :param normal: Массив нормализованных значений формы (height, width).
+        :param canvas_width: Ширина холста (по умолчанию равна ширине изображения).
+        :param canvas_height: Высота холста (по умолчанию равна высоте изображения).
+        :param offset_x: Смещение окна по оси X на холсте.
+        :param offset_y: Смещение окна по оси Y на холсте.
+        :param rgb: Массив цветов формы (height, width, 3) (по умолчанию создаётся нулевым).
         """
-        Инициализирует объект FractalImage с данными пикселей, шириной и высотой изображения.
+        if rgb is None:
+            rgb = np.zeros((*hits.shape, 3), dtype=np.uint8)
+        self._bind(hits, sums, rgb, normal)
+        self.canvas_width = self.width if canvas_width is None else canvas_width
+        self.canvas_height = self.height if canvas_height is None else canvas_height
+        self.offset_x = offset_x
+        self.offset_y = offset_y
+        self.directory = None
+
+    def _bind(self, hits: np.ndarray, sums: np.ndarray, rgb: np.ndarray, normal: np.ndarray) -> None:
+        self.hits = hits
+        self.sums = sums
+        self.rgb = rgb
+        self.normal = normal
+        self.height, self.width = hits.shape
+        # Плоские memoryview дают быстрый поэлементный доступ для Pixel без объектов NumPy
+        self.hits_view = memoryview(hits.reshape(-1))
+        self.sums_view = memoryview(sums.reshape(-1))
+        self.rgb_view = memoryview(rgb.reshape(-1))
+        self.normal_view = memoryview(normal.reshape(-1))
+        # plot вызывается на каждой итерации, поэтому способ накопления выбирается один раз
+        self._saturate = self.saturate if self.channels == RGB_CHANNELS else self.saturate_coordinate
+
+    @classmethod
+    def create(cls, width: int, height: int, canvas_width: Optional[int] = None,
+               canvas_height: Optional[int] = None, offset_x: int = 0, offset_y: int = 0,
+               channels: int = RGB_CHANNELS) -> "FractalImage":
+        """
+        Создает новое изображение фрактала заданной ширины и высоты.
+
+        Все пиксели инициализируются нулями.
 
-        :param data: Массив пикселей изображения.
         :param width: Ширина изображения.
         :param height: Высота изображения.
+        :param canvas_width: Ширина холста, если изображение является окном.
+        :param canvas_height: Высота холста, если изображение является окном.
+        :param offset_x: Смещение окна по оси X.
+        :param offset_y: Смещение окна по оси Y.
+        :param channels: Количество каналов сумм цветов (см. ColorMode.channels).
+        :return: Новый экземпляр FractalImage.
         """
-        self.data = data
-        self.width = width
-        self.height = height
+        return cls(
+            np.zeros((height, width), dtype=cls.HITS_DTYPE),
+            np.zeros((height, width, channels), dtype=np.float64),
+            np.zeros((height, width), dtype=np.float64),
+            canvas_width, canvas_height, offset_x, offset_y,
+        )
 
     @classmethod
-    def create(cls, width: int, height: int) -> "FractalImage":
+    def create_mapped(cls, directory: Path, width: int, height: int, canvas_width: Optional[int] = None,
+                      canvas_height: Optional[int] = None, offset_x: int = 0, offset_y: int = 0,
+                      channels: int = RGB_CHANNELS) -> "FractalImage":
         """
-        Создает новое изображение фрактала заданной ширины и высоты.
+        Создает новое изображение, массивы которого хранятся в файлах .npy каталога.
 
-        Все пиксели инициализируются значениями по умолчанию: (0, 0, 0, 0, 0).
+        Файлы называются по массивам: hits.npy, sums.npy, rgb.npy и normal.npy.
 
+        :param directory: Каталог файлов (создаётся при необходимости; прежние файлы перезаписываются).
         :param width: Ширина изображения.
         :param height: Высота изображения.
+        :param canvas_width: Ширина холста, если изображение является окном.
+        :param canvas_height: Высота холста, если изображение является окном.
+        :param offset_x: Смещение окна по оси X.
+        :param offset_y: Смещение окна по оси Y.
+        :param channels: Количество каналов сумм цветов (см. ColorMode.channels).
         :return: Новый экземпляр FractalImage.
         """
-        data = [Pixel(0, 0, 0, 0, 0) for _ in range(width * height)]
-        return cls(data, width, height)
+        directory.mkdir(parents=True, exist_ok=True)
+        image = cls(
+            np.lib.format.open_memmap(directory / "hits.npy", "w+", cls.HITS_DTYPE, (height, width)),
+            np.lib.format.open_memmap(directory / "sums.npy", "w+", np.float64, (height, width, channels)),
+            np.lib.format.open_memmap(directory / "normal.npy", "w+", np.float64, (height, width)),
+            canvas_width, canvas_height, offset_x, offset_y,
+            np.lib.format.open_memmap(directory / "rgb.npy", "w+", np.uint8, (height, width, 3)),
+        )
+        image.directory = directory
+        return image
+
+    @classmethod
+    def open_mapped(cls, directory: Path) -> "FractalImage":
+        """
+        Открывает изображение, ранее созданное create_mapped, для чтения и записи.
+
+        :param directory: Каталог файлов изображения.
+        :return: Экземпляр FractalImage.
+        """
+        image = cls(
+            np.load(directory / "hits.npy", mmap_mode="r+"),
+            np.load(directory / "sums.npy", mmap_mode="r+"),
+            np.load(directory / "normal.npy", mmap_mode="r+"),
+            rgb=np.load(directory / "rgb.npy", mmap_mode="r+"),
+        )
+        image.directory = directory
+        return image
+
+    def flush(self) -> None:
+        """
+        Записывает изменения отображённых в память массивов на диск (для изображений в памяти ничего не делает).
+        """
+        for array in (self.hits, self.sums, self.rgb, self.normal):
+            if isinstance(array, np.memmap):
+                array.flush()
+
+    @property
+    def geometry(self) -> tuple[int, int, int, int, int, int]:
+        """
+        Возвращает размеры и положение изображения на холсте в порядке аргументов create.
+        """
+        return self.width, self.height, self.canvas_width, self.canvas_height, self.offset_x, self.offset_y
+
+    @property
+    def channels(self) -> int:
+        """
+        Возвращает количество каналов сумм цветов.
+        """
+        return self.sums.shape[-1]
+
+    @property
+    def is_window(self) -> bool:
+        """
+        Проверяет, является ли изображение окном большего холста.
+        """
+        return (self.width, self.height) != (self.canvas_width, self.canvas_height)
+
+    def copy(self) -> "FractalImage":
+        """
+        Возвращает независимую копию изображения.
+
+        Копирование занимает время, пропорциональное размеру изображения, а не числу попаданий.
+
+        :return: Новый экземпляр FractalImage с копиями массивов.
+        """
+        return FractalImage(self.hits.copy(), self.sums.copy(), self.normal.copy(), self.canvas_width,
+                            self.canvas_height, self.offset_x, self.offset_y, self.rgb.copy())
 
     def resolve_pixel(self, rect: Rect, point: Point) -> Optional[Pixel]:
         """
@@ -52,14 +219,84 @@ class FractalImage:
 
         :param rect: Прямоугольная область, определяющая границы поиска.
         :param point: Точка, для которой требуется найти соответствующий пиксель.
-        :return: Пиксель, соответствующий точке, или None, если точка вне области rect.
+        :return: Пиксель, соответствующий точке, или None, если точка вне области rect или вне окна.
         """
         if not rect.contains(point):
             return None
-        x = int(((point.x - rect.x) / rect.width) * self.width)
-        y = int(((point.y - rect.y) / rect.height) * self.height)
+        x = int(((point.x - rect.x) / rect.width) * self.canvas_width) - self.offset_x
+        y = int(((point.y - rect.y) / rect.height) * self.canvas_height) - self.offset_y
         return self.pixel(x, y)
 
+    def plot(self, rect: Rect, x: Number, y: Number, color: Color | float) -> None:
+        """
+        Добавляет попадание точки с координатами (x, y) в соответствующий пиксель.
+
+        Делает то же, что pixel_index и add_hit, но одним вызовом и без
+        создания объектов Point и Pixel: метод вызывается на каждой итерации
+        рендеринга.
+
+        :param rect: Прямоугольник мирового пространства.
+        :param x: Координата X точки.
+        :param y: Координата Y точки.
+        :param color: Цвет попадания или, для изображения с одним каналом, координата цвета.
+        """
+        if not (rect.x <= x < rect.x + rect.width and rect.y <= y < rect.y + rect.height):
+            return
+        pixel_x = int(((x - rect.x) / rect.width) * self.canvas_width) - self.offset_x
+        pixel_y = int(((y - rect.y) / rect.height) * self.canvas_height) - self.offset_y
+        if 0 <= pixel_x < self.width and 0 <= pixel_y < self.height:
+            self._saturate(pixel_y * self.width + pixel_x, color)
+
+    def pixel_index(self, rect: Rect, x: Number, y: Number) -> Optional[int]:
+        """
+        Находит индекс пикселя, в который попадает точка с координатами (x, y).
+
+        :param rect: Прямоугольник мирового пространства.
+        :param x: Координата X точки.
+        :param y: Координата Y точки.
+        :return: Индекс пикселя (y * width + x) или None, если точка вне прямоугольника или вне окна.
+        """
+        if not (rect.x <= x < rect.x + rect.width and rect.y <= y < rect.y + rect.height):
+            return None
+        pixel_x = int(((x - rect.x) / rect.width) * self.canvas_width) - self.offset_x
+        pixel_y = int(((y - rect.y) / rect.height) * self.canvas_height) - self.offset_y
+        if 0 <= pixel_x < self.width and 0 <= pixel_y < self.height:
+            return pixel_y * self.width + pixel_x
+        return None
+
+    def add_hit(self, index: int, value: Color | float) -> None:
+        """
+        Добавляет попадание в пиксель с индексом index с учётом числа каналов изображения.
+
+        :param index: Индекс пикселя (y * width + x).
+        :param value: Цвет попадания или, для изображения с одним каналом, координата цвета.
+        """
+        self._saturate(index, value)
+
+    def saturate(self, index: int, color: Color) -> None:
+        """
+        Добавляет попадание цвета color в пиксель с индексом index (см. Pixel.saturate_hit_count).
+
+        :param index: Индекс пикселя (y * width + x).
+        :param color: Цвет попадания.
+        """
+        sums = self.sums_view
+        offset = 3 * index
+        sums[offset] += color.r
+        sums[offset + 1] += color.g
+        sums[offset + 2] += color.b
+        self.hits_view[index] += 1
+
+    def saturate_coordinate(self, index: int, coordinate: float) -> None:
+        """
+        Добавляет попадание с координатой цвета coordinate в пиксель изображения с одним каналом.
+
+        :param index: Индекс пикселя (y * width + x).
+        :param coordinate: Координата цвета от 0 до 1.
+        """
+        self.sums_view[index] += coordinate
+        self.hits_view[index] += 1
+
     def contains(self, x: int, y: int) -> bool:
         """
         Проверяет, находятся ли координаты в пределах изображения.
@@ -80,4 +317,76 @@ class FractalImage:
         """
         if not self.contains(x, y):
             return None
-        return self.data[y * self.width + x]
+        return Pixel(self, y * self.width + x)
+
+    def histogram(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Возвращает накопленные попадания и суммы цветов изображения в виде плоских массивов.
+
+        :return: Кортеж из массива попаданий (width * height) и массива сумм цветов
+                 по каналам (channels, width * height).
+        """
+        return self.hits.reshape(-1).astype(np.int64), self.sums.reshape(-1, self.channels).T
+
+    def resolve_colors(self, palette: Optional[Palette] = None) -> None:
+        """
+        Вычисляет цвет пикселей по суммам цветов и записывает его в rgb.
+
+        Для изображения с тремя каналами цвет — средний цвет попаданий, для
+        изображения с одним каналом — цвет палитры по средней координате цвета
+        (палитра для изображений с тремя каналами не используется). Пиксели
+        без попаданий становятся чёрными.
+
+        :param palette: Палитра, обязательна для изображения с одним каналом.
+        """
+        hit = self.hits > 0
+        average = self.sums[hit] / self.hits[hit, np.newaxis]
+        self.rgb[...] = 0
+        if self.channels == RGB_CHANNELS:
+            self.rgb[hit] = np.clip(average, 0, 255).astype(np.uint8)
+            return
+        if palette is None:
+            raise ValueError("Palette is required to resolve palette-indexed colors.")
+        self.rgb[hit] = palette.lookup(average[:, 0])
+
+    def assign(self, hits: np.ndarray, sums: np.ndarray) -> None:
+        """
+        Заменяет массивы изображения новыми (например, после уменьшения разрешения).
+
+        Изображение перестаёт быть окном и отображением в память; цвета и нормализованные значения обнуляются.
+        Дробные попадания (плотность после фильтрации) хранятся как float64, целые — как HITS_DTYPE.
+
+        :param hits: Новый массив попаданий формы (height, width).
+        :param sums: Новый массив сумм цветов формы (height, width, channels).
+        """
+        hits_dtype = np.float64 if np.issubdtype(hits.dtype, np.floating) else self.HITS_DTYPE
+        self._bind(np.ascontiguousarray(hits, dtype=hits_dtype), np.ascontiguousarray(sums, dtype=np.float64),
+                   np.zeros((*hits.shape, 3), dtype=np.uint8), np.zeros(hits.shape, dtype=np.float64))
+        self.canvas_width, self.canvas_height = self.width, self.height
+        self.offset_x = self.offset_y = 0
+        self.directory = None
+
+    def merge(self, other: "FractalImage") -> None:
+        """
+        Добавляет к изображению попадания другого изображения того же размера.
+
+        Объединение идёт блоками строк, поэтому не требует памяти порядка
+        размера изображения (важно для отображённых в память изображений).
+
+        :param other: Изображение с попаданиями.
+        """
+        rows = max(1, self.MERGE_BLOCK_PIXELS // self.width)
+        for start in range(0, self.height, rows):
+            part = slice(start, start + rows)
+            self.hits[part] += other.hits[part]
+            self.sums[part] += other.sums[part]
+
+    def accumulate(self, hits: np.ndarray, color_sums: np.ndarray) -> None:
+        """
+        Добавляет к изображению гистограмму попаданий.
+
+        :param hits: Массив попаданий (width * height).
+        :param color_sums: Суммы цветов по каналам (channels, width * height).
+        """
+        self.hits += hits.reshape(self.hits.shape).astype(self.hits.dtype)
+        self.sums += color_sums.T.reshape(self.sums.shape)
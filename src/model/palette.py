@@ -0,0 +1,88 @@
+import colorsys
+from typing import Final
+
+import numpy as np
+
+# Допустимые размеры таблицы палитры
+PALETTE_SIZES: Final[tuple[int, ...]] = (256, 1024)
+
+# Опорные цвета встроенных палитр: координата от 0 до 1 и цвет (r, g, b)
+PALETTE_STOPS: Final[dict[str, list[tuple[float, tuple[int, int, int]]]]] = {
+    "fire": [(0.0, (32, 0, 0)), (0.35, (200, 30, 0)), (0.7, (255, 190, 20)), (1.0, (255, 255, 220))],
+    "ocean": [(0.0, (0, 10, 40)), (0.4, (0, 90, 160)), (0.75, (40, 200, 210)), (1.0, (230, 255, 250))],
+    "grayscale": [(0.0, (40, 40, 40)), (1.0, (255, 255, 255))],
+}
+# Палитра по оттенку: координата цвета аффинного преобразования равна оттенку цвета преобразования
+RAINBOW: Final[str] = "rainbow"
+DEFAULT_PALETTE: Final[str] = RAINBOW
+
+
+class Palette:
+    """
+    Класс Palette — таблица цветов, по которой координаты цвета от 0 до 1 переводятся в RGB.
+
+    Таблица из 256 или 1024 цветов строится один раз, а перевод выполняется
+    для всего изображения сразу индексированием массива.
+    """
+
+    table: np.ndarray
+
+    def __init__(self, table: np.ndarray) -> None:
+        """
+        Создает палитру по таблице цветов.
+
+        :param table: Массив uint8 формы (size, 3).
+        """
+        if table.shape[1:] != (3,) or table.shape[0] == 0:
+            message = f"Palette table must have shape (size, 3), got {table.shape}"
+            raise ValueError(message)
+        self.table = np.ascontiguousarray(table, dtype=np.uint8)
+
+    @classmethod
+    def names(cls) -> list[str]:
+        """
+        Возвращает имена встроенных палитр.
+        """
+        return [RAINBOW, *PALETTE_STOPS]
+
+    @classmethod
+    def from_name(cls, name: str, size: int = PALETTE_SIZES[0]) -> "Palette":
+        """
+        Строит встроенную палитру.
+
+        :param name: Имя палитры (см. names).
+        :param size: Количество цветов в таблице (256 или 1024).
+        :return: Палитра.
+        """
+        if size not in PALETTE_SIZES:
+            message = f"Palette size must be one of {PALETTE_SIZES}, got {size}"
+            raise ValueError(message)
+        positions = np.arange(size) / (size - 1)
+        if name == RAINBOW:
+            return cls(np.array([[round(channel * 255) for channel in colorsys.hsv_to_rgb(position, 0.85, 1.0)]
+                                 for position in positions.tolist()]))
+        if name not in PALETTE_STOPS:
+            message = f"Unknown palette: {name}, expected one of {', '.join(cls.names())}"
+            raise ValueError(message)
+        stops = PALETTE_STOPS[name]
+        coordinates = [coordinate for coordinate, _ in stops]
+        table = np.stack([np.interp(positions, coordinates, [color[channel] for _, color in stops])
+                          for channel in range(3)], axis=1)
+        return cls(np.rint(table))
+
+    @property
+    def size(self) -> int:
+        """
+        Возвращает количество цветов в таблице.
+        """
+        return self.table.shape[0]
+
+    def lookup(self, coordinates: np.ndarray) -> np.ndarray:
+        """
+        Переводит координаты цвета в цвета палитры.
+
+        :param coordinates: Массив координат от 0 до 1 (значения вне отрезка ограничиваются).
+        :return: Массив uint8 формы coordinates.shape + (3,).
+        """
+        indices = np.rint(np.clip(coordinates, 0.0, 1.0) * (self.size - 1)).astype(np.intp)
+        return self.table[indices]
@@ -1,57 +1,87 @@
-import threading
-from decimal import Decimal
+from typing import TYPE_CHECKING
 
 from src.model.color import Color
 
+if TYPE_CHECKING:
+    from src.model.fractal_image import FractalImage
+
 
 class Pixel:
     """
     Класс Pixel представляет собой модель пикселя изображения.
 
-    Хранит информацию о цвете (красный, зеленый, синий), количестве попаданий
-    и нормализованном значении. Реализует потокобезопасное обновление цвета пикселя.
+    Является представлением (view) одного элемента массивов FractalImage:
+    хранит только ссылку на изображение и индекс пикселя, а цвет (красный,
+    зеленый, синий), количество попаданий и нормализованное значение читает
+    и записывает прямо в массивы изображения. Цвет заполняется при обработке
+    изображения (см. FractalImage.resolve_colors).
     """
 
-    red: int
-    green: int
-    blue: int
-    hit_count: int
-    normal: Decimal
-    lock_for_color: threading.RLock
+    __slots__ = ("_image", "_index")
 
-    def __init__(self, red: int, green: int, blue: int, hit_count: int, normal: float | Decimal) -> None:
+    def __init__(self, image: "FractalImage", index: int) -> None:
         """
-        Конструктор для инициализации пикселя с указанными параметрами.
+        Конструктор для создания представления пикселя.
 
-        :param red: Красная составляющая цвета.
-        :param green: Зеленая составляющая цвета.
-        :param blue: Синяя составляющая цвета.
-        :param hit_count: Количество попаданий в пиксель.
-        :param normal: Нормализованное значение.
+        :param image: Изображение, которому принадлежит пиксель.
+        :param index: Индекс пикселя в изображении (y * width + x).
         """
-        self.red = red
-        self.green = green
-        self.blue = blue
-        self.hit_count = hit_count
-        self.normal = normal
-        self.lock_for_color = threading.RLock()
-
-    def saturate_hit_count(self, color: Color) -> None:
+        self._image = image
+        self._index = index
+
+    @property
+    def red(self) -> int:
+        return self._image.rgb_view[3 * self._index]
+
+    @red.setter
+    def red(self, value: int) -> None:
+        self._image.rgb_view[3 * self._index] = value
+
+    @property
+    def green(self) -> int:
+        return self._image.rgb_view[3 * self._index + 1]
+
+    @green.setter
+    def green(self, value: int) -> None:
+        self._image.rgb_view[3 * self._index + 1] = value
+
+    @property
+    def blue(self) -> int:
+        return self._image.rgb_view[3 * self._index + 2]
+
+    @blue.setter
+    def blue(self, value: int) -> None:
+        self._image.rgb_view[3 * self._index + 2] = value
+
+    @property
+    def hit_count(self) -> int:
+        return self._image.hits_view[self._index]
+
+    @hit_count.setter
+    def hit_count(self, value: int) -> None:
+        self._image.hits_view[self._index] = value
+
+    @property
+    def normal(self) -> float:
+        return self._image.normal_view[self._index]
+
+    @normal.setter
+    def normal(self, value: float) -> None:
+        self._image.normal_view[self._index] = value
+
+    def saturate_hit_count(self, color: Color | float) -> None:
         """
-        Обновляет цвет пикселя на основе заданного цвета с учетом количества попаданий.
+        Добавляет попадание: увеличивает количество попаданий и суммы цветов пикселя.
+
+        Для изображения с одним каналом (окраска по палитре) вместо цвета
+        передаётся координата цвета.
 
-        Если пиксель еще не был обновлен, он принимает заданный цвет.
-        В противном случае средний цвет вычисляется как среднее между текущим и новым цветом.
+        Итоговый цвет пикселя — средний цвет всех попаданий — не зависит от
+        порядка попаданий и вычисляется при обработке изображения.
 
-        Метод потокобезопасен благодаря использованию "замка".
+        Метод не использует блокировок: параллельные рендереры пишут каждый
+        в своё изображение и объединяют их после рендеринга.
 
-        :param color: Новый цвет для обновления, представленный как кортеж (r, g, b).
+        :param color: Цвет попадания или координата цвета.
         """
-        with self.lock_for_color:
-            if self.hit_count == 0:
-                self.red, self.green, self.blue = color.r, color.g, color.b
-            else:
-                self.red = (self.red + color.r) // 2
-                self.green = (self.green + color.g) // 2
-                self.blue = (self.blue + color.b) // 2
-            self.hit_count += 1
+        self._image.add_hit(self._index, color)
@@ -1,16 +1,20 @@
 from dataclasses import dataclass
 from decimal import Decimal
 
+from src.model.precision import Number, number
+
 
 @dataclass
 class Point:
     """
     Представление точки.
+
+    Тип координат определяется режимом точности (см. src.model.precision).
     """
 
-    x: Decimal
-    y: Decimal
+    x: Number
+    y: Number
 
     def __init__(self, x: float | Decimal, y: float | Decimal) -> None:
-        self.x = Decimal(x)
-        self.y = Decimal(y)
+        self.x = number(x)
+        self.y = number(y)
@@ -0,0 +1,51 @@
+from decimal import Decimal
+from enum import Enum
+
+Number = float | Decimal
+
+
+class Precision(Enum):
+    """
+    Режим точности вычислений геометрической модели.
+
+    По умолчанию координаты и коэффициенты хранятся как float. Режим decimal
+    включается явно, когда нужна произвольная точность ценой скорости.
+    """
+
+    float64 = "float"
+    decimal = "decimal"
+
+    def __init__(self, precision_name: str) -> None:
+        self.precision_name = precision_name
+
+
+_number_type: type[float] | type[Decimal] = float
+
+
+def set_precision(precision: Precision) -> None:
+    """
+    Устанавливает режим точности для всех создаваемых точек, прямоугольников и коэффициентов.
+
+    :param precision: Режим точности.
+    """
+    global _number_type  # noqa: PLW0603
+    _number_type = Decimal if precision is Precision.decimal else float
+
+
+def get_precision() -> Precision:
+    """
+    Возвращает текущий режим точности.
+
+    :return: Режим точности.
+    """
+    return Precision.decimal if _number_type is Decimal else Precision.float64
+
+
+def number(value: float | Decimal) -> Number:
+    """
+    Приводит значение к числовому типу текущего режима точности.
+
+    :param value: Исходное значение.
+    :return: Значение типа float или Decimal.
+    """
+    return _number_type(value)
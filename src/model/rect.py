@@ -2,13 +2,14 @@ import math
 from decimal import Decimal
 
 from src.model.point import Point
+from src.model.precision import Number, number
 
 
 class Rect:
-    x: Decimal
-    y: Decimal
-    width: Decimal
-    height: Decimal
+    x: Number
+    y: Number
+    width: Number
+    height: Number
 
     def __init__(self, x: float | Decimal, y: float | Decimal,
                  width: float | Decimal, height: float | Decimal) -> None:
@@ -22,10 +23,10 @@ class Rect:
         :param width: Ширина прямоугольника.
         :param height: Высота прямоугольника.
         """
-        self.x = Decimal(x)
-        self.y = Decimal(y)
-        self.width = Decimal(width)
-        self.height = Decimal(height)
+        self.x = number(x)
+        self.y = number(y)
+        self.width = number(width)
+        self.height = number(height)
 
     def contains(self, p: Point) -> bool:
         """
@@ -46,12 +47,10 @@ class Rect:
         """
         center_x = self.x + self.width / 2
         center_y = self.y + self.height / 2
+        cos = number(math.cos(angle))
+        sin = number(math.sin(angle))
 
-        rotate_x = ((point.x - center_x) * Decimal(math.cos(angle)) - (point.y - center_y)
-                    * Decimal(math.sin(angle)) + center_x)
-        rotate_y = ((point.x - center_x) * Decimal(math.sin(angle)) + (point.y - center_y)
-                    * Decimal(math.cos(angle)) + center_y)
+        rotate_x = (point.x - center_x) * cos - (point.y - center_y) * sin + center_x
+        rotate_y = (point.x - center_x) * sin + (point.y - center_y) * cos + center_y
 
         return Point(rotate_x, rotate_y)
-
-
@@ -0,0 +1,68 @@
+from dataclasses import dataclass
+from typing import Any, Optional
+
+
+@dataclass(frozen=True)
+class RenderWeights:
+    """
+    Веса вариаций и аффинных преобразований.
+
+    В обычном режиме на каждом шаге выбирается одна вариация с
+    вероятностью, пропорциональной её весу. В режиме blend, как в
+    классических flame-рендерерах, точка проходит через все вариации, а
+    результаты складываются с весами (веса не нормируются). Аффинное
+    преобразование выбирается с вероятностью, пропорциональной его весу.
+    Без весов выбор равномерный.
+    """
+
+    variations: Optional[tuple[float, ...]] = None
+    affines: Optional[tuple[float, ...]] = None
+    blend: bool = False
+
+    @property
+    def is_default(self) -> bool:
+        return self.variations is None and self.affines is None and not self.blend
+
+    def variation_weights(self, count: int) -> tuple[float, ...]:
+        """
+        Возвращает веса вариаций.
+
+        :param count: Количество вариаций.
+        :return: Заданные веса или единичные веса.
+        """
+        return self.variations if self.variations is not None else (1.0,) * count
+
+    def affine_weights(self, count: int) -> tuple[float, ...]:
+        """
+        Возвращает веса аффинных преобразований.
+
+        :param count: Количество аффинных преобразований.
+        :return: Заданные веса или единичные веса.
+        """
+        return self.affines if self.affines is not None else (1.0,) * count
+
+    def validate(self, variation_count: int, affine_count: int) -> None:
+        """
+        Проверяет, что количество весов совпадает с количеством вариаций и преобразований.
+
+        :param variation_count: Количество вариаций.
+        :param affine_count: Количество аффинных преобразований.
+        :raises ValueError: Если количество весов не совпадает или веса некорректны.
+        """
+        for name, weights, count in (("variation", self.variations, variation_count),
+                                     ("affine", self.affines, affine_count)):
+            if weights is None:
+                continue
+            if len(weights) != count:
+                message = f"Expected {count} {name} weights, got {len(weights)}"
+                raise ValueError(message)
+            if any(weight < 0 for weight in weights) or sum(weights) <= 0:
+                message = f"{name.capitalize()} weights must be non-negative with a positive sum"
+                raise ValueError(message)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "variations": list(self.variations) if self.variations is not None else None,
+            "affines": list(self.affines) if self.affines is not None else None,
+            "blend": self.blend,
+        }
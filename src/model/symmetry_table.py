@@ -0,0 +1,91 @@
+import math
+from typing import Final
+
+import numpy as np
+
+from src.model.point import Point
+from src.model.precision import Number, number
+from src.model.rect import Rect
+
+
+class SymmetryTable:
+    """
+    Таблица поворотов для симметрии относительно центра прямоугольника.
+
+    Косинусы и синусы углов 2π·k/symmetry (k = 1..symmetry) вычисляются один
+    раз на рендер, после чего все симметричные копии точки (или пачки точек)
+    получаются одной операцией без вызовов math.cos и math.sin.
+    """
+
+    # Значения меньше порога считаются нулём, чтобы повороты на кратные π/2 углы были точными
+    EPSILON: Final[float] = 1e-12
+
+    center_x: Number
+    center_y: Number
+    rotations: list[tuple[Number, Number]]
+    cos_table: np.ndarray
+    sin_table: np.ndarray
+
+    def __init__(self, world: Rect, symmetry: int) -> None:
+        """
+        Строит таблицу поворотов.
+
+        :param world: Прямоугольник, относительно центра которого выполняются повороты.
+        :param symmetry: Количество симметричных копий точки.
+        """
+        if symmetry <= 0:
+            raise ValueError("Symmetry must be greater than 0.")
+        self.center_x = world.x + world.width / 2
+        self.center_y = world.y + world.height / 2
+        angles = [2 * math.pi * k / symmetry for k in range(1, symmetry + 1)]
+        cos_values = [self._snap(math.cos(angle)) for angle in angles]
+        sin_values = [self._snap(math.sin(angle)) for angle in angles]
+        self.rotations = [(number(cos), number(sin)) for cos, sin in zip(cos_values, sin_values, strict=True)]
+        self.cos_table = np.array(cos_values)
+        self.sin_table = np.array(sin_values)
+
+    @property
+    def symmetry(self) -> int:
+        return len(self.rotations)
+
+    def apply(self, point: Point) -> list[Point]:
+        """
+        Возвращает все симметричные копии точки.
+
+        :param point: Исходная точка.
+        :return: Список из symmetry точек; при symmetry = 1 — сама точка.
+        """
+        if len(self.rotations) == 1:
+            return [point]
+        dx = point.x - self.center_x
+        dy = point.y - self.center_y
+        center_x, center_y = self.center_x, self.center_y
+        return [Point(dx * cos - dy * sin + center_x, dx * sin + dy * cos + center_y)
+                for cos, sin in self.rotations]
+
+    def apply_batch(self, x: np.ndarray, y: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Возвращает симметричные копии пачки точек.
+
+        Копии идут блоками: сначала все точки, повернутые первым поворотом, затем вторым и т.д.
+
+        :param x: Координаты X точек.
+        :param y: Координаты Y точек.
+        :return: Координаты X и Y всех копий (массивы длины symmetry * len(x)).
+        """
+        if len(self.rotations) == 1:
+            return x, y
+        center_x, center_y = float(self.center_x), float(self.center_y)
+        dx = x - center_x
+        dy = y - center_y
+        sym_x = np.outer(self.cos_table, dx) - np.outer(self.sin_table, dy) + center_x
+        sym_y = np.outer(self.sin_table, dx) + np.outer(self.cos_table, dy) + center_y
+        return sym_x.ravel(), sym_y.ravel()
+
+    @classmethod
+    def _snap(cls, value: float) -> float:
+        if abs(value) < cls.EPSILON:
+            return 0.0
+        if abs(abs(value) - 1) < cls.EPSILON:
+            return math.copysign(1.0, value)
+        return value
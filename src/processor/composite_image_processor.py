@@ -0,0 +1,27 @@
+from src.model.fractal_image import FractalImage
+from src.processor.image_processor import ImageProcessor
+
+
+class CompositeImageProcessor(ImageProcessor):
+    """
+    Класс CompositeImageProcessor последовательно применяет несколько процессоров к изображению.
+    """
+
+    processors: list[ImageProcessor]
+
+    def __init__(self, processors: list[ImageProcessor]) -> None:
+        """
+        Создает цепочку процессоров.
+
+        :param processors: Процессоры в порядке применения.
+        """
+        self.processors = processors
+
+    def processor(self, image: FractalImage) -> None:
+        """
+        Применяет процессоры к изображению по порядку.
+
+        :param image: Объект FractalImage, представляющий изображение фрактала.
+        """
+        for processor in self.processors:
+            processor.processor(image)
@@ -1,6 +1,11 @@
 import math
+from collections.abc import Callable
+from typing import Optional
+
+import numpy as np
 
 from src.model.fractal_image import FractalImage
+from src.model.palette import Palette
 from src.processor.image_processor import ImageProcessor
 
 
@@ -9,19 +14,53 @@ class LogGammaCorrectionImageProcessor(ImageProcessor):
     Класс LogGammaCorrectionImageProcessor реализует коррекцию изображения
 
     с использованием логарифмической функции и гамма-коррекции.
-    Обрабатывает изображение FractalImage, нормализует значения интенсивности
-    пикселей и выполняет гамма-коррекцию для каждого пикселя.
+    Обрабатывает изображение FractalImage: вычисляет цвет пикселей по суммам
+    цветов попаданий, нормализует значения интенсивности пикселей и выполняет
+    гамма-коррекцию для каждого пикселя.
+
+    Обработка ведётся над массивами изображения целиком. Логарифм и степень
+    зависят только от числа попаданий, поэтому вычисляются через math один раз
+    для каждого различного числа попаданий и раздаются пикселям по индексу:
+    результат побитово совпадает с поэлементным вычислением через math.log10
+    и math.pow.
+
+    Если задан max_hit_count, нормализация ведётся относительно него, а не
+    максимума изображения: так тайлы большого холста обрабатываются
+    согласованно, как одно изображение.
+
+    Изображения, окрашиваемые по палитре, переводятся в RGB палитрой
+    процессора в начале обработки.
+
+    Попадания после оценки плотности или суперсэмплинга дробные; для них
+    логарифм и степень вычисляются через NumPy, а плотность меньше одного
+    попадания, как и одно попадание, даёт нулевую яркость.
     """
 
-    def __init__(self, gamma: float) -> None:
+    MIN_MAX_NORMAL = 0.00000001
+    MAX_TABLE_SIZE = 1 << 22
+
+    def __init__(self, gamma: float, max_hit_count: Optional[int] = None, palette: Optional[Palette] = None) -> None:
         """
         Создает экземпляр процессора изображения с заданным значением гаммы.
 
         :param gamma: Параметр гамма-коррекции (должен быть больше 0).
+        :param max_hit_count: Максимальное число попаданий для нормализации (по умолчанию — максимум изображения).
+        :param palette: Палитра для изображений, окрашиваемых по палитре.
         """
         if gamma <= 0:
             raise ValueError("Gamma must be greater than 0.")
         self.gamma = gamma
+        self.max_hit_count = max_hit_count
+        self.palette = palette
+
+    def with_max_hit_count(self, max_hit_count: int) -> "LogGammaCorrectionImageProcessor":
+        """
+        Возвращает процессор с той же гаммой и заданным максимальным числом попаданий.
+
+        :param max_hit_count: Максимальное число попаданий по всему холсту.
+        :return: Новый экземпляр процессора.
+        """
+        return LogGammaCorrectionImageProcessor(self.gamma, max_hit_count, self.palette)
 
     def processor(self, image: FractalImage) -> None:
         """
@@ -31,26 +70,31 @@ class LogGammaCorrectionImageProcessor(ImageProcessor):
 
         :param image: Объект FractalImage, представляющий изображение фрактала.
         """
+        image.resolve_colors(self.palette)
         max_value = self._get_max_normal(image)
+        if self.max_hit_count is not None:
+            max_value = self.MIN_MAX_NORMAL
+            if self.max_hit_count > 0:
+                max_value = max(max_value, math.log10(self.max_hit_count))
         self._normalize_and_apply_gamma_correction(image, max_value)
-    @staticmethod
-    def _get_max_normal(image: FractalImage) -> float:
+
+    @classmethod
+    def _get_max_normal(cls, image: FractalImage) -> float:
         """
         Находит максимальное значение нормализации для пикселей изображения.
 
-        Значение нормализации рассчитывается с использованием логарифмической функции.
+        Значение нормализации рассчитывается с использованием логарифмической функции
+        и записывается в image.normal для пикселей, в которые были попадания.
 
         :param image: Объект FractalImage, представляющий изображение фрактала.
         :return: Максимальное значение нормализации.
         """
-        max_value = 0.00000001
-        for y in range(image.height):
-            for x in range(image.width):
-                pixel = image.pixel(x, y)
-                if pixel is not None and pixel.hit_count > 0:
-                    pixel.normal = math.log10(pixel.hit_count)
-                    max_value = max(max_value, pixel.normal)
-        return max_value
+        hit = image.hits > 0
+        if not hit.any():
+            return cls.MIN_MAX_NORMAL
+        normals = cls._log_hits(image.hits[hit])
+        image.normal[hit] = normals
+        return max(cls.MIN_MAX_NORMAL, float(normals.max()))
 
     def _normalize_and_apply_gamma_correction(self, image: FractalImage, max_value: float) -> None:
         """
@@ -59,12 +103,56 @@ class LogGammaCorrectionImageProcessor(ImageProcessor):
         :param image: Объект FractalImage, представляющий изображение фрактала.
         :param max_value: Максимальное значение нормализации.
         """
-        for y in range(image.height):
-            for x in range(image.width):
-                pixel = image.pixel(x, y)
-                if pixel is not None:
-                    pixel.normal /= max_value
-                    correction_factor = math.pow(pixel.normal, 1.0 / self.gamma)
-                    pixel.red = int(pixel.red * correction_factor)
-                    pixel.green = int(pixel.green * correction_factor)
-                    pixel.blue = int(pixel.blue * correction_factor)
+        exponent = 1.0 / self.gamma
+        image.normal /= max_value
+
+        hit = image.hits > 0
+        correction_factor = np.empty(image.normal.shape)
+        if np.issubdtype(image.hits.dtype, np.floating):
+            correction_factor[hit] = np.power(self._log_hits(image.hits[hit]) / max_value, exponent)
+        else:
+            correction_factor[hit] = self._per_level(
+                image.hits[hit], lambda hit_count: math.pow(math.log10(hit_count) / max_value, exponent))
+        # Для пикселей без попаданий нормализованное значение обычно равно нулю
+        levels, inverse = np.unique(image.normal[~hit], return_inverse=True)
+        factors = np.array([math.pow(level, exponent) for level in levels.tolist()])
+        correction_factor[~hit] = factors[inverse.reshape(-1)]
+
+        image.rgb[...] = (image.rgb * correction_factor[..., np.newaxis]).astype(np.uint8)
+
+    @classmethod
+    def _log_hits(cls, values: np.ndarray) -> np.ndarray:
+        """
+        Вычисляет десятичный логарифм числа попаданий.
+
+        :param values: Одномерный массив положительных чисел попаданий (целых или дробных).
+        :return: Массив логарифмов; для дробной плотности меньше единицы — ноль.
+        """
+        if np.issubdtype(values.dtype, np.floating):
+            return np.log10(np.maximum(values, 1.0))
+        return cls._per_level(values, math.log10)
+
+    @classmethod
+    def _per_level(cls, values: np.ndarray, function: Callable[[int], float]) -> np.ndarray:
+        """
+        Вычисляет функцию один раз для каждого различного значения массива и раздаёт результат по элементам.
+
+        Для небольших значений используется таблица, индексируемая самим значением,
+        иначе — сортировка через np.unique.
+
+        :param values: Одномерный массив неотрицательных целых чисел.
+        :param function: Скалярная функция.
+        :return: Массив значений функции той же формы, что и values.
+        """
+        if values.size == 0:
+            return np.zeros(0)
+        top = int(values.max())
+        if top <= cls.MAX_TABLE_SIZE:
+            present = np.zeros(top + 1, dtype=bool)
+            present[values] = True
+            levels = np.flatnonzero(present)
+            table = np.zeros(top + 1)
+            table[levels] = [function(level) for level in levels.tolist()]
+            return table[values]
+        levels, inverse = np.unique(values, return_inverse=True)
+        return np.array([function(level) for level in levels.tolist()])[inverse.reshape(-1)]
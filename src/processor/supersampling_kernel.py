@@ -0,0 +1,43 @@
+from enum import Enum
+from typing import Final
+
+import numpy as np
+
+# Сигма гауссова ядра в пикселях итогового изображения
+GAUSSIAN_SIGMA: Final[float] = 0.5
+
+
+class SupersamplingKernel(Enum):
+    """
+    Ядро фильтра для уменьшения разрешения при суперсэмплинге.
+
+    Ширина ядра измеряется в пикселях итогового изображения: box усредняет
+    блок factor x factor, tent и gaussian захватывают и соседние блоки и дают
+    более гладкий результат.
+    """
+
+    box = "box"
+    tent = "tent"
+    gaussian = "gaussian"
+
+    def weights(self, factor: int) -> np.ndarray:
+        """
+        Возвращает одномерные веса ядра для исходных пикселей.
+
+        Веса нормированы так, что их сумма равна factor: после фильтрации по
+        обеим осям общее число попаданий сохраняется.
+
+        :param factor: Коэффициент суперсэмплинга.
+        :return: Веса исходных пикселей, начиная с пикселя, отстоящего от начала блока на (len - factor) // 2 влево.
+        """
+        pad = 0 if self is SupersamplingKernel.box else factor
+        offsets = np.arange(-pad, factor + pad)
+        # Расстояние от центра исходного пикселя до центра итогового пикселя в итоговых пикселях
+        distance = (offsets + 0.5) / factor - 0.5
+        if self is SupersamplingKernel.box:
+            weights = np.ones(factor)
+        elif self is SupersamplingKernel.tent:
+            weights = np.maximum(0.0, 1.0 - np.abs(distance))
+        else:
+            weights = np.exp(-distance ** 2 / (2 * GAUSSIAN_SIGMA ** 2))
+        return weights * factor / weights.sum()
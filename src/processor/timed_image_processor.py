@@ -0,0 +1,34 @@
+from src.model.fractal_image import FractalImage
+from src.processor.image_processor import ImageProcessor
+from src.utils.render_metrics import RenderMetrics
+
+
+class TimedImageProcessor(ImageProcessor):
+    """
+    Класс TimedImageProcessor добавляет время работы другого процессора к этапу метрик.
+    """
+
+    wrapped: ImageProcessor
+    metrics: RenderMetrics
+    stage: str
+
+    def __init__(self, processor: ImageProcessor, metrics: RenderMetrics, stage: str = "tone_mapping") -> None:
+        """
+        Создает процессор с замером времени.
+
+        :param processor: Процессор, время которого измеряется.
+        :param metrics: Метрики.
+        :param stage: Имя этапа.
+        """
+        self.wrapped = processor
+        self.metrics = metrics
+        self.stage = stage
+
+    def processor(self, image: FractalImage) -> None:
+        """
+        Применяет процессор к изображению и добавляет время к этапу.
+
+        :param image: Объект FractalImage, представляющий изображение фрактала.
+        """
+        with self.metrics.stage(self.stage):
+            self.wrapped.processor(image)
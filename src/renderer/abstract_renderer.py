@@ -1,13 +1,31 @@
+import logging
 import random
+import time
 from abc import ABC, abstractmethod
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, Optional
 
 from src.model.affine_coef import AffineCoefficient
+from src.model.color_mode import ColorMode
 from src.model.fractal_image import FractalImage
-from src.model.point import Point
 from src.model.rect import Rect
+from src.model.render_weights import RenderWeights
+from src.model.symmetry_table import SymmetryTable
+from src.renderer.variation_pipeline import VariationPipeline
 from src.transforms.affine_transformation import AffineTransformation
 from src.transforms.transformation import Transformation
-from src.utils import random_utils
+from src.utils.random_utils import RandomStreams
+from src.utils.render_metrics import RenderMetrics
+
+logger = logging.getLogger(__name__)
+
+# Функция, вызываемая после прохода рендеринга:
+# (изображение, номер прохода, количество проходов, количество отрендеренных сэмплов)
+PassCallback = Callable[[FractalImage, int, int, int], None]
+# Условие остановки, проверяемое после прохода рендеринга:
+# (изображение, количество отрендеренных сэмплов) -> True, если рендеринг пора остановить
+StopCondition = Callable[[FractalImage, int], bool]
 
 
 class AbstractRenderer(ABC):
@@ -19,97 +37,260 @@ class AbstractRenderer(ABC):
 
     steps_for_normalization: int
     affine_count: int
+    samples: int
     iter_per_sample: int
     symmetry: int
     variations: list[Transformation]
+    seed: Optional[int]
+    weights: RenderWeights
+    color_mode: ColorMode
+    discarded: int
+    samples_done: int
+    metrics: Optional[RenderMetrics]
 
-    def __init__(self, steps_for_normalization: int, affine_count: int,
-                 iter_per_sample: int, symmetry: int, variations: list[Transformation]) -> None:
+    def __init__(self, steps_for_normalization: int, affine_count: int, samples: int,
+                 iter_per_sample: int, symmetry: int, variations: list[Transformation],
+                 seed: Optional[int] = None, weights: Optional[RenderWeights] = None,
+                 color_mode: ColorMode = ColorMode.rgb) -> None:
         """
         Конструктор для создания рендерера.
 
         :param steps_for_normalization: Количество шагов для нормализации перед началом записи в изображение.
         :param affine_count: Количество аффинных преобразований.
+        :param samples: Количество сэмплов для рендеринга.
         :param iter_per_sample: Количество итераций на каждый сэмпл.
         :param symmetry: Количество симметрий для генерации точек.
         :param variations: Список вариаций (трансформаций), применяемых к точкам.
+        :param seed: Зерно генератора случайных чисел или None для случайного зерна.
+        :param weights: Веса вариаций и аффинных преобразований (по умолчанию выбор равномерный).
+        :param color_mode: Способ окраски попаданий.
         """
         self.steps_for_normalization = steps_for_normalization
         self.affine_count = affine_count
+        self.samples = samples
         self.iter_per_sample = iter_per_sample
         self.symmetry = symmetry
         self.variations = variations
+        self.seed = seed
+        self.weights = weights or RenderWeights()
+        self.weights.validate(len(variations), affine_count)
+        self.color_mode = color_mode
+        self.discarded = 0
+        self.samples_done = 0
+        # Метрики собираются, только если генератор их запросил
+        self.metrics = None
 
-    def render(self, width: int, height: int, world: Rect) -> FractalImage:
+    def render(self, width: int, height: int, world: Rect, passes: int = 1,
+               on_pass: Optional[PassCallback] = None, directory: Optional[Path] = None,
+               until: Optional[StopCondition] = None) -> FractalImage:
         """
         Рендерит фрактальное изображение заданного размера в пределах указанного мирового пространства.
 
+        Набор аффинных преобразований и потоки случайных чисел всех сэмплов
+        выводятся из зерна, поэтому при одинаковом зерне изображение повторяется.
+
         :param width: Ширина изображения.
         :param height: Высота изображения.
         :param world: Прямоугольник мирового пространства, задающий область рендеринга.
+        :param passes: Количество проходов, на которые делятся сэмплы.
+        :param on_pass: Функция, вызываемая после каждого прохода.
+        :param directory: Каталог для отображённых в память массивов изображения (по умолчанию — в памяти).
+        :param until: Условие досрочной остановки, проверяемое после каждого прохода.
         :return: Объект FractalImage, представляющий отрендеренное изображение.
         """
-        image = FractalImage.create(width, height)
-        affine_transformations = self.generate_affine_transformations()
-        self.render_image(image, world, affine_transformations)
+        channels = self.color_mode.channels
+        if directory is None:
+            image = FractalImage.create(width, height, channels=channels)
+        else:
+            image = FractalImage.create_mapped(directory, width, height, channels=channels)
+        streams = RandomStreams(self.seed)
+        logger.info("Seed: %d", streams.entropy)
+        affine_transformations = self.generate_affine_transformations(streams.affine_random())
+        self.render_image(image, world, affine_transformations, streams, passes, on_pass, until=until)
         return image
 
-    @abstractmethod
-    def render_image(self, image: FractalImage, world: Rect,
-                     affine_transformations: list[AffineTransformation]) -> None:
+    def render_image(self, image: FractalImage, world: Rect, affine_transformations: list[AffineTransformation],
+                     streams: Optional[RandomStreams] = None, passes: int = 1,
+                     on_pass: Optional[PassCallback] = None, first: int = 0,
+                     until: Optional[StopCondition] = None) -> None:
         """
-        Метод, который должен быть реализован в подклассах для управления процессом рендеринга.
+        Рендерит сэмплы с индексами [first, samples) в изображение.
+
+        Сэмплы делятся на passes последовательных проходов; после каждого
+        прохода вызывается on_pass с изображением, номером прохода (с единицы),
+        общим числом проходов и количеством сэмплов, уже накопленных в
+        изображении. Ненулевой first позволяет продолжить рендеринг в уже
+        накопленное изображение. Если рендерер берёт поток случайных чисел по
+        индексу сэмпла, число проходов не влияет на результат. Количество
+        отброшенных улетевших точек сохраняется в discarded.
+
+        Если условие until выполнено после прохода, рендеринг останавливается:
+        on_pass получает этот проход как последний (номер прохода равен
+        количеству проходов), а количество накопленных сэмплов сохраняется в
+        samples_done. Если заданы metrics, в них добавляется количество попаданий.
 
         :param image: Изображение, в которое записывается результат.
         :param world: Прямоугольник мирового пространства.
         :param affine_transformations: Список аффинных преобразований.
+        :param streams: Потоки случайных чисел (по умолчанию создаются из зерна рендерера).
+        :param passes: Количество проходов.
+        :param on_pass: Функция, вызываемая после каждого прохода.
+        :param first: Индекс первого сэмпла (количество уже отрендеренных сэмплов).
+        :param until: Условие досрочной остановки, проверяемое после каждого прохода.
         """
+        if passes <= 0:
+            raise ValueError("Passes count must be greater than 0.")
+        if image.channels != self.color_mode.channels:
+            mode = self.color_mode
+            message = f"Image has {image.channels} color channels, {mode.value} mode needs {mode.channels}"
+            raise ValueError(message)
+        streams = streams or RandomStreams(self.seed)
+        chunks = self.split_samples(first, max(self.samples - first, 0), passes)
+        self.discarded = 0
+        self.samples_done = first
+        hits_before = self._count_hits(image)
+        for index, (chunk_first, chunk_count) in enumerate(chunks, start=1):
+            self.discarded += self.render_samples(image, world, affine_transformations, streams, chunk_first,
+                                                  chunk_count)
+            self.samples_done = chunk_first + chunk_count
+            stop = until is not None and until(image, self.samples_done)
+            if on_pass is not None:
+                on_pass(image, index, index if stop else len(chunks), self.samples_done)
+            if stop:
+                break
+        if self.metrics is not None:
+            self.metrics.count("hits", self._count_hits(image) - hits_before)
+        if self.discarded:
+            logger.info("Discarded escaped points: %d", self.discarded)
 
-    def render_one_sample(self, image: "FractalImage", world: "Rect", affine_transformations: list) -> None:
+    @abstractmethod
+    def render_samples(self, image: FractalImage, world: Rect, affine_transformations: list[AffineTransformation],
+                       streams: RandomStreams, first: int, count: int) -> int:
         """
-        Обрабатывает один сэмпл для генерации изображения.
+        Метод, который должен быть реализован в подклассах для управления процессом рендеринга.
 
-        Применяет аффинные преобразования, вариации и симметрию для создания точек.
+        Рендерит сэмплы с индексами [first, first + count). Сэмпл с индексом i
+        использует поток streams.sample_random(i), поэтому результат не зависит
+        от того, как сэмплы распределены между потоками и процессами.
 
         :param image: Изображение, в которое записывается результат.
         :param world: Прямоугольник мирового пространства.
         :param affine_transformations: Список аффинных преобразований.
+        :param streams: Потоки случайных чисел.
+        :param first: Индекс первого сэмпла.
+        :param count: Количество сэмплов.
+        :return: Количество отброшенных улетевших точек.
+        """
+
+    def _count_hits(self, image: FractalImage) -> int:
+        """
+        Возвращает общее количество попаданий изображения, если собираются метрики, иначе 0.
+
+        :param image: Изображение.
+        :return: Количество попаданий.
+        """
+        return int(image.hits.sum()) if self.metrics is not None else 0
+
+    def record_worker(self, metrics: Optional[RenderMetrics], worker: int, count: int, start: float) -> None:
+        """
+        Добавляет в метрики работу исполнителя, отрендерившего count сэмплов по одному.
+
+        :param metrics: Метрики или None.
+        :param worker: Номер исполнителя.
+        :param count: Количество сэмплов.
+        :param start: Момент начала работы (time.perf_counter).
+        """
+        if metrics is not None:
+            iterations = count * (self.steps_for_normalization + self.iter_per_sample)
+            metrics.add_worker(worker, count, iterations, time.perf_counter() - start)
+
+    def merge_worker_metrics(self, metrics: Optional[RenderMetrics]) -> None:
+        """
+        Добавляет метрики, собранные потоком или процессом, к метрикам рендерера.
+
+        :param metrics: Метрики исполнителя или None.
         """
-        current_point = random_utils.get_random_point(world)
-        for step in range(-self.steps_for_normalization, self.iter_per_sample):
-            affine = random_utils.get_random_elem_from_list(affine_transformations)
-            variation = random_utils.get_random_elem_from_list(self.variations)
-            current_point = affine.apply(current_point)
-            current_point = variation.apply(current_point)
-            if step > 0:
-                theta = 0.0
-                for _ in range(self.symmetry):
-                    theta += 2 * 3.141592653589793 / self.symmetry
-                    point = world.rotate_point(current_point, theta)
-                    self.process_point(world, image, point, affine)
+        if metrics is not None and self.metrics is not None:
+            self.metrics.merge(metrics)
+
     @staticmethod
-    def process_point(world: Rect, image: FractalImage, point: Point, affine: AffineTransformation) -> None:
+    def split_samples(first: int, count: int, parts: int) -> list[tuple[int, int]]:
+        """
+        Делит сэмплы [first, first + count) на не более чем parts непрерывных частей почти равного размера.
+
+        :param first: Индекс первого сэмпла.
+        :param count: Количество сэмплов.
+        :param parts: Максимальное количество частей.
+        :return: Список пар (индекс первого сэмпла части, количество сэмплов в части).
+        """
+        size, rest = divmod(count, parts)
+        chunks = []
+        start = first
+        for part in range(parts):
+            length = size + (1 if part < rest else 0)
+            if length:
+                chunks.append((start, length))
+            start += length
+        return chunks
+
+    def stream_settings(self) -> dict[str, Any]:
+        """
+        Возвращает параметры, определяющие, какие потоки случайных чисел заполняют изображение.
+
+        Однопоточный, многопоточный и процессный рендереры берут поток по
+        индексу сэмпла и при одном зерне дают одно и то же изображение,
+        поэтому их параметры совпадают.
+
+        :return: Словарь параметров, сериализуемый в JSON.
+        """
+        return {"streams": "sample"}
+
+    def compile_pipeline(self, affine_transformations: list[AffineTransformation]) -> VariationPipeline:
         """
-        Обрабатывает точку, преобразуя её в пиксель изображения.
+        Компилирует конвейер итераций для аффинных преобразований и вариаций рендерера.
 
+        Конвейер компилируется один раз на рендеринг и передаётся в render_one_sample.
+
+        :param affine_transformations: Список аффинных преобразований.
+        :return: Скомпилированный конвейер.
+        """
+        return VariationPipeline(affine_transformations, self.variations, self.weights, self.color_mode)
+
+    def render_one_sample(self, image: "FractalImage", world: "Rect", affine_transformations: list,
+                          random_instance: Optional[random.Random] = None,
+                          symmetry_table: Optional[SymmetryTable] = None,
+                          pipeline: Optional[VariationPipeline] = None,
+                          metrics: Optional[RenderMetrics] = None) -> int:
+        """
+        Обрабатывает один сэмпл для генерации изображения.
+
+        Применяет аффинные преобразования, вариации и симметрию для создания точек.
+
+        :param image: Изображение, в которое записывается результат.
         :param world: Прямоугольник мирового пространства.
-        :param image: Изображение, в которое записывается пиксель.
-        :param point: Точка, которую нужно преобразовать.
-        :param affine: Аффинное преобразование, связанное с точкой.
+        :param affine_transformations: Список аффинных преобразований.
+        :param random_instance: Генератор случайных чисел сэмпла (по умолчанию — глобальный).
+        :param symmetry_table: Таблица поворотов симметрии (по умолчанию строится по world).
+        :param pipeline: Скомпилированный конвейер (по умолчанию компилируется по affine_transformations).
+        :param metrics: Метрики, в которые добавляются время и счётчики сэмпла.
+        :return: Количество отброшенных улетевших точек.
         """
-        pixel = image.resolve_pixel(world, point)
-        if pixel:
-            pixel.saturate_hit_count(affine.affine_coef.color)
+        symmetry_table = symmetry_table or SymmetryTable(world, self.symmetry)
+        pipeline = pipeline or self.compile_pipeline(affine_transformations)
+        return pipeline.render_sample(image, world, self.steps_for_normalization, self.iter_per_sample, symmetry_table,
+                               random_instance, metrics)
 
-    def generate_affine_transformations(self) -> list:
+    def generate_affine_transformations(self, random_instance: Optional[random.Random] = None) -> list:
         """
         Генерирует список случайных аффинных преобразований.
 
+        :param random_instance: Генератор случайных чисел (по умолчанию — новый, без зерна).
         :return: Список объектов AffineTransformation.
         """
-        random_instance = random.Random()
+        random_instance = random_instance or random.Random()
         affine_transformations = []
-        for _ in range(self.affine_count):
-            transformation = AffineTransformation(AffineCoefficient.generate_random(random_instance))
-            affine_transformations.append(transformation)
+        with RenderMetrics.measure(self.metrics, "affine_generation"):
+            for _ in range(self.affine_count):
+                transformation = AffineTransformation(AffineCoefficient.generate_random(random_instance))
+                affine_transformations.append(transformation)
         return affine_transformations
@@ -1,22 +1,37 @@
+import os
+import time
 from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
 
+import numpy as np
+
+from src.model.color_mode import ColorMode
 from src.model.fractal_image import FractalImage
 from src.model.rect import Rect
+from src.model.render_weights import RenderWeights
+from src.model.symmetry_table import SymmetryTable
 from src.renderer.abstract_renderer import AbstractRenderer
+from src.renderer.variation_pipeline import VariationPipeline
 from src.transforms.affine_transformation import AffineTransformation
 from src.transforms.transformation import Transformation
+from src.utils.random_utils import RandomStreams
+from src.utils.render_metrics import RenderMetrics
 
 
 class MultiThreadRenderer(AbstractRenderer):
     """
     Класс, реализующий рендеринг фрактала с использованием многозадачности.
 
-    Использует пул процессов для параллельного выполнения нескольких выборок фрактала.
+    Использует пул потоков: сэмплы делятся на части по числу потоков, каждый
+    поток рендерит свою часть в собственное изображение без блокировок, а по
+    завершении изображения объединяются в порядке частей.
     """
 
     def __init__(self, steps_for_normalization: int, affine_count: int,
                  samples: int, iter_per_sample: int, symmetry: int,
-                 variations: list[Transformation]) -> None:
+                 variations: list[Transformation], workers: Optional[int] = None,
+                 seed: Optional[int] = None, weights: Optional[RenderWeights] = None,
+                 color_mode: ColorMode = ColorMode.rgb) -> None:
         """
         Конструктор для инициализации параметров рендеринга.
 
@@ -26,23 +41,83 @@ class MultiThreadRenderer(AbstractRenderer):
         :param iter_per_sample: Количество итераций для каждой выборки.
         :param symmetry: Симметрия фрактала (например, количество повторений).
         :param variations: Список вариаций преобразований.
+        :param workers: Количество потоков (по умолчанию — число ядер).
+        :param seed: Зерно генератора случайных чисел.
+        :param weights: Веса вариаций и аффинных преобразований (по умолчанию выбор равномерный).
+        :param color_mode: Способ окраски попаданий.
         """
-        super().__init__(steps_for_normalization, affine_count, iter_per_sample, symmetry, variations)
-        self.samples = samples
+        super().__init__(steps_for_normalization, affine_count, samples, iter_per_sample, symmetry, variations, seed,
+                         weights, color_mode)
+        if workers is not None and workers <= 0:
+            raise ValueError("Workers count must be greater than 0.")
+        self.workers = workers or os.cpu_count() or 1
 
-    def render_image(self, image: FractalImage, world: Rect,
-                     affine_transformations: list[AffineTransformation]) -> None:
+    def render_samples(self, image: FractalImage, world: Rect, affine_transformations: list[AffineTransformation],
+                       streams: RandomStreams, first: int, count: int) -> int:
         """
-        Рендерит фрактал в многозадачном режиме, используя пул процессов.
+        Рендерит фрактал в многозадачном режиме, используя пул потоков.
 
-        Для каждой выборки создается отдельный процесс.
+        Каждый поток накапливает попадания в собственном изображении, поэтому
+        запись попаданий не требует блокировок. Гистограммы потоков объединяются
+        один раз в конце, в порядке частей, так что при одинаковом зерне и числе
+        потоков результат побитово повторяется.
 
         :param image: Фрактальное изображение, которое будет рендериться.
         :param world: Прямоугольник, определяющий область видимости фрактала.
         :param affine_transformations: Список аффинных преобразований.
+        :param streams: Потоки случайных чисел.
+        :param first: Индекс первого сэмпла.
+        :param count: Количество сэмплов.
+        :return: Количество отброшенных улетевших точек.
         """
-        with ThreadPoolExecutor() as executor:
-            tasks = [executor.submit(self.render_one_sample, image, world, affine_transformations)
-                     for _ in range(self.samples)]
+        chunks = self.split_samples(first, count, self.workers)
+        hits = np.zeros(image.width * image.height, dtype=np.int64)
+        color_sums = np.zeros((image.channels, image.width * image.height), dtype=np.float64)
+        discarded = 0
+
+        with ThreadPoolExecutor(max_workers=len(chunks) or 1) as executor:
+            symmetry_table = SymmetryTable(world, self.symmetry)
+            pipeline = self.compile_pipeline(affine_transformations)
+            tasks = [executor.submit(self._render_tile, image.geometry, world, affine_transformations,
+                                     streams, symmetry_table, pipeline, chunk_first, chunk_count, worker)
+                     for worker, (chunk_first, chunk_count) in enumerate(chunks)]
             for task in tasks:
-                task.result()
+                tile, tile_discarded, tile_metrics = task.result()
+                tile_hits, tile_color_sums = tile.histogram()
+                hits += tile_hits
+                color_sums += tile_color_sums
+                discarded += tile_discarded
+                self.merge_worker_metrics(tile_metrics)
+
+        image.accumulate(hits, color_sums)
+        return discarded
+
+    def _render_tile(self, geometry: tuple[int, ...], world: Rect, affine_transformations: list[AffineTransformation],
+                     streams: RandomStreams, symmetry_table: SymmetryTable, pipeline: VariationPipeline,
+                     first: int, count: int, worker: int = 0,
+                     ) -> tuple[FractalImage, int, Optional[RenderMetrics]]:
+        """
+        Рендерит часть сэмплов в собственное изображение потока.
+
+        :param geometry: Размеры и положение изображения на холсте (FractalImage.geometry).
+        :param world: Прямоугольник мирового пространства.
+        :param affine_transformations: Список аффинных преобразований.
+        :param streams: Потоки случайных чисел.
+        :param symmetry_table: Таблица поворотов симметрии.
+        :param pipeline: Скомпилированный конвейер итераций.
+        :param first: Индекс первого сэмпла части.
+        :param count: Количество сэмплов в части.
+        :param worker: Номер потока для метрик.
+        :return: Изображение с попаданиями части, количество отброшенных улетевших точек и метрики потока
+                 (None, если метрики не собираются).
+        """
+        tile = FractalImage.create(*geometry, channels=self.color_mode.channels)
+        # Поток собирает метрики отдельно, объединяются они в вызывающем потоке
+        metrics = RenderMetrics() if self.metrics is not None else None
+        discarded = 0
+        start = time.perf_counter()
+        for index in range(first, first + count):
+            discarded += self.render_one_sample(tile, world, affine_transformations, streams.sample_random(index),
+                                                symmetry_table, pipeline, metrics)
+        self.record_worker(metrics, worker, count, start)
+        return tile, discarded, metrics
@@ -0,0 +1,347 @@
+import math
+import time
+from typing import Any, Final, Optional
+
+import numpy as np
+
+from src.model.color_mode import COLOR_SPEED, START_COORDINATE, ColorMode
+from src.model.fractal_image import FractalImage
+from src.model.rect import Rect
+from src.model.render_weights import RenderWeights
+from src.model.symmetry_table import SymmetryTable
+from src.renderer.abstract_renderer import AbstractRenderer
+from src.renderer.variation_pipeline import ESCAPE_RADIUS_SQUARED
+from src.transforms.affine_transformation import AffineTransformation
+from src.transforms.transformation import Transformation
+from src.utils.alias_table import AliasTable
+from src.utils.random_utils import LaneRandom, RandomStreams
+from src.utils.render_metrics import RenderMetrics
+
+
+class NumpyRenderer(AbstractRenderer):
+    """
+    Класс, реализующий векторизованный рендеринг фрактала на NumPy.
+
+    Вместо одной точки за шаг продвигает целую пачку точек (float64-массивы),
+    выбирает аффинное преобразование и вариацию для каждой точки пачки разом,
+    а попадания накапливает гистограммой через np.bincount.
+
+    Улетевшие точки (NaN, бесконечность, дальше ESCAPE_RADIUS) заменяются
+    новыми случайными точками мира прямо в пачке, так что мёртвые дорожки не
+    тратят итерации до конца пачки; пока заменённая точка проходит
+    нормализацию, её дорожка не участвует в симметрии и поиске пикселей.
+
+    Шаги пачки обрабатывают тысячи точек, поэтому время этапов (нормализация,
+    итерации, симметрия, поиск пикселей, гистограмма) измеряется на каждом шаге.
+
+    Случайные числа каждой дорожки берутся из LaneRandom по её глобальному
+    индексу и номеру шага, поэтому изображение зависит от зерна и размера
+    пачки, но не от деления сэмплов на проходы.
+    """
+
+    DEFAULT_BATCH_SIZE: Final[int] = 4096
+    MIN_FLUSH_SIZE: Final[int] = 1 << 20
+    # Дорожка рисует не меньше стольких точек на каждый шаг нормализации: нормализация остаётся малой долей работы
+    MIN_LANE_PLOTS_PER_WARMUP_STEP: Final[int] = 8
+    # Наибольшее количество дорожек, на которые делится траектория одного сэмпла
+    MAX_SEGMENTS: Final[int] = 64
+
+    def __init__(self, steps_for_normalization: int, affine_count: int, samples: int,
+                 iter_per_sample: int, symmetry: int, variations: list[Transformation],
+                 batch_size: int = DEFAULT_BATCH_SIZE, seed: Optional[int] = None,
+                 weights: Optional[RenderWeights] = None,
+                 color_mode: ColorMode = ColorMode.rgb) -> None:
+        """
+        Инициализирует параметры рендеринга.
+
+        :param steps_for_normalization: Количество шагов для нормализации.
+        :param affine_count: Количество аффинных преобразований.
+        :param samples: Количество сэмплов для рендеринга.
+        :param iter_per_sample: Количество итераций на каждый сэмпл.
+        :param symmetry: Симметрия фрактала (например, количество повторений).
+        :param variations: Список вариаций преобразований.
+        :param batch_size: Количество точек, обрабатываемых за один шаг.
+        :param seed: Зерно генератора случайных чисел.
+        :param weights: Веса вариаций и аффинных преобразований (по умолчанию выбор равномерный).
+        :param color_mode: Способ окраски попаданий.
+        """
+        super().__init__(steps_for_normalization, affine_count, samples, iter_per_sample, symmetry, variations, seed,
+                         weights, color_mode)
+        if batch_size <= 0:
+            raise ValueError("Batch size must be greater than 0.")
+        self.batch_size = batch_size
+        self.variation_table = AliasTable(self.weights.variation_weights(len(variations)))
+
+    def stream_settings(self) -> dict[str, Any]:
+        """
+        Возвращает параметры, определяющие, какие потоки случайных чисел заполняют изображение.
+
+        Дорожки берут случайные числа из LaneRandom, а не из потоков сэмплов.
+
+        :return: Словарь параметров, сериализуемый в JSON.
+        """
+        return {"streams": "lane", "batch_size": self.batch_size}
+
+    def render_samples(self, image: FractalImage, world: Rect, affine_transformations: list[AffineTransformation],
+                       streams: RandomStreams, first: int, count: int) -> int:
+        """
+        Рендерит фрактал пачками точек.
+
+        Траектория каждого сэмпла делится на несколько отрезков (дорожек),
+        каждый со своей нормализацией, чтобы пачка заполнялась и при малом
+        числе сэмплов. Отрезок рисует не меньше MIN_LANE_PLOTS_PER_WARMUP_STEP
+        точек на шаг нормализации, поэтому повторные нормализации не вытесняют
+        полезную работу. Общее количество нарисованных точек сохраняется с
+        точностью до округления. Дорожка отрезка j сэмпла i имеет индекс
+        i * segments + j и берёт случайные числа по этому индексу. Количество
+        отрезков зависит только от числа итераций и шагов нормализации, но не
+        от общего числа сэмплов и размера пачки, поэтому сэмплы, добавленные
+        к сохранённому рендерингу, не повторяют уже отрисованные дорожки.
+
+        :param image: Фрактальное изображение, которое будет рендериться.
+        :param world: Прямоугольник, определяющий область видимости фрактала.
+        :param affine_transformations: Список аффинных преобразований.
+        :param streams: Потоки случайных чисел.
+        :param first: Индекс первого сэмпла.
+        :param count: Количество сэмплов.
+        :return: Количество отброшенных улетевших точек.
+        """
+        coefficients = np.array([[float(t.affine_coef.a), float(t.affine_coef.b), float(t.affine_coef.c),
+                                  float(t.affine_coef.d), float(t.affine_coef.e), float(t.affine_coef.f)]
+                                 for t in affine_transformations])
+        if self.color_mode is ColorMode.palette:
+            colors = np.array([t.affine_coef.color_coordinate for t in affine_transformations])
+        else:
+            colors = np.array([[t.affine_coef.color.r, t.affine_coef.color.g, t.affine_coef.color.b]
+                               for t in affine_transformations], dtype=np.float64)
+        symmetry_table = SymmetryTable(world, self.symmetry)
+        affine_table = AliasTable(self.weights.affine_weights(len(affine_transformations)))
+        hits = np.zeros(image.width * image.height, dtype=np.int64)
+        color_sums = np.zeros((image.channels, image.width * image.height), dtype=np.float64)
+
+        # Как и в render_one_sample, точка рисуется только на шагах step > 0
+        plotted = max(self.iter_per_sample - 1, 0)
+        longest = plotted // max(self.MIN_LANE_PLOTS_PER_WARMUP_STEP * self.steps_for_normalization, 1)
+        segments = max(1, min(longest, self.MAX_SEGMENTS))
+        lane_plotted = math.ceil(plotted / segments)
+        first_lane = first * segments
+        last_lane = (first + count) * segments
+        # Без запрошенных метрик время этапов собирается во временный объект: замер дешевле проверок
+        metrics = self.metrics if self.metrics is not None else RenderMetrics()
+        began = time.perf_counter()
+        lane_random = streams.lane_random()
+        discarded = 0
+        for start in range(first_lane, last_lane, self.batch_size):
+            lanes = np.arange(start, min(start + self.batch_size, last_lane))
+            discarded += self._render_batch(lane_random, lanes, lane_plotted, image, world, symmetry_table,
+                                            affine_table, coefficients, colors, hits, color_sums, metrics)
+
+        with metrics.stage("histogram"):
+            image.accumulate(hits, color_sums)
+        iterations = (last_lane - first_lane) * (self.steps_for_normalization + lane_plotted + 1)
+        metrics.count("iterations", iterations)
+        metrics.count("discarded", discarded)
+        metrics.add_worker(0, count, iterations, time.perf_counter() - began)
+        return discarded
+
+    def _render_batch(self, lane_random: LaneRandom, lanes: np.ndarray, plotted: int, image: FractalImage,
+                      world: Rect, symmetry_table: SymmetryTable, affine_table: AliasTable,
+                      coefficients: np.ndarray, colors: np.ndarray, hits: np.ndarray, color_sums: np.ndarray,
+                      metrics: RenderMetrics) -> int:
+        """
+        Проводит пачку дорожек через итерации хаос-игры.
+
+        :param lane_random: Генератор случайных чисел дорожек.
+        :param lanes: Глобальные индексы дорожек пачки.
+        :param plotted: Количество итераций после нормализации, на которых точки рисуются.
+        :param image: Изображение, определяющее размер гистограммы.
+        :param world: Прямоугольник мирового пространства.
+        :param symmetry_table: Таблица поворотов симметрии.
+        :param affine_table: Таблица выбора аффинных преобразований по весам.
+        :param coefficients: Коэффициенты (a, b, c, d, e, f) аффинных преобразований, по строке на каждое.
+        :param colors: Цвета аффинных преобразований, по строке на каждое (в режиме palette — их координаты цвета).
+        :param hits: Гистограмма попаданий (изменяется на месте).
+        :param color_sums: Суммы цветов по каналам (изменяются на месте).
+        :param metrics: Метрики, в которые добавляется время этапов.
+        :return: Количество отброшенных улетевших точек.
+        """
+        palette = self.color_mode is ColorMode.palette
+        rect_x, rect_y = float(world.x), float(world.y)
+        rect_width, rect_height = float(world.width), float(world.height)
+        keys = lane_random.lane_keys(lanes)
+        choose_variation = not self.weights.blend and len(self.variations) > 1
+
+        # Начальная точка берёт числа шага перед первым шагом нормализации
+        x = rect_x + lane_random.uniform(keys, -self.steps_for_normalization - 1, 0) * rect_width
+        y = rect_y + lane_random.uniform(keys, -self.steps_for_normalization - 1, 1) * rect_height
+        coordinate = np.full(lanes.shape[0], START_COORDINATE)
+        # Шаг, после которого дорожка снова рисует попадания (None, пока замен не было)
+        settle: Optional[np.ndarray] = None
+        discarded = 0
+        pending_pixels: list[np.ndarray] = []
+        pending_values: list[np.ndarray] = []
+        pending_size = 0
+        flush_size = max(self.MIN_FLUSH_SIZE, image.width * image.height)
+
+        clock = time.perf_counter
+        for step in range(-self.steps_for_normalization, plotted + 1):
+            started = clock()
+            affine_index = affine_table.pick_values(lane_random.uniform(keys, step, 0))
+            coef = coefficients[affine_index]
+            new_x = coef[:, 0] * x + coef[:, 1] * y + coef[:, 2]
+            new_y = coef[:, 3] * x + coef[:, 4] * y + coef[:, 5]
+            x, y = self._apply_variations(new_x, new_y,
+                                          lane_random.uniform(keys, step, 1) if choose_variation else None)
+            escaped, settle = self._reseed_escaped(lane_random, keys, x, y, world, settle, step)
+            discarded += escaped
+            if palette:
+                coordinate += (colors[affine_index] - coordinate) * COLOR_SPEED
+            iterated = clock()
+            if step <= 0:
+                metrics.add_time("warmup", iterated - started)
+                continue
+            metrics.add_time("iteration", iterated - started)
+
+            # Цвет попадания: координата цвета точки или индекс преобразования для таблицы цветов
+            lane_x, lane_y, lane_value = x, y, coordinate if palette else affine_index
+            if settle is not None and not (settled := settle < step).all():
+                lane_x, lane_y, lane_value = lane_x[settled], lane_y[settled], lane_value[settled]
+            sym_x, sym_y = symmetry_table.apply_batch(lane_x, lane_y)
+            sym_value = np.tile(lane_value, symmetry_table.symmetry)
+            expanded = clock()
+            metrics.add_time("symmetry", expanded - iterated)
+            metrics.count("plotted", sym_x.shape[0])
+
+            pixels, values = self._resolve_pixels(image, world, sym_x, sym_y, sym_value)
+            pending_pixels.append(pixels)
+            pending_values.append(values)
+            pending_size += pixels.shape[0]
+            metrics.add_time("pixel_resolution", clock() - expanded)
+            if pending_size >= flush_size:
+                with metrics.stage("histogram"):
+                    self._flush(pending_pixels, pending_values, None if palette else colors, hits, color_sums)
+                pending_size = 0
+
+        with metrics.stage("histogram"):
+            self._flush(pending_pixels, pending_values, None if palette else colors, hits, color_sums)
+        return discarded
+
+    @staticmethod
+    def _resolve_pixels(image: FractalImage, world: Rect, x: np.ndarray, y: np.ndarray,
+                        values: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Переводит точки в индексы пикселей изображения и отбрасывает точки за его пределами.
+
+        :param image: Изображение (или окно холста).
+        :param world: Прямоугольник мирового пространства.
+        :param x: Координаты X точек.
+        :param y: Координаты Y точек.
+        :param values: Значения попаданий (индексы преобразований или координаты цвета).
+        :return: Индексы пикселей в развёрнутом изображении и значения попавших точек.
+        """
+        rect_x, rect_y = float(world.x), float(world.y)
+        rect_width, rect_height = float(world.width), float(world.height)
+        inside = ((x >= rect_x) & (x < rect_x + rect_width)
+                  & (y >= rect_y) & (y < rect_y + rect_height))
+        px = ((x[inside] - rect_x) / rect_width * image.canvas_width).astype(np.int64)
+        py = ((y[inside] - rect_y) / rect_height * image.canvas_height).astype(np.int64)
+        # Защита от округления на правой/нижней границе прямоугольника
+        np.minimum(px, image.canvas_width - 1, out=px)
+        np.minimum(py, image.canvas_height - 1, out=py)
+        values = values[inside]
+        if image.is_window:
+            px -= image.offset_x
+            py -= image.offset_y
+            in_window = (px >= 0) & (px < image.width) & (py >= 0) & (py < image.height)
+            px, py, values = px[in_window], py[in_window], values[in_window]
+        return py * image.width + px, values
+
+    def _reseed_escaped(self, lane_random: LaneRandom, keys: np.ndarray, x: np.ndarray, y: np.ndarray, world: Rect,
+                        settle: Optional[np.ndarray], step: int) -> tuple[int, Optional[np.ndarray]]:
+        """
+        Заменяет улетевшие точки пачки новыми случайными точками мира.
+
+        Заменённые дорожки снова проходят steps_for_normalization шагов нормализации.
+
+        :param lane_random: Генератор случайных чисел дорожек.
+        :param keys: Ключи дорожек пачки.
+        :param x: Координаты X точек (изменяются на месте).
+        :param y: Координаты Y точек (изменяются на месте).
+        :param world: Прямоугольник мирового пространства.
+        :param settle: Шаг, после которого каждая дорожка рисует попадания, или None, если замен ещё не было.
+        :param step: Текущий шаг.
+        :return: Количество заменённых точек и обновлённый массив settle.
+        """
+        with np.errstate(over="ignore", invalid="ignore"):
+            alive = x * x + y * y < ESCAPE_RADIUS_SQUARED
+        if alive.all():
+            return 0, settle
+        dead = np.flatnonzero(~alive)
+        x[dead] = float(world.x) + lane_random.uniform(keys[dead], step, 2) * float(world.width)
+        y[dead] = float(world.y) + lane_random.uniform(keys[dead], step, 3) * float(world.height)
+        if settle is None:
+            settle = np.zeros(x.shape[0], dtype=np.int64)
+        settle[dead] = step + self.steps_for_normalization
+        return dead.shape[0], settle
+
+    def _apply_variations(self, x: np.ndarray, y: np.ndarray,
+                          values: Optional[np.ndarray]) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Применяет к каждой точке пачки случайно выбранную вариацию.
+
+        В режиме blend каждая точка проходит через все вариации, а результаты
+        складываются с весами.
+
+        :param x: Координаты X точек.
+        :param y: Координаты Y точек.
+        :param values: Случайные числа на [0, 1) для выбора вариации (не нужны в режиме blend и для одной вариации).
+        :return: Новые координаты X и Y.
+        """
+        if self.weights.blend:
+            res_x = np.zeros_like(x)
+            res_y = np.zeros_like(y)
+            weights = self.weights.variation_weights(len(self.variations))
+            for weight, variation in zip(weights, self.variations, strict=True):
+                variation_x, variation_y = variation.apply_batch(x, y)
+                res_x += weight * variation_x
+                res_y += weight * variation_y
+            return res_x, res_y
+        if values is None:
+            return self.variations[0].apply_batch(x, y)
+
+        variation_index = self.variation_table.pick_values(values)
+        res_x = np.empty_like(x)
+        res_y = np.empty_like(y)
+        for index, variation in enumerate(self.variations):
+            mask = variation_index == index
+            if mask.any():
+                res_x[mask], res_y[mask] = variation.apply_batch(x[mask], y[mask])
+        return res_x, res_y
+
+    @staticmethod
+    def _flush(pending_pixels: list[np.ndarray], pending_values: list[np.ndarray], colors: Optional[np.ndarray],
+               hits: np.ndarray, color_sums: np.ndarray) -> None:
+        """
+        Сбрасывает накопленные попадания в гистограмму.
+
+        :param pending_pixels: Индексы пикселей, в которые попали точки.
+        :param pending_values: Индексы аффинных преобразований или, если colors равен None, координаты цвета
+                               для каждого попадания.
+        :param colors: Таблица цветов аффинных преобразований (None в режиме palette).
+        :param hits: Гистограмма попаданий (изменяется на месте).
+        :param color_sums: Суммы цветов по каналам (изменяются на месте).
+        """
+        if not pending_pixels:
+            return
+        pixels = np.concatenate(pending_pixels)
+        values = np.concatenate(pending_values)
+        pending_pixels.clear()
+        pending_values.clear()
+
+        size = hits.shape[0]
+        hits += np.bincount(pixels, minlength=size)
+        if colors is None:
+            color_sums[0] += np.bincount(pixels, weights=values, minlength=size)
+            return
+        for channel in range(3):
+            color_sums[channel] += np.bincount(pixels, weights=colors[values, channel], minlength=size)
@@ -0,0 +1,233 @@
+import os
+import shutil
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import AbstractContextManager, nullcontext
+from pathlib import Path
+from typing import Any, Optional
+
+import numpy as np
+
+from src.model.color_mode import ColorMode
+from src.model.fractal_image import FractalImage
+from src.model.precision import Precision, get_precision, set_precision
+from src.model.rect import Rect
+from src.model.render_weights import RenderWeights
+from src.model.symmetry_table import SymmetryTable
+from src.renderer.abstract_renderer import AbstractRenderer, PassCallback, StopCondition
+from src.transforms.affine_transformation import AffineTransformation
+from src.transforms.transformation import Transformation
+from src.utils.random_utils import RandomStreams
+from src.utils.render_metrics import RenderMetrics
+
+
+class ProcessRenderer(AbstractRenderer):
+    """
+    Класс, реализующий рендеринг фрактала в пуле процессов.
+
+    Сэмплы делятся на равные части по числу процессов. Каждый процесс рендерит
+    свою часть в собственное изображение и возвращает гистограмму попаданий,
+    а родительский процесс один раз объединяет их в конце.
+
+    Если изображение отображено в память, каждый процесс пишет в собственные
+    отображённые файлы в подкаталоге каталога изображения, и гистограммы не
+    передаются между процессами: родительский процесс объединяет файлы блоками
+    и удаляет их. Общий буфер на все процессы не используется, так как
+    несинхронные приращения из разных процессов теряли бы попадания.
+
+    Если передан общий пул процессов, части сэмплов отправляются в него, и
+    пул не создаётся при каждом рендеринге (например, в пакетном режиме, где
+    один пул обслуживает все задания). Иначе render_image создаёт пул один
+    раз на все проходы: запуск процессов и передача им рендерера не
+    повторяются на каждом проходе.
+    """
+
+    workers: int
+    executor: Optional[Executor]
+
+    def __init__(self, steps_for_normalization: int, affine_count: int,
+                 samples: int, iter_per_sample: int, symmetry: int,
+                 variations: list[Transformation], workers: Optional[int] = None,
+                 seed: Optional[int] = None, executor: Optional[Executor] = None,
+                 weights: Optional[RenderWeights] = None,
+                 color_mode: ColorMode = ColorMode.rgb) -> None:
+        """
+        Конструктор для инициализации параметров рендеринга.
+
+        :param steps_for_normalization: Шаги нормализации.
+        :param affine_count: Количество аффинных преобразований.
+        :param samples: Количество выборок для рендеринга.
+        :param iter_per_sample: Количество итераций для каждой выборки.
+        :param symmetry: Симметрия фрактала (например, количество повторений).
+        :param variations: Список вариаций преобразований.
+        :param workers: Количество процессов (по умолчанию — число ядер).
+        :param seed: Зерно генератора случайных чисел.
+        :param executor: Общий пул процессов (по умолчанию пул создаётся на время рендеринга).
+        :param weights: Веса вариаций и аффинных преобразований (по умолчанию выбор равномерный).
+        :param color_mode: Способ окраски попаданий.
+        """
+        super().__init__(steps_for_normalization, affine_count, samples, iter_per_sample, symmetry, variations, seed,
+                         weights, color_mode)
+        if workers is not None and workers <= 0:
+            raise ValueError("Workers count must be greater than 0.")
+        self.workers = workers or os.cpu_count() or 1
+        self.executor = executor
+
+    def __getstate__(self) -> dict[str, Any]:
+        """
+        Возвращает состояние рендерера для передачи в процесс без общего пула.
+        """
+        state = self.__dict__.copy()
+        state["executor"] = None
+        return state
+
+    def render_image(self, image: FractalImage, world: Rect, affine_transformations: list[AffineTransformation],
+                     streams: Optional[RandomStreams] = None, passes: int = 1,
+                     on_pass: Optional[PassCallback] = None, first: int = 0,
+                     until: Optional[StopCondition] = None) -> None:
+        """
+        Рендерит сэмплы с индексами [first, samples) в изображение (см. AbstractRenderer.render_image).
+
+        Без общего пула пул процессов создаётся на время рендеринга и
+        используется всеми проходами как общий.
+
+        :param image: Изображение, в которое записывается результат.
+        :param world: Прямоугольник мирового пространства.
+        :param affine_transformations: Список аффинных преобразований.
+        :param streams: Потоки случайных чисел (по умолчанию создаются из зерна рендерера).
+        :param passes: Количество проходов.
+        :param on_pass: Функция, вызываемая после каждого прохода.
+        :param first: Индекс первого сэмпла (количество уже отрендеренных сэмплов).
+        :param until: Условие досрочной остановки, проверяемое после каждого прохода.
+        """
+        if self.executor is not None:
+            super().render_image(image, world, affine_transformations, streams, passes, on_pass, first, until)
+            return
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            self.executor = executor
+            try:
+                super().render_image(image, world, affine_transformations, streams, passes, on_pass, first, until)
+            finally:
+                self.executor = None
+
+    def render_samples(self, image: FractalImage, world: Rect, affine_transformations: list[AffineTransformation],
+                       streams: RandomStreams, first: int, count: int) -> int:
+        """
+        Рендерит фрактал в пуле процессов и объединяет гистограммы процессов.
+
+        Гистограммы объединяются в порядке частей, поэтому при одинаковом зерне
+        и числе процессов результат побитово повторяется.
+
+        :param image: Фрактальное изображение, которое будет рендериться.
+        :param world: Прямоугольник, определяющий область видимости фрактала.
+        :param affine_transformations: Список аффинных преобразований.
+        :param streams: Потоки случайных чисел.
+        :param first: Индекс первого сэмпла.
+        :param count: Количество сэмплов.
+        :return: Количество отброшенных улетевших точек.
+        """
+        chunks = self.split_samples(first, count, self.workers)
+        if image.directory is not None:
+            return self._render_mapped(image, world, affine_transformations, streams, chunks)
+
+        hits = np.zeros(image.width * image.height, dtype=np.int64)
+        color_sums = np.zeros((image.channels, image.width * image.height), dtype=np.float64)
+        discarded = 0
+
+        with self._pool(len(chunks)) as executor:
+            tasks = [executor.submit(_render_chunk, self, image.geometry, world,
+                                     affine_transformations, streams, chunk_first, chunk_count, get_precision(),
+                                     worker=worker)
+                     for worker, (chunk_first, chunk_count) in enumerate(chunks)]
+            for task in tasks:
+                histogram, chunk_discarded, chunk_metrics = task.result()
+                chunk_hits, chunk_color_sums = histogram
+                hits += chunk_hits
+                color_sums += chunk_color_sums
+                discarded += chunk_discarded
+                self.merge_worker_metrics(chunk_metrics)
+
+        image.accumulate(hits, color_sums)
+        return discarded
+
+    def _render_mapped(self, image: FractalImage, world: Rect, affine_transformations: list[AffineTransformation],
+                       streams: RandomStreams, chunks: list[tuple[int, int]]) -> int:
+        """
+        Рендерит части сэмплов в отображённые в память файлы процессов и объединяет их с изображением.
+
+        :param image: Отображённое в память изображение.
+        :param world: Прямоугольник мирового пространства.
+        :param affine_transformations: Список аффинных преобразований.
+        :param streams: Потоки случайных чисел.
+        :param chunks: Части сэмплов (индекс первого сэмпла, количество).
+        :return: Количество отброшенных улетевших точек.
+        """
+        discarded = 0
+        directories = [image.directory / f"worker_{index}" for index in range(len(chunks))]
+        with self._pool(len(chunks)) as executor:
+            tasks = [executor.submit(_render_chunk, self, image.geometry, world, affine_transformations, streams,
+                                     chunk_first, chunk_count, get_precision(), directory, worker)
+                     for worker, ((chunk_first, chunk_count), directory)
+                     in enumerate(zip(chunks, directories, strict=True))]
+            for task, directory in zip(tasks, directories, strict=True):
+                _, chunk_discarded, chunk_metrics = task.result()
+                discarded += chunk_discarded
+                self.merge_worker_metrics(chunk_metrics)
+                image.merge(FractalImage.open_mapped(directory))
+                shutil.rmtree(directory)
+        image.flush()
+        return discarded
+
+    def _pool(self, tasks: int) -> AbstractContextManager[Executor]:
+        """
+        Возвращает контекст с пулом процессов: общий пул или новый пул на tasks процессов.
+
+        :param tasks: Количество задач рендеринга.
+        :return: Контекстный менеджер пула.
+        """
+        if self.executor is not None:
+            return nullcontext(self.executor)
+        return ProcessPoolExecutor(max_workers=tasks or 1)
+
+
+def _render_chunk(renderer: ProcessRenderer, geometry: tuple[int, ...], world: Rect,
+                  affine_transformations: list[AffineTransformation], streams: RandomStreams,
+                  first: int, count: int, precision: Precision,
+                  directory: Optional[Path] = None, worker: int = 0,
+                  ) -> tuple[Optional[tuple[np.ndarray, np.ndarray]], int, Optional[RenderMetrics]]:
+    """
+    Рендерит часть сэмплов в собственном процессе.
+
+    :param renderer: Рендерер, параметры которого используются для рендеринга.
+    :param geometry: Размеры и положение изображения на холсте (FractalImage.geometry).
+    :param world: Прямоугольник мирового пространства.
+    :param affine_transformations: Список аффинных преобразований.
+    :param streams: Потоки случайных чисел.
+    :param first: Индекс первого сэмпла части.
+    :param count: Количество сэмплов в части.
+    :param precision: Режим точности родительского процесса.
+    :param directory: Каталог для отображённого в память изображения процесса.
+    :param worker: Номер процесса для метрик.
+    :return: Гистограмма попаданий и суммы цветов по каналам (или None, если изображение записано в directory)
+             количество отброшенных улетевших точек и метрики процесса (None, если метрики не собираются).
+    """
+    set_precision(precision)
+    channels = renderer.color_mode.channels
+    if directory is None:
+        image = FractalImage.create(*geometry, channels=channels)
+    else:
+        image = FractalImage.create_mapped(directory, *geometry, channels=channels)
+    symmetry_table = SymmetryTable(world, renderer.symmetry)
+    pipeline = renderer.compile_pipeline(affine_transformations)
+    # Метрики рендерера скопированы из родительского процесса; процесс собирает собственные, пустые
+    metrics = RenderMetrics() if renderer.metrics is not None else None
+    discarded = 0
+    start = time.perf_counter()
+    for index in range(first, first + count):
+        discarded += renderer.render_one_sample(image, world, affine_transformations, streams.sample_random(index),
+                                                symmetry_table, pipeline, metrics)
+    renderer.record_worker(metrics, worker, count, start)
+    if directory is not None:
+        image.flush()
+        return None, discarded, metrics
+    return image.histogram(), discarded, metrics
@@ -1,7 +1,14 @@
+import time
+from typing import Optional
+
+from src.model.color_mode import ColorMode
 from src.model.fractal_image import FractalImage
 from src.model.rect import Rect
+from src.model.render_weights import RenderWeights
+from src.model.symmetry_table import SymmetryTable
 from src.transforms.affine_transformation import AffineTransformation
 from src.transforms.transformation import Transformation
+from src.utils.random_utils import RandomStreams
 
 from .abstract_renderer import AbstractRenderer
 
@@ -14,7 +21,9 @@ class SingleThreadRenderer(AbstractRenderer):
     """
 
     def __init__(self, steps_for_normalization: int, affine_count: int, samples: int,
-                 iter_per_sample: int, symmetry: int, variations: list[Transformation]) -> None:
+                 iter_per_sample: int, symmetry: int, variations: list[Transformation],
+                 seed: Optional[int] = None, weights: Optional[RenderWeights] = None,
+                 color_mode: ColorMode = ColorMode.rgb) -> None:
         """
         Инициализирует параметры рендеринга.
 
@@ -24,12 +33,15 @@ class SingleThreadRenderer(AbstractRenderer):
         :param iter_per_sample: Количество итераций на каждый сэмпл.
         :param symmetry: Симметрия фрактала (например, количество повторений).
         :param variations: Список вариаций преобразований.
+        :param seed: Зерно генератора случайных чисел.
+        :param weights: Веса вариаций и аффинных преобразований (по умолчанию выбор равномерный).
+        :param color_mode: Способ окраски попаданий.
         """
-        super().__init__(steps_for_normalization, affine_count, iter_per_sample, symmetry, variations)
-        self.samples = samples
+        super().__init__(steps_for_normalization, affine_count, samples, iter_per_sample, symmetry, variations, seed,
+                         weights, color_mode)
 
-    def render_image(self, image: FractalImage, world: Rect,
-                     affine_transformations: list[AffineTransformation]) -> None:
+    def render_samples(self, image: FractalImage, world: Rect, affine_transformations: list[AffineTransformation],
+                       streams: RandomStreams, first: int, count: int) -> int:
         """
         Рендерит фрактал, выполняя заданное количество сэмплов последовательно.
 
@@ -38,6 +50,17 @@ class SingleThreadRenderer(AbstractRenderer):
         :param image: Фрактальное изображение, которое будет рендериться.
         :param world: Прямоугольник, определяющий область видимости фрактала.
         :param affine_transformations: Список аффинных преобразований, которые будут применяться к фракталу.
+        :param streams: Потоки случайных чисел.
+        :param first: Индекс первого сэмпла.
+        :param count: Количество сэмплов.
+        :return: Количество отброшенных улетевших точек.
         """
-        for _ in range(self.samples):
-            self.render_one_sample(image, world, affine_transformations)
+        symmetry_table = SymmetryTable(world, self.symmetry)
+        pipeline = self.compile_pipeline(affine_transformations)
+        discarded = 0
+        start = time.perf_counter()
+        for index in range(first, first + count):
+            discarded += self.render_one_sample(image, world, affine_transformations, streams.sample_random(index),
+                                                symmetry_table, pipeline, self.metrics)
+        self.record_worker(self.metrics, 0, count, start)
+        return discarded
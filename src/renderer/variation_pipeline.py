@@ -0,0 +1,281 @@
+import random
+import time
+from collections.abc import Callable
+from typing import Final, Optional
+
+from src.model.color import Color
+from src.model.color_mode import COLOR_SPEED, START_COORDINATE, ColorMode
+from src.model.fractal_image import FractalImage
+from src.model.precision import Number, Precision, get_precision, number
+from src.model.rect import Rect
+from src.model.render_weights import RenderWeights
+from src.model.symmetry_table import SymmetryTable
+from src.transforms.affine_transformation import AffineTransformation
+from src.transforms.transformation import Transformation
+from src.utils import random_utils
+from src.utils.alias_table import AliasTable
+from src.utils.render_metrics import RenderMetrics
+
+# Точка дальше этого расстояния от начала координат считается улетевшей: в мир она уже не вернётся
+ESCAPE_RADIUS: Final[float] = 1e10
+ESCAPE_RADIUS_SQUARED: Final[float] = ESCAPE_RADIUS * ESCAPE_RADIUS
+
+# Состояние точки сэмпла: координаты, цвет (или координата цвета) и шаг, после которого рисуются попадания
+SampleState = tuple[Number, Number, float | Color, int]
+# Попадание до применения симметрии: координаты и цвет (или координата цвета)
+PlottedPoint = tuple[Number, Number, float | Color]
+
+
+class VariationPipeline:
+    """
+    Скомпилированный конвейер итераций хаос-игры.
+
+    Коэффициенты и цвета аффинных преобразований и функции apply_xy вариаций
+    собираются один раз на рендеринг в таблицы, а сэмпл выполняется одним
+    циклом по координатам: без создания объектов Point на каждой итерации и
+    без вспомогательных вызовов выбора случайного элемента. Новой вариации
+    по-прежнему достаточно реализовать apply (см. Transformation.apply_xy).
+
+    Аффинное преобразование и вариация выбираются по таблицам псевдонимов
+    за O(1) на шаг при любом количестве вариаций; в режиме blend вместо
+    выбора вариации складываются результаты всех вариаций с весами. При
+    равных весах случайные числа запрашиваются и используются так же, как
+    при равномерном выборе, поэтому при одинаковом зерне изображение не
+    меняется.
+
+    В режиме palette вместо цвета преобразования точка несёт одно число —
+    координату цвета, которая на каждом шаге сдвигается к координате
+    выбранного преобразования и записывается в попадание.
+
+    Вариации вроде Exp, Spherical и Hyperbolic могут унести точку в
+    бесконечность или NaN. Такая точка заменяется новой случайной точкой
+    мира и снова проходит нормализацию, прежде чем рисовать попадания.
+    """
+
+    # Количество шагов, попадания которых собираются перед отдельно измеряемыми этапами рисования
+    TIMED_BLOCK_STEPS: Final[int] = 4096
+
+    affines: list[tuple[Number, Number, Number, Number, Number, Number]]
+    colors: list[Color] | list[float]
+    palette: bool
+    variations: list[Callable[[Number, Number], tuple[Number, Number]]]
+    affine_table: AliasTable
+    variation_table: AliasTable
+    convert: bool
+
+    def __init__(self, affine_transformations: list[AffineTransformation],
+                 variations: list[Transformation], weights: Optional[RenderWeights] = None,
+                 color_mode: ColorMode = ColorMode.rgb) -> None:
+        """
+        Компилирует конвейер.
+
+        :param affine_transformations: Аффинные преобразования.
+        :param variations: Вариации.
+        :param weights: Веса вариаций и аффинных преобразований (по умолчанию выбор равномерный).
+        :param color_mode: Способ окраски попаданий.
+        """
+        weights = weights or RenderWeights()
+        self.affines = [(t.affine_coef.a, t.affine_coef.b, t.affine_coef.c,
+                         t.affine_coef.d, t.affine_coef.e, t.affine_coef.f) for t in affine_transformations]
+        self.palette = color_mode is ColorMode.palette
+        if self.palette:
+            self.colors = [t.affine_coef.color_coordinate for t in affine_transformations]
+        else:
+            self.colors = [t.affine_coef.color for t in affine_transformations]
+        self.affine_table = AliasTable(weights.affine_weights(len(affine_transformations)))
+        variation_weights = weights.variation_weights(len(variations))
+        if weights.blend:
+            # Смесь вариаций — одна составная вариация, выбор которой всегда даёт её саму
+            self.variations = [self._blend([number(weight) for weight in variation_weights],
+                                           [variation.apply_xy for variation in variations])]
+            self.variation_table = AliasTable([1.0])
+        else:
+            self.variations = [variation.apply_xy for variation in variations]
+            self.variation_table = AliasTable(variation_weights)
+        # Вариации считают через math и возвращают float; в режиме decimal координаты приводятся обратно
+        self.convert = get_precision() is Precision.decimal
+
+    def render_sample(self, image: FractalImage, world: Rect, steps_for_normalization: int, iter_per_sample: int,
+                      symmetry_table: SymmetryTable, random_instance: Optional[random.Random] = None,
+                      metrics: Optional[RenderMetrics] = None) -> int:
+        """
+        Выполняет один сэмпл и записывает попадания в изображение.
+
+        Если заданы метрики, шаги нормализации и шаги с записью попаданий
+        выполняются отдельными отрезками, чтобы не обращаться к часам на
+        каждом шаге. Попадания отрезка из TIMED_BLOCK_STEPS шагов сначала
+        собираются, а затем проходят симметрию, поиск пикселей и запись в
+        изображение, и время каждого этапа измеряется отдельно. Порядок
+        попаданий тот же, поэтому изображение не меняется.
+
+        :param image: Изображение, в которое записывается результат.
+        :param world: Прямоугольник мирового пространства.
+        :param steps_for_normalization: Количество шагов до начала записи попаданий.
+        :param iter_per_sample: Количество итераций сэмпла.
+        :param symmetry_table: Таблица поворотов симметрии.
+        :param random_instance: Генератор случайных чисел сэмпла (по умолчанию — глобальный).
+        :param metrics: Метрики, в которые добавляются время и счётчики сэмпла.
+        :return: Количество отброшенных улетевших точек.
+        """
+        start = time.perf_counter()
+        point = random_utils.get_random_point(world, random_instance)
+        state: SampleState = (point.x, point.y, START_COORDINATE, 0)
+        if metrics is None:
+            _, discarded, _ = self._run_steps(range(-steps_for_normalization, iter_per_sample), state, image, world,
+                                              steps_for_normalization, symmetry_table, random_instance)
+            return discarded
+
+        boundary = min(1, iter_per_sample)
+        state, discarded, _ = self._run_steps(range(-steps_for_normalization, boundary), state, image, world,
+                                              steps_for_normalization, symmetry_table, random_instance)
+        metrics.add_time("warmup", time.perf_counter() - start)
+        plotted = 0
+        for block in range(boundary, iter_per_sample, self.TIMED_BLOCK_STEPS):
+            started = time.perf_counter()
+            points: list[PlottedPoint] = []
+            state, block_discarded, block_plotted = self._run_steps(
+                range(block, min(block + self.TIMED_BLOCK_STEPS, iter_per_sample)), state, image, world,
+                steps_for_normalization, symmetry_table, random_instance, points)
+            metrics.add_time("iteration", time.perf_counter() - started)
+            self._plot_timed(points, image, world, symmetry_table, metrics)
+            discarded += block_discarded
+            plotted += block_plotted
+        metrics.count("iterations", steps_for_normalization + iter_per_sample)
+        metrics.count("plotted", plotted * symmetry_table.symmetry)
+        metrics.count("discarded", discarded)
+        return discarded
+
+    @staticmethod
+    def _plot_timed(points: list[PlottedPoint], image: FractalImage, world: Rect, symmetry_table: SymmetryTable,
+                    metrics: RenderMetrics) -> None:
+        """
+        Записывает собранные попадания в изображение, измеряя время симметрии, поиска пикселей и записи.
+
+        :param points: Попадания в порядке шагов.
+        :param image: Изображение, в которое записывается результат.
+        :param world: Прямоугольник мирового пространства.
+        :param symmetry_table: Таблица поворотов симметрии.
+        :param metrics: Метрики, в которые добавляется время этапов.
+        """
+        with metrics.stage("symmetry"):
+            if symmetry_table.symmetry > 1:
+                center_x, center_y = symmetry_table.center_x, symmetry_table.center_y
+                copies = [(dx * cos - dy * sin + center_x, dx * sin + dy * cos + center_y, color)
+                          for dx, dy, color in ((x - center_x, y - center_y, color) for x, y, color in points)
+                          for cos, sin in symmetry_table.rotations]
+            else:
+                copies = points
+        with metrics.stage("pixel_resolution"):
+            pixel_index = image.pixel_index
+            hits = [(index, color) for x, y, color in copies if (index := pixel_index(world, x, y)) is not None]
+        with metrics.stage("histogram"):
+            add_hit = image.add_hit
+            for index, color in hits:
+                add_hit(index, color)
+
+    def _run_steps(self, steps: range, state: SampleState, image: FractalImage, world: Rect,
+                   steps_for_normalization: int, symmetry_table: SymmetryTable,
+                   random_instance: Optional[random.Random],
+                   collect: Optional[list[PlottedPoint]] = None) -> tuple[SampleState, int, int]:
+        """
+        Выполняет шаги сэмпла с номерами из steps; попадания рисуются на шагах с положительным номером.
+
+        :param steps: Номера шагов (отрицательные — шаги нормализации).
+        :param state: Состояние точки: координаты, цвет и шаг, после которого рисуются попадания.
+        :param image: Изображение, в которое записывается результат.
+        :param world: Прямоугольник мирового пространства.
+        :param steps_for_normalization: Количество шагов нормализации после замены улетевшей точки.
+        :param symmetry_table: Таблица поворотов симметрии.
+        :param random_instance: Генератор случайных чисел сэмпла.
+        :param collect: Список, в который попадания добавляются до симметрии вместо записи в изображение.
+        :return: Состояние точки после шагов, количество отброшенных точек и количество шагов с попаданиями.
+        """
+        x, y, color, settle = state
+        uniform = (random_instance or random).uniform
+        affines, colors = self.affines, self.colors
+        affine_count = len(affines)
+        affine_probabilities, affine_aliases = self.affine_table.probabilities, self.affine_table.aliases
+        variation_count = len(self.variations)
+        variation_probabilities, variation_aliases = self.variation_table.probabilities, self.variation_table.aliases
+        variations = self.variations
+        convert = self.convert
+        palette = self.palette
+        plot = image.plot if collect is None else self._collector(collect)
+        symmetric = collect is None and symmetry_table.symmetry > 1
+        rotations = symmetry_table.rotations
+        center_x, center_y = symmetry_table.center_x, symmetry_table.center_y
+        # Попадания рисуются на шагах после settle; после замены улетевшей точки нормализация повторяется
+        discarded = 0
+        plotted = 0
+        for step in steps:
+            value = uniform(0, affine_count)
+            index = int(value)
+            if value - index >= affine_probabilities[index]:
+                index = affine_aliases[index]
+            a, b, c, d, e, f = affines[index]
+            affine_x, affine_y = a * x + b * y + c, d * x + e * y + f
+            value = uniform(0, variation_count)
+            variation_index = int(value)
+            if value - variation_index >= variation_probabilities[variation_index]:
+                variation_index = variation_aliases[variation_index]
+            try:
+                x, y = variations[variation_index](affine_x, affine_y)
+                # NaN не проходит сравнение; переполнение и деление на ноль вызывают исключение
+                escaped = not x * x + y * y < ESCAPE_RADIUS_SQUARED
+            except ArithmeticError:
+                escaped = True
+            if escaped:
+                discarded += 1
+                point = random_utils.get_random_point(world, random_instance)
+                x, y = point.x, point.y
+                settle = step + steps_for_normalization
+                continue
+            if convert:
+                x, y = number(x), number(y)
+            color = color + (colors[index] - color) * COLOR_SPEED if palette else colors[index]
+            if step > settle:
+                plotted += 1
+                if symmetric:
+                    # Повороты те же, что в SymmetryTable.apply, но без объектов Point
+                    dx, dy = x - center_x, y - center_y
+                    for cos, sin in rotations:
+                        plot(world, dx * cos - dy * sin + center_x, dx * sin + dy * cos + center_y, color)
+                else:
+                    plot(world, x, y, color)
+        return (x, y, color, settle), discarded, plotted
+
+    @staticmethod
+    def _collector(collect: list[PlottedPoint]) -> Callable[[Rect, Number, Number, float | Color], None]:
+        """
+        Возвращает функцию с сигнатурой FractalImage.plot, которая добавляет попадания в список.
+
+        :param collect: Список попаданий.
+        :return: Функция записи попадания.
+        """
+        def plot(_: Rect, x: Number, y: Number, color: float | Color) -> None:
+            collect.append((x, y, color))
+
+        return plot
+
+    @staticmethod
+    def _blend(weights: list[Number], variations: list[Callable[[Number, Number], tuple[Number, Number]]],
+               ) -> Callable[[Number, Number], tuple[Number, Number]]:
+        """
+        Собирает вариацию, складывающую результаты вариаций с весами.
+
+        :param weights: Веса вариаций.
+        :param variations: Функции apply_xy вариаций.
+        :return: Функция apply_xy смеси.
+        """
+        blended = list(zip(weights, variations, strict=True))
+        zero = number(0)
+
+        def apply_xy(x: Number, y: Number) -> tuple[Number, Number]:
+            result_x = result_y = zero
+            for weight, variation in blended:
+                variation_x, variation_y = variation(x, y)
+                result_x += weight * number(variation_x)
+                result_y += weight * number(variation_y)
+            return result_x, result_y
+
+        return apply_xy
@@ -0,0 +1,24 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class EncoderOptions:
+    """
+    Параметры кодировщиков изображений.
+
+    Позволяют выбирать между временем кодирования и размером файла.
+    """
+
+    png_compress_level: int = 6  # 0 — без сжатия, 9 — максимальное сжатие
+    jpeg_quality: int = 75
+    webp_quality: int = 80
+    webp_lossless: bool = False
+
+    @classmethod
+    def fast(cls) -> "EncoderOptions":
+        """
+        Возвращает параметры самого быстрого кодирования (например, для промежуточных превью).
+
+        :return: Параметры кодировщиков.
+        """
+        return cls(png_compress_level=1, jpeg_quality=50, webp_quality=50)
@@ -1,19 +1,29 @@
 from pathlib import Path
+from typing import Optional
 
+import numpy as np
 from PIL import Image
 
 from src.model.fractal_image import FractalImage
+from src.saver.encoder_options import EncoderOptions
+from src.saver.image_format import ImageFormat
 from src.saver.image_saver import ImageSaver
+from src.utils.render_metrics import RenderMetrics
 
 
 class FormatImageSaver(ImageSaver):
-    def __init__(self, image_format: str) -> None:
+    def __init__(self, image_format: str, options: Optional[EncoderOptions] = None,
+                 metrics: Optional[RenderMetrics] = None) -> None:
         """
         Класс для сохранения фрактального изображения в файл в указанном формате.
 
-        :param image_format: Формат изображения (например, 'png', 'bmp', 'jpeg').
+        :param image_format: Формат изображения (например, 'png', 'bmp', 'jpg', 'webp').
+        :param options: Параметры кодировщиков (по умолчанию — параметры Pillow).
+        :param metrics: Метрики, в которые добавляется время преобразования в PIL Image и кодирования.
         """
-        self.format = image_format
+        self.format = ImageFormat.parse(image_format)
+        self.options = options or EncoderOptions()
+        self.metrics = metrics
 
     def save(self, image: FractalImage, path: Path) -> None:
         """
@@ -22,22 +32,21 @@ class FormatImageSaver(ImageSaver):
         :param image: Фрактальное изображение, которое нужно сохранить.
         :param path: Путь, по которому нужно сохранить изображение.
         """
-        rendered_image = self._convert_fractal_image_to_pil_image(image)
-        rendered_image.save(path, format=self.format)
+        with RenderMetrics.measure(self.metrics, "pil_conversion"):
+            rendered_image = self._convert_fractal_image_to_pil_image(image)
+        with RenderMetrics.measure(self.metrics, "encoding"):
+            rendered_image.save(path, format=self.format.pil_format, **self.format.save_options(self.options))
 
     @staticmethod
     def _convert_fractal_image_to_pil_image(image: FractalImage) -> Image:
         """
         Преобразует фрактальное изображение в объект PIL Image.
 
+        Изображение строится целиком из непрерывного буфера RGB-канала, без
+        обращения к отдельным пикселям.
+
         :param image: Фрактальное изображение, которое нужно преобразовать.
         :return: Объект PIL Image.
         """
-        pil_image = Image.new("RGB", (image.width, image.height))
-        for y in range(image.height):
-            for x in range(image.width):
-                pixel = image.pixel(x, y)
-                if pixel is not None:
-                    color = (pixel.red, pixel.green, pixel.blue)
-                    pil_image.putpixel((x, y), color)
-        return pil_image
+        buffer = np.ascontiguousarray(image.rgb, dtype=np.uint8)
+        return Image.frombuffer("RGB", (image.width, image.height), buffer, "raw", "RGB", 0, 1)
@@ -1,10 +1,51 @@
 from enum import Enum
+from typing import Any
+
+from src.saver.encoder_options import EncoderOptions
 
 
 class ImageFormat(Enum):
     png = "png"
     bmp = "bmp"
     jpeg = "jpg"
+    webp = "webp"
 
     def __init__(self, format_name: str) -> None:
         self.format_name = format_name
+
+    @classmethod
+    def parse(cls, name: str) -> "ImageFormat":
+        """
+        Возвращает формат по расширению файла или имени формата (например, 'jpg' или 'jpeg').
+
+        :param name: Расширение или имя формата.
+        :return: Формат изображения.
+        """
+        name = name.lower()
+        for image_format in cls:
+            if name in (image_format.format_name, image_format.name):
+                return image_format
+        message = f"Unsupported image format: {name}"
+        raise ValueError(message)
+
+    @property
+    def pil_format(self) -> str:
+        """
+        Возвращает имя формата в терминах Pillow.
+        """
+        return self.name.upper()
+
+    def save_options(self, options: EncoderOptions) -> dict[str, Any]:
+        """
+        Возвращает параметры кодировщика Pillow для данного формата.
+
+        :param options: Параметры кодировщиков.
+        :return: Словарь именованных аргументов для Image.save.
+        """
+        if self is ImageFormat.png:
+            return {"compress_level": options.png_compress_level}
+        if self is ImageFormat.jpeg:
+            return {"quality": options.jpeg_quality}
+        if self is ImageFormat.webp:
+            return {"quality": options.webp_quality, "lossless": options.webp_lossless}
+        return {}
@@ -0,0 +1,108 @@
+import struct
+import zlib
+from pathlib import Path
+from types import TracebackType
+from typing import BinaryIO, Final, Optional
+
+import numpy as np
+
+
+class PngStreamWriter:
+    """
+    Потоковая запись RGB-изображения в PNG.
+
+    Строки передаются сверху вниз порциями и сразу сжимаются zlib в блоки
+    IDAT, поэтому в памяти никогда не находится всё изображение целиком.
+    Используется как контекстный менеджер.
+    """
+
+    SIGNATURE: Final[bytes] = b"\x89PNG\r\n\x1a\n"
+    BIT_DEPTH: Final[int] = 8
+    COLOR_TYPE_RGB: Final[int] = 2
+    FILTER_NONE: Final[int] = 0
+    # Размер блока IDAT, после которого сжатые данные записываются в файл
+    CHUNK_SIZE: Final[int] = 1 << 20
+
+    path: Path
+    width: int
+    height: int
+    compress_level: int
+    rows_written: int
+
+    def __init__(self, path: Path, width: int, height: int, compress_level: int = 6) -> None:
+        """
+        Создает потоковую запись PNG.
+
+        :param path: Путь файла.
+        :param width: Ширина изображения.
+        :param height: Высота изображения.
+        :param compress_level: Уровень сжатия zlib (0-9).
+        """
+        if width <= 0 or height <= 0:
+            raise ValueError("Image size must be greater than 0.")
+        self.path = path
+        self.width = width
+        self.height = height
+        self.compress_level = compress_level
+        self.rows_written = 0
+        self._file: Optional[BinaryIO] = None
+        self._compressor = zlib.compressobj(compress_level)
+        self._pending: list[bytes] = []
+        self._pending_size = 0
+
+    def __enter__(self) -> "PngStreamWriter":
+        self._file = self.path.open("wb")
+        self._file.write(self.SIGNATURE)
+        self._write_chunk(b"IHDR", struct.pack(">IIBBBBB", self.width, self.height, self.BIT_DEPTH,
+                                               self.COLOR_TYPE_RGB, 0, 0, 0))
+        return self
+
+    def __exit__(self, exc_type: Optional[type[BaseException]], exc_value: Optional[BaseException],
+                 traceback: Optional[TracebackType]) -> None:
+        try:
+            if exc_type is None:
+                if self.rows_written != self.height:
+                    message = f"Expected {self.height} rows, got {self.rows_written}"
+                    raise ValueError(message)
+                self._append(self._compressor.flush())
+                self._flush_pending()
+                self._write_chunk(b"IEND", b"")
+        finally:
+            self._file.close()
+
+    def write_rows(self, rows: np.ndarray) -> None:
+        """
+        Дописывает очередные строки изображения.
+
+        :param rows: Массив uint8 формы (количество строк, width, 3).
+        """
+        if rows.shape[1:] != (self.width, 3):
+            message = f"Rows must have shape (n, {self.width}, 3), got {rows.shape}"
+            raise ValueError(message)
+        if self.rows_written + rows.shape[0] > self.height:
+            raise ValueError("Too many rows written.")
+        # Первый байт каждой строки PNG — тип фильтра
+        scanlines = np.empty((rows.shape[0], 1 + 3 * self.width), dtype=np.uint8)
+        scanlines[:, 0] = self.FILTER_NONE
+        scanlines[:, 1:] = rows.reshape(rows.shape[0], -1)
+        self._append(self._compressor.compress(scanlines.tobytes()))
+        self.rows_written += rows.shape[0]
+        if self._pending_size >= self.CHUNK_SIZE:
+            self._flush_pending()
+
+    def _append(self, data: bytes) -> None:
+        if data:
+            self._pending.append(data)
+            self._pending_size += len(data)
+
+    def _flush_pending(self) -> None:
+        if self._pending:
+            self._write_chunk(b"IDAT", b"".join(self._pending))
+            self._pending.clear()
+            self._pending_size = 0
+
+    def _write_chunk(self, chunk_type: bytes, data: bytes) -> None:
+        self._file.write(struct.pack(">I", len(data)))
+        self._file.write(chunk_type)
+        self._file.write(data)
+        self._file.write(struct.pack(">I", zlib.crc32(data, zlib.crc32(chunk_type))))
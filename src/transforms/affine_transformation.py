@@ -1,5 +1,8 @@
+import numpy as np
+
 from src.model.affine_coef import AffineCoefficient
 from src.model.point import Point
+from src.model.precision import Number
 from src.transforms.transformation import Transformation
 
 
@@ -10,8 +13,13 @@ class AffineTransformation(Transformation):
         self.affine_coef = affine_coef
 
     def apply(self, point: Point) -> Point:
-        x = (self.affine_coef.a * point.x +
-             self.affine_coef.b * point.y + self.affine_coef.c)
-        y = (self.affine_coef.d * point.x +
-             self.affine_coef.e * point.y + self.affine_coef.f)
-        return Point(x, y)
+        return Point(*self.apply_xy(point.x, point.y))
+
+    def apply_xy(self, x: Number, y: Number) -> tuple[Number, Number]:
+        coef = self.affine_coef
+        return coef.a * x + coef.b * y + coef.c, coef.d * x + coef.e * y + coef.f
+
+    def apply_batch(self, x: np.ndarray, y: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        a, b, c = float(self.affine_coef.a), float(self.affine_coef.b), float(self.affine_coef.c)
+        d, e, f = float(self.affine_coef.d), float(self.affine_coef.e), float(self.affine_coef.f)
+        return a * x + b * y + c, d * x + e * y + f
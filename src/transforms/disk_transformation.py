@@ -1,12 +1,23 @@
 import math
 
+import numpy as np
+
 from src.model.point import Point
+from src.model.precision import Number
 from src.transforms.transformation import Transformation
 
 
 class DiskTransformation(Transformation):
     def apply(self, point: Point) -> Point:
-        r = math.sqrt(point.x ** 2 + point.y ** 2)
-        dx = 1 / math.pi * math.atan(point.y / point.x) * math.sin(math.pi * r)
-        dy = 1 / math.pi * math.atan(point.y / point.x) * math.cos(math.pi * r)
-        return Point(dx, dy)
+        return Point(*self.apply_xy(point.x, point.y))
+
+    def apply_xy(self, x: Number, y: Number) -> tuple[Number, Number]:
+        r = math.sqrt(x ** 2 + y ** 2)
+        o = 1 / math.pi * math.atan(y / x)
+        return o * math.sin(math.pi * r), o * math.cos(math.pi * r)
+
+    def apply_batch(self, x: np.ndarray, y: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            r = np.sqrt(x ** 2 + y ** 2)
+            o = np.arctan(y / x) / np.pi
+            return o * np.sin(np.pi * r), o * np.cos(np.pi * r)
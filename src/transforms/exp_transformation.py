@@ -1,12 +1,22 @@
 import math
-from decimal import Decimal
+
+import numpy as np
 
 from src.model.point import Point
+from src.model.precision import Number
 from src.transforms.transformation import Transformation
 
 
 class ExpTransformation(Transformation):
     def apply(self, point: Point) -> Point:
-        dx = math.exp(point.x - 1) * math.cos(Decimal(math.pi) * point.y)
-        dy = math.exp(point.x - 1) * math.sin(Decimal(math.pi) * point.y)
-        return Point(dx, dy)
+        return Point(*self.apply_xy(point.x, point.y))
+
+    def apply_xy(self, x: Number, y: Number) -> tuple[Number, Number]:
+        e = math.exp(x - 1)
+        angle = math.pi * float(y)
+        return e * math.cos(angle), e * math.sin(angle)
+
+    def apply_batch(self, x: np.ndarray, y: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        with np.errstate(over="ignore", invalid="ignore"):
+            e = np.exp(x - 1)
+            return e * np.cos(np.pi * y), e * np.sin(np.pi * y)
@@ -1,13 +1,23 @@
 import math
 
+import numpy as np
+
 from src.model.point import Point
+from src.model.precision import Number
 from src.transforms.transformation import Transformation
 
 
 class HyperbolicTransformation(Transformation):
     def apply(self, point: Point) -> Point:
-        o = math.atan(point.x / point.y)
-        r = math.sqrt(point.x ** 2 + point.y ** 2)
-        dx = math.sin(o) / r
-        dy = r * math.cos(o)
-        return Point(dx, dy)
+        return Point(*self.apply_xy(point.x, point.y))
+
+    def apply_xy(self, x: Number, y: Number) -> tuple[Number, Number]:
+        o = math.atan(x / y)
+        r = math.sqrt(x ** 2 + y ** 2)
+        return math.sin(o) / r, r * math.cos(o)
+
+    def apply_batch(self, x: np.ndarray, y: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            o = np.arctan(x / y)
+            r = np.sqrt(x ** 2 + y ** 2)
+            return np.sin(o) / r, r * np.cos(o)
@@ -1,8 +1,17 @@
 
+import numpy as np
+
 from src.model.point import Point
+from src.model.precision import Number
 from src.transforms.transformation import Transformation
 
 
 class LinearTransformation(Transformation):
     def apply(self, point: Point) -> Point:
         return point
+
+    def apply_xy(self, x: Number, y: Number) -> tuple[Number, Number]:
+        return x, y
+
+    def apply_batch(self, x: np.ndarray, y: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        return x, y
@@ -1,11 +1,18 @@
 import math
 
+import numpy as np
+
 from src.model.point import Point
+from src.model.precision import Number
 from src.transforms.transformation import Transformation
 
 
 class PolarTransformation(Transformation):
     def apply(self, point: Point) -> Point:
-        dx = math.atan2(point.x, point.y) / math.pi
-        dy = math.sqrt(point.x ** 2 + point.y ** 2) - 1
-        return Point(dx, dy)
+        return Point(*self.apply_xy(point.x, point.y))
+
+    def apply_xy(self, x: Number, y: Number) -> tuple[Number, Number]:
+        return math.atan2(x, y) / math.pi, math.sqrt(x ** 2 + y ** 2) - 1
+
+    def apply_batch(self, x: np.ndarray, y: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        return np.arctan2(x, y) / np.pi, np.sqrt(x ** 2 + y ** 2) - 1
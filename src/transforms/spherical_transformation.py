@@ -1,11 +1,20 @@
 
+import numpy as np
+
 from src.model.point import Point
+from src.model.precision import Number
 from src.transforms.transformation import Transformation
 
 
 class SphericalTransformation(Transformation):
     def apply(self, point: Point) -> Point:
-        r = point.x ** 2 + point.y ** 2
-        dx = (1 / r) * point.x
-        dy = (1 / r) * point.y
-        return Point(dx, dy)
+        return Point(*self.apply_xy(point.x, point.y))
+
+    def apply_xy(self, x: Number, y: Number) -> tuple[Number, Number]:
+        r = 1 / (x ** 2 + y ** 2)
+        return r * x, r * y
+
+    def apply_batch(self, x: np.ndarray, y: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            r = x ** 2 + y ** 2
+            return x / r, y / r
@@ -1,6 +1,9 @@
 from abc import ABC, abstractmethod
 
+import numpy as np
+
 from src.model.point import Point
+from src.model.precision import Number
 
 
 class Transformation(ABC):
@@ -14,3 +17,39 @@ class Transformation(ABC):
         :param point: Точка.
         :return: Точка, полученная путём преобразований.
         """
+
+    def apply_xy(self, x: Number, y: Number) -> tuple[Number, Number]:
+        """
+        Применяет преобразование к координатам точки без создания объектов Point.
+
+        Реализация по умолчанию вызывает apply, поэтому наследникам достаточно
+        описать только apply. Встроенные преобразования переопределяют метод,
+        а apply выражают через него: скомпилированный конвейер рендеринга
+        (VariationPipeline) вызывает apply_xy на каждой итерации.
+
+        :param x: Координата X.
+        :param y: Координата Y.
+        :return: Новые координаты X и Y (тип может отличаться от типа текущего режима точности).
+        """
+        point = self.apply(Point(x, y))
+        return point.x, point.y
+
+    def apply_batch(self, x: np.ndarray, y: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Применяет преобразование сразу к массиву точек.
+
+        Реализация по умолчанию поочерёдно вызывает apply для каждой точки,
+        поэтому наследникам достаточно описать только apply. Встроенные
+        преобразования переопределяют метод векторизованной версией.
+
+        :param x: Массив координат X (float64).
+        :param y: Массив координат Y (float64).
+        :return: Кортеж массивов новых координат X и Y.
+        """
+        res_x = np.empty_like(x)
+        res_y = np.empty_like(y)
+        for i in range(x.shape[0]):
+            point = self.apply(Point(float(x[i]), float(y[i])))
+            res_x[i] = float(point.x)
+            res_y[i] = float(point.y)
+        return res_x, res_y
@@ -1,10 +1,26 @@
 import argparse
-from typing import Optional
-
+from collections.abc import Mapping
+from concurrent.futures import Executor
+from typing import Any, Final, Optional
+
+from src.generator.render_cache import RenderCache
+from src.model.color_mode import ColorMode
+from src.model.palette import DEFAULT_PALETTE, PALETTE_SIZES, Palette
+from src.model.precision import Precision
 from src.model.rect import Rect
+from src.model.render_weights import RenderWeights
+from src.processor.composite_image_processor import CompositeImageProcessor
+from src.processor.density_estimation_image_processor import DensityEstimationImageProcessor
+from src.processor.image_processor import ImageProcessor
+from src.processor.log_gamma_correction_image_processor import LogGammaCorrectionImageProcessor
+from src.processor.supersampling_image_processor import SupersamplingImageProcessor
+from src.processor.supersampling_kernel import SupersamplingKernel
 from src.renderer.abstract_renderer import AbstractRenderer
 from src.renderer.multi_thread_renderer import MultiThreadRenderer
+from src.renderer.numpy_renderer import NumpyRenderer
+from src.renderer.process_renderer import ProcessRenderer
 from src.renderer.single_thread_renderer import SingleThreadRenderer
+from src.saver.encoder_options import EncoderOptions
 from src.transforms.disk_transformation import DiskTransformation
 from src.transforms.exp_transformation import ExpTransformation
 from src.transforms.heart_transformation import HeartTransformation
@@ -22,9 +38,22 @@ class CommandLineArgs:
     Загружает параметры из командной строки и предоставляет методы доступа к этим параметрам.
     """
 
-    def __init__(self) -> None:
+    # Трансформации по имени параметра --transformations.<имя>
+    TRANSFORMATIONS: Final[dict[str, type[Transformation]]] = {
+        "DiskTrans": DiskTransformation,
+        "ExpTrans": ExpTransformation,
+        "HeartTrans": HeartTransformation,
+        "HyperTrans": HyperbolicTransformation,
+        "LinearTrans": LinearTransformation,
+        "PolarTrans": PolarTransformation,
+        "SphericalTrans": SphericalTransformation,
+    }
+
+    def __init__(self, argv: Optional[list[str]] = None) -> None:
         """
         Инициализация и парсинг аргументов командной строки.
+
+        :param argv: Аргументы (по умолчанию — аргументы командной строки процесса).
         """
         parser = argparse.ArgumentParser(description="Application configuration parser.")
 
@@ -42,7 +71,7 @@ class CommandLineArgs:
 
         # Параметры рендера
         parser.add_argument("--renderer.type", type=str, required=True,
-                            help="Тип рендерера (multi/simple).")
+                            help="Тип рендерера (multi/simple/numpy/process).")
         parser.add_argument("--affineCount", type=int, required=True,
                             help="Количество аффинных преобразований.")
         parser.add_argument("--samples", type=int, required=True, help="Количество выборок.")
@@ -50,28 +79,143 @@ class CommandLineArgs:
                             help="Количество итераций на выборку.")
         parser.add_argument("--symmetry", type=int, required=True, help="Симметрия.")
         parser.add_argument("--steps", type=int, required=True, help="Количество шагов рендера.")
+        parser.add_argument("--batchSize", type=int, default=NumpyRenderer.DEFAULT_BATCH_SIZE,
+                            help="Количество точек, обрабатываемых за шаг рендерером numpy.")
+        parser.add_argument("--seed", type=int, default=None,
+                            help="Зерно генератора случайных чисел для воспроизводимого рендеринга.")
+        parser.add_argument("--workers", type=int, default=None,
+                            help="Количество потоков (multi) или процессов (process), по умолчанию — число ядер.")
+
+        self._add_pass_arguments(parser)
+
+        # Рендеринг по тайлам
+        parser.add_argument("--tile.size", type=int, default=None,
+                            help="Размер тайла в пикселях; холст рендерится по тайлам (только png).")
+        parser.add_argument("--tile.dir", type=str, default=None,
+                            help="Каталог для временных файлов тайлов.")
+
+        parser.add_argument("--mmap.dir", type=str, default=None,
+                            help="Каталог для хранения попаданий и цветов в отображённых в память файлах.")
+
+        # Метрики и профилирование
+        parser.add_argument("--metrics.path", type=str, default=None,
+                            help="JSON-файл для отчёта о времени этапов и счётчиках рендеринга.")
+        parser.add_argument("--profile", type=str, default=None,
+                            help="Файл статистики cProfile (для pstats); процессы рендерера process не профилируются.")
+
+        # Кэш результатов рендеринга
+        parser.add_argument("--cache.dir", type=str, default=None,
+                            help="Каталог кэша результатов рендеринга (только для рендеринга с --seed).")
+        parser.add_argument("--cache.maxBytes", type=int, default=RenderCache.DEFAULT_MAX_BYTES,
+                            help="Максимальный размер кэша в байтах.")
+
+        parser.add_argument("--precision", type=str, default=Precision.float64.value,
+                            choices=[precision.value for precision in Precision],
+                            help="Точность вычислений (float/decimal).")
 
         # Параметр процессора
         parser.add_argument("--processor.gamma", type=float, required=True,
                             help="Значение гамма-коррекции.")
 
+        parser.add_argument("--processor.supersample", type=int, default=1,
+                            help="Коэффициент суперсэмплинга: рендеринг в k раз большем разрешении.")
+        parser.add_argument("--processor.supersampleKernel", type=str, default=SupersamplingKernel.box.value,
+                            choices=[kernel.value for kernel in SupersamplingKernel],
+                            help="Ядро фильтра суперсэмплинга (box/tent/gaussian).")
+        parser.add_argument("--processor.densityRadius", type=float, default=0.0,
+                            help="Максимальный радиус адаптивного размытия по плотности (0 — выключено).")
+        parser.add_argument("--processor.densityCurve", type=float, default=0.4,
+                            help="Скорость убывания радиуса размытия с ростом числа попаданий.")
+        parser.add_argument("--processor.densityMinRadius", type=float, default=0.0,
+                            help="Минимальный радиус адаптивного размытия.")
+
         # Трансформации
-        transformations = [
-            "DiskTrans", "ExpTrans", "HeartTrans", "HyperTrans",
-            "LinearTrans", "PolarTrans", "SphericalTrans"
-        ]
-        for trans in transformations:
-            parser.add_argument(f"--transformations.{trans}", action="store_true",
-                                help=f"Включить трансформацию {trans}.")
+        for trans in self.TRANSFORMATIONS:
+            parser.add_argument(f"--transformations.{trans}", nargs="?", type=float, const=1.0, default=None,
+                                help=f"Включить трансформацию {trans} (необязательное значение — её вес).")
+        parser.add_argument("--variations.blend", action="store_true",
+                            help="Складывать результаты всех вариаций с весами вместо выбора одной.")
+        parser.add_argument("--affineWeights", type=float, nargs="+", default=None,
+                            help="Веса аффинных преобразований (по одному на каждое из --affineCount).")
+
+        # Окраска по палитре
+        parser.add_argument("--colorMode", type=str, default=ColorMode.rgb.value,
+                            choices=[mode.value for mode in ColorMode],
+                            help="Способ окраски попаданий: цветом преобразования (rgb) или по палитре (palette).")
+        parser.add_argument("--palette.name", type=str, default=DEFAULT_PALETTE, choices=Palette.names(),
+                            help="Палитра для режима palette (меняется без повторного рендеринга).")
+        parser.add_argument("--palette.size", type=int, default=PALETTE_SIZES[0], choices=PALETTE_SIZES,
+                            help="Количество цветов в таблице палитры.")
 
         # Параметры сохранения
         parser.add_argument("--saver.format", type=str, required=True,
-                            help="Формат сохранения изображения (например, png).")
+                            help="Формат сохранения изображения (png/bmp/jpg/webp).")
         parser.add_argument("--saver.path", type=str, required=True,
                             help="Путь для сохранения изображения.")
+        parser.add_argument("--saver.pngCompressLevel", type=int, default=EncoderOptions.png_compress_level,
+                            help="Уровень сжатия PNG (0-9).")
+        parser.add_argument("--saver.jpegQuality", type=int, default=EncoderOptions.jpeg_quality,
+                            help="Качество JPEG (1-95).")
+        parser.add_argument("--saver.webpQuality", type=int, default=EncoderOptions.webp_quality,
+                            help="Качество WebP (0-100).")
+        parser.add_argument("--saver.webpLossless", action="store_true",
+                            help="Сохранять WebP без потерь.")
+
+        self.args = parser.parse_args(argv)
+
+    @staticmethod
+    def _add_pass_arguments(parser: argparse.ArgumentParser) -> None:
+        """
+        Добавляет параметры рендеринга по проходам: превью, остановку по сходимости и файл состояния.
 
-        self.args = parser.parse_args()
+        :param parser: Парсер аргументов.
+        """
+        # Прогрессивный рендеринг
+        parser.add_argument("--progressive.passes", type=int, default=1,
+                            help="Количество проходов рендеринга; при значении больше 1 сохраняются превью.")
+        parser.add_argument("--progressive.previewPasses", type=int, default=None,
+                            help="Сохранять превью каждые N проходов.")
+        parser.add_argument("--progressive.previewSeconds", type=float, default=None,
+                            help="Сохранять превью не реже чем раз в T секунд.")
+
+        # Остановка по сходимости
+        parser.add_argument("--convergence.target", type=float, default=None,
+                            help="Остановить рендеринг, когда среднее изменение нормированной логарифмической "
+                                 "плотности между проходами станет меньше заданного (например, 0.002).")
+        parser.add_argument("--convergence.seconds", type=float, default=None,
+                            help="Остановить рендеринг, когда истечёт бюджет времени в секундах.")
+        parser.add_argument("--convergence.passes", type=int, default=32,
+                            help="Количество проходов, на которые делятся --samples в режиме сходимости.")
+
+        # Сохранение и продолжение рендеринга
+        parser.add_argument("--checkpoint.path", type=str, default=None,
+                            help="Файл состояния рендеринга (.npz) для сохранения и продолжения.")
+        parser.add_argument("--checkpoint.everyPasses", type=int, default=None,
+                            help="Сохранять состояние каждые N проходов.")
+        parser.add_argument("--checkpoint.everySeconds", type=float, default=None,
+                            help="Сохранять состояние не реже чем раз в T секунд.")
+        parser.add_argument("--resume", action="store_true",
+                            help="Продолжить рендеринг из файла --checkpoint.path.")
+
+    @classmethod
+    def from_dict(cls, options: Mapping[str, Any]) -> "CommandLineArgs":
+        """
+        Создает конфигурацию из словаря, ключи которого совпадают с именами параметров без '--'.
+
+        Значение True включает флаг (например, "transformations.DiskTrans": true),
+        значения False и None пропускаются, остальные передаются как строки.
 
+        :param options: Словарь параметров, например {"image.width": 800, "seed": 7}.
+        :return: Конфигурация.
+        """
+        argv = []
+        for key, value in options.items():
+            if value is None or value is False:
+                continue
+            argv.append(f"--{key}")
+            if value is not True:
+                argv.append(str(value))
+        return cls(argv)
 
     def get(self, key: str) -> Optional[str]:
         """
@@ -121,10 +265,69 @@ class CommandLineArgs:
 
         return Rect(x, y, width, height)
 
-    def get_renderer(self) -> AbstractRenderer:
+    def get_processor(self) -> ImageProcessor:
+        """
+        Создает цепочку процессоров изображения: оценка плотности, суперсэмплинг, логарифмическая и гамма-коррекция.
+
+        Оценка плотности и суперсэмплинг включаются только при заданных параметрах.
+
+        :return: Процессор изображения.
+        """
+        processors: list[ImageProcessor] = []
+        density_radius = self.get_float("processor.densityRadius")
+        if density_radius > 0:
+            processors.append(DensityEstimationImageProcessor(density_radius, self.get_float("processor.densityCurve"),
+                                                              self.get_float("processor.densityMinRadius")))
+        factor = self.get_int("processor.supersample")
+        kernel = SupersamplingKernel(self.get("processor.supersampleKernel"))
+        if factor > 1 or kernel is not SupersamplingKernel.box:
+            processors.append(SupersamplingImageProcessor(factor, kernel))
+        processors.append(LogGammaCorrectionImageProcessor(self.get_float("processor.gamma"),
+                                                           palette=self.get_palette()))
+        return processors[0] if len(processors) == 1 else CompositeImageProcessor(processors)
+
+    def get_encoder_options(self) -> EncoderOptions:
+        """
+        Возвращает параметры кодировщиков изображений.
+
+        :return: Параметры кодировщиков.
+        """
+        return EncoderOptions(
+            png_compress_level=self.get_int("saver.pngCompressLevel"),
+            jpeg_quality=self.get_int("saver.jpegQuality"),
+            webp_quality=self.get_int("saver.webpQuality"),
+            webp_lossless=bool(self.get("saver.webpLossless")),
+        )
+
+    def get_color_mode(self) -> ColorMode:
+        """
+        Возвращает способ окраски попаданий.
+
+        :return: Способ окраски.
+        """
+        return ColorMode(self.get("colorMode"))
+
+    def get_palette(self) -> Palette:
+        """
+        Возвращает палитру для изображений, окрашиваемых по палитре.
+
+        :return: Палитра.
+        """
+        return Palette.from_name(self.get("palette.name"), self.get_int("palette.size"))
+
+    def get_precision(self) -> Precision:
+        """
+        Возвращает режим точности вычислений.
+
+        :return: Режим точности.
+        """
+        return Precision(self.get("precision"))
+
+    def get_renderer(self, executor: Optional[Executor] = None) -> AbstractRenderer:
         """
         Создает и возвращает экземпляр рендерера в зависимости от параметров конфигурации.
 
+        :param executor: Общий пул процессов для рендерера process.
         :return: Экземпляр рендерера.
         """
         steps = self.get_int("steps")
@@ -134,11 +337,23 @@ class CommandLineArgs:
         symmetry = self.get_int("symmetry")
 
         renderer_type = self.get("renderer.type")
+        seed = self.get("seed")
+        variations = self.get_transformations()
+        weights = self.get_weights()
+        color_mode = self.get_color_mode()
 
         if renderer_type == "multi":
-            return MultiThreadRenderer(steps, affine_count, samples, iter_samples, symmetry, self.get_transformations())
-
-        return SingleThreadRenderer(steps, affine_count, samples, iter_samples, symmetry, self.get_transformations())
+            return MultiThreadRenderer(steps, affine_count, samples, iter_samples, symmetry, variations,
+                                       self.get("workers"), seed, weights, color_mode)
+        if renderer_type == "numpy":
+            return NumpyRenderer(steps, affine_count, samples, iter_samples, symmetry, variations,
+                                 self.get_int("batchSize"), seed, weights, color_mode)
+        if renderer_type == "process":
+            return ProcessRenderer(steps, affine_count, samples, iter_samples, symmetry, variations,
+                                   self.get("workers"), seed, executor, weights, color_mode)
+
+        return SingleThreadRenderer(steps, affine_count, samples, iter_samples, symmetry, variations, seed, weights,
+                                    color_mode)
 
     def get_transformations(self) -> list[Transformation]:
         """
@@ -146,21 +361,23 @@ class CommandLineArgs:
 
         :return: Список трансформаций.
         """
-        transformations = []
-
-        if self.get("transformations.DiskTrans"):
-            transformations.append(DiskTransformation())
-        if self.get("transformations.ExpTrans"):
-            transformations.append(ExpTransformation())
-        if self.get("transformations.HeartTrans"):
-            transformations.append(HeartTransformation())
-        if self.get("transformations.HyperTrans"):
-            transformations.append(HyperbolicTransformation())
-        if self.get("transformations.LinearTrans"):
-            transformations.append(LinearTransformation())
-        if self.get("transformations.PolarTrans"):
-            transformations.append(PolarTransformation())
-        if self.get("transformations.SphericalTrans"):
-            transformations.append(SphericalTransformation())
-
-        return transformations
+        return [transformation() for name, transformation in self.TRANSFORMATIONS.items()
+                if self.get(f"transformations.{name}") is not None]
+
+    def get_weights(self) -> RenderWeights:
+        """
+        Возвращает веса вариаций и аффинных преобразований.
+
+        Веса вариаций берутся из значений --transformations.<имя> в порядке
+        списка трансформаций; если все они равны 1, выбор остаётся равномерным.
+
+        :return: Веса рендеринга.
+        """
+        variations = tuple(self.get(f"transformations.{name}") for name in self.TRANSFORMATIONS
+                           if self.get(f"transformations.{name}") is not None)
+        affines = self.get("affineWeights")
+        return RenderWeights(
+            variations=variations if any(weight != 1.0 for weight in variations) else None,
+            affines=tuple(affines) if affines is not None else None,
+            blend=bool(self.get("variations.blend")),
+        )
@@ -0,0 +1,82 @@
+from collections.abc import Sequence
+
+import numpy as np
+
+
+class AliasTable:
+    """
+    Таблица псевдонимов (метод Уолкера — Воуза) для выбора индекса с заданными весами за O(1).
+
+    Отрезок [0, n) делится на n ячеек единичной длины. Ячейка i с
+    вероятностью probabilities[i] выбирает сам индекс i, иначе — индекс
+    aliases[i]. Для выбора достаточно одного случайного числа value из
+    [0, n): ячейка — int(value), дробная часть сравнивается с вероятностью.
+
+    При равных весах все вероятности равны 1, и выбор совпадает с
+    равномерным выбором int(value), поэтому с весами по умолчанию
+    последовательность выбранных индексов не меняется.
+    """
+
+    probabilities: list[float]
+    aliases: list[int]
+    uniform: bool
+
+    def __init__(self, weights: Sequence[float]) -> None:
+        """
+        Строит таблицу.
+
+        :param weights: Неотрицательные веса с положительной суммой.
+        """
+        if not weights:
+            raise ValueError("Alias table needs at least one weight.")
+        if any(weight < 0 for weight in weights) or sum(weights) <= 0:
+            raise ValueError("Weights must be non-negative with a positive sum.")
+        count = len(weights)
+        self.uniform = all(weight == weights[0] for weight in weights)
+        self.probabilities = [1.0] * count
+        self.aliases = list(range(count))
+        if self.uniform:
+            return
+
+        total = sum(weights)
+        scaled = [weight * count / total for weight in weights]
+        small = [index for index, value in enumerate(scaled) if value < 1]
+        large = [index for index, value in enumerate(scaled) if value >= 1]
+        while small and large:
+            less, more = small.pop(), large.pop()
+            self.probabilities[less] = scaled[less]
+            self.aliases[less] = more
+            scaled[more] -= 1 - scaled[less]
+            (small if scaled[more] < 1 else large).append(more)
+        # Оставшиеся из-за округления ячейки выбирают сами себя: их вероятность остаётся равной 1
+
+    def __len__(self) -> int:
+        return len(self.probabilities)
+
+    def pick(self, value: float) -> int:
+        """
+        Выбирает индекс по случайному числу.
+
+        :param value: Случайное число, равномерно распределённое на [0, n).
+        :return: Индекс.
+        """
+        index = int(value)
+        if value - index >= self.probabilities[index]:
+            return self.aliases[index]
+        return index
+
+    def pick_values(self, values: np.ndarray) -> np.ndarray:
+        """
+        Выбирает по индексу для каждого случайного числа массива.
+
+        :param values: Случайные числа, равномерно распределённые на [0, 1).
+        :return: Массив индексов (int64).
+        """
+        size = len(self.probabilities)
+        values = values * size
+        index = np.minimum(values.astype(np.int64), size - 1)
+        if self.uniform:
+            return index
+        probabilities = np.asarray(self.probabilities)
+        aliases = np.asarray(self.aliases)
+        return np.where(values - index < probabilities[index], index, aliases[index])
@@ -0,0 +1,79 @@
+import numpy as np
+
+from src.model.fractal_image import FractalImage
+
+
+def image_density(image: FractalImage) -> np.ndarray:
+    """
+    Возвращает плотность изображения: попадания и суммы цветов попаданий по каналам.
+
+    :param image: Изображение.
+    :return: Массив float64 формы (height, width, 1 + channels): попадания и суммы цветов по каналам.
+    """
+    density = np.empty((image.height, image.width, 1 + image.channels))
+    density[..., 0] = image.hits
+    density[..., 1:] = image.sums
+    return density
+
+
+def assign_density(image: FractalImage, density: np.ndarray) -> None:
+    """
+    Записывает плотность в изображение.
+
+    Число попаданий остаётся дробным: при округлении редкие попадания,
+    размазанные по соседним пикселям, обнулились бы и пропали.
+
+    :param image: Изображение (его массивы заменяются массивами float64).
+    :param density: Массив формы (height, width, 1 + channels), как в image_density.
+    """
+    hits = density[..., 0]
+    image.assign(hits, np.where((hits > 0)[..., np.newaxis], density[..., 1:], 0.0))
+
+
+def convolve_axis(array: np.ndarray, axis: int, weights: np.ndarray) -> np.ndarray:
+    """
+    Свёртывает массив вдоль оси с симметричным ядром (за границами массива — нули).
+
+    :param array: Массив.
+    :param axis: Ось свёртки.
+    :param weights: Веса ядра нечётной длины 2 * radius + 1.
+    :return: Новый массив той же формы.
+    """
+    radius = len(weights) // 2
+    source = np.moveaxis(array, axis, 0)
+    result = np.zeros_like(source)
+    size = source.shape[0]
+    for offset, weight in zip(range(-radius, radius + 1), weights.tolist(), strict=True):
+        if abs(offset) >= size:
+            continue
+        if offset >= 0:
+            result[:size - offset] += weight * source[offset:]
+        else:
+            result[-offset:] += weight * source[:size + offset]
+    return np.moveaxis(result, 0, axis)
+
+
+def downsample_axis(array: np.ndarray, axis: int, factor: int, weights: np.ndarray) -> np.ndarray:
+    """
+    Уменьшает разрешение массива вдоль оси в factor раз с фильтрующим ядром.
+
+    Ядро задаётся весами исходных элементов относительно начала блока
+    выходного элемента: веса с индексом t относятся к элементу
+    factor * i + t - (len(weights) - factor) // 2. За границами массива — нули.
+
+    :param array: Массив, длина которого вдоль оси кратна factor.
+    :param axis: Ось.
+    :param factor: Коэффициент уменьшения.
+    :param weights: Веса ядра.
+    :return: Новый массив с длиной оси, уменьшенной в factor раз.
+    """
+    source = np.moveaxis(array, axis, 0)
+    size = source.shape[0] // factor
+    pad = (len(weights) - factor) // 2
+    padded = np.zeros((source.shape[0] + 2 * len(weights),) + source.shape[1:], dtype=source.dtype)
+    padded[len(weights):len(weights) + source.shape[0]] = source
+    result = np.zeros((size,) + source.shape[1:], dtype=source.dtype)
+    for tap, weight in enumerate(weights.tolist()):
+        start = len(weights) + tap - pad
+        result += weight * padded[start:start + factor * size:factor]
+    return np.moveaxis(result, 0, axis)
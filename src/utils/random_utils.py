@@ -1,15 +1,130 @@
 import random
-from decimal import Decimal
-from typing import TypeVar
+from typing import Final, Optional, TypeVar
+
+import numpy as np
 
 from src.model.point import Point
+from src.model.precision import number
 from src.model.rect import Rect
 
 T = TypeVar("T")
 
-def get_random_point(rect: Rect) -> Point:
-    return Point(rect.x + Decimal(random.uniform(0, 1)) * rect.width, rect.y
-                 + Decimal(random.uniform(0, 1)) * rect.height)
+def get_random_point(rect: Rect, random_instance: Optional[random.Random] = None) -> Point:
+    uniform = (random_instance or random).uniform
+    return Point(rect.x + number(uniform(0, 1)) * rect.width, rect.y
+                 + number(uniform(0, 1)) * rect.height)
+
+def get_random_elem_from_list(lst: list[T], random_instance: Optional[random.Random] = None) -> T:
+    return lst[int((random_instance or random).uniform(0, len(lst)))]
+
+
+class RandomStreams:
+    """
+    Источник независимых потоков случайных чисел, порождаемых из одного зерна.
+
+    Построен на np.random.SeedSequence: каждый поток определяется зерном и
+    ключом (назначение потока, индекс сэмпла), поэтому потоки можно
+    получать в любом порядке и в любом процессе, а результат зависит только
+    от зерна. Без зерна энтропия выбирается случайно и доступна в entropy,
+    чтобы запуск можно было повторить.
+    """
+
+    AFFINE_STREAM: Final[int] = 0
+    SAMPLE_STREAM: Final[int] = 1
+    LANE_STREAM: Final[int] = 2
+
+    entropy: int
+
+    def __init__(self, seed: Optional[int] = None) -> None:
+        """
+        Создает источник потоков.
+
+        :param seed: Зерно генератора или None для случайного зерна.
+        """
+        self.entropy = np.random.SeedSequence(seed).entropy
+
+    def affine_random(self) -> random.Random:
+        """
+        Возвращает генератор для построения набора аффинных преобразований.
+
+        :return: Экземпляр random.Random.
+        """
+        return self._random(self.AFFINE_STREAM)
+
+    def sample_random(self, index: int) -> random.Random:
+        """
+        Возвращает генератор сэмпла с заданным индексом.
+
+        :param index: Индекс сэмпла.
+        :return: Экземпляр random.Random.
+        """
+        return self._random(self.SAMPLE_STREAM, index)
+
+    def lane_random(self) -> "LaneRandom":
+        """
+        Возвращает генератор дорожек векторизованного рендеринга.
+
+        :return: Экземпляр LaneRandom.
+        """
+        return LaneRandom(int(self._sequence(self.LANE_STREAM).generate_state(1, np.uint64)[0]))
+
+    def _sequence(self, *key: int) -> np.random.SeedSequence:
+        return np.random.SeedSequence(self.entropy, spawn_key=key)
+
+    def _random(self, *key: int) -> random.Random:
+        state = self._sequence(*key).generate_state(4)
+        return random.Random(int.from_bytes(state.tobytes(), "little"))
+
+
+class LaneRandom:
+    """
+    Счётчиковый генератор случайных чисел для дорожек векторизованного рендеринга.
+
+    Число с номером draw на шаге step дорожки lane — хеш splitmix64 ключа,
+    индекса дорожки и счётчика (step, draw). Оно не зависит от того, в какой
+    пачке, каком проходе или процессе обрабатывается дорожка, поэтому
+    деление сэмплов на проходы не меняет изображение. Все числа пачки
+    вычисляются несколькими операциями над массивами uint64.
+    """
+
+    # Количество чисел, которые дорожка может запросить на одном шаге
+    DRAWS: Final[int] = 4
+    GOLDEN: Final[int] = 0x9E3779B97F4A7C15
+    MASK: Final[int] = (1 << 64) - 1
+
+    key: int
+
+    def __init__(self, key: int) -> None:
+        """
+        Создает генератор.
+
+        :param key: 64-битный ключ потока.
+        """
+        self.key = key & self.MASK
+
+    def lane_keys(self, lanes: np.ndarray) -> np.ndarray:
+        """
+        Возвращает ключи дорожек: их передают в uniform вместо индексов.
+
+        :param lanes: Глобальные индексы дорожек.
+        :return: Массив uint64.
+        """
+        return self._mix(lanes.astype(np.uint64) * np.uint64(self.GOLDEN) ^ np.uint64(self.key))
+
+    def uniform(self, lane_keys: np.ndarray, step: int, draw: int) -> np.ndarray:
+        """
+        Возвращает по числу, равномерно распределённому на [0, 1), для каждой дорожки.
+
+        :param lane_keys: Ключи дорожек (см. lane_keys).
+        :param step: Номер шага (может быть отрицательным).
+        :param draw: Номер числа на шаге, от 0 до DRAWS - 1.
+        :return: Массив float64.
+        """
+        counter = np.uint64((step * self.DRAWS + draw) * self.GOLDEN & self.MASK)
+        return (self._mix(lane_keys + counter) >> np.uint64(11)) * (1.0 / (1 << 53))
 
-def get_random_elem_from_list(lst: list[T]) -> T:
-    return lst[int(random.uniform(0, len(lst)))]
+    @staticmethod
+    def _mix(z: np.ndarray) -> np.ndarray:
+        z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+        z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+        return z ^ (z >> np.uint64(31))
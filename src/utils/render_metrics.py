@@ -0,0 +1,137 @@
+import json
+import time
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from pathlib import Path
+from typing import Any, Final, Optional
+
+
+class RenderMetrics:
+    """
+    Класс RenderMetrics собирает время этапов рендеринга и счётчики горячего цикла.
+
+    Время этапов, выполняемых потоками и процессами, складывается, поэтому
+    для многопоточных рендереров это суммарное время всех исполнителей, а не
+    время по часам. Отдельно по каждому исполнителю хранятся количество
+    сэмплов, итераций и время работы, по которым считается скорость в точках
+    в секунду. Объект передаётся в процессы рендерера и обратно, поэтому
+    содержит только словари.
+    """
+
+    # Этапы в порядке выполнения: так они и выводятся в отчёте
+    STAGES: Final[tuple[str, ...]] = ("affine_generation", "warmup", "iteration", "symmetry", "pixel_resolution",
+                                      "histogram", "tone_mapping", "pil_conversion", "encoding")
+
+    stages: dict[str, float]
+    counters: dict[str, int]
+    workers: dict[int, dict[str, float]]
+
+    def __init__(self) -> None:
+        """
+        Создает пустой набор метрик.
+        """
+        self.stages = {}
+        self.counters = {}
+        self.workers = {}
+
+    @staticmethod
+    def measure(metrics: Optional["RenderMetrics"], stage: str) -> AbstractContextManager[None]:
+        """
+        Возвращает контекст, время которого добавляется к этапу, или пустой контекст, если метрики не собираются.
+
+        :param metrics: Метрики или None.
+        :param stage: Имя этапа.
+        :return: Контекстный менеджер.
+        """
+        return nullcontext() if metrics is None else metrics.stage(stage)
+
+    @contextmanager
+    def stage(self, stage: str) -> Iterator[None]:
+        """
+        Добавляет к этапу время выполнения блока with.
+
+        :param stage: Имя этапа.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(stage, time.perf_counter() - start)
+
+    def add_time(self, stage: str, seconds: float) -> None:
+        """
+        Добавляет время к этапу.
+
+        :param stage: Имя этапа.
+        :param seconds: Время в секундах.
+        """
+        self.stages[stage] = self.stages.get(stage, 0.0) + seconds
+
+    def count(self, counter: str, value: int) -> None:
+        """
+        Увеличивает счётчик.
+
+        :param counter: Имя счётчика.
+        :param value: Приращение.
+        """
+        self.counters[counter] = self.counters.get(counter, 0) + value
+
+    def add_worker(self, worker: int, samples: int, iterations: int, seconds: float) -> None:
+        """
+        Добавляет работу исполнителя (потока или процесса).
+
+        :param worker: Номер исполнителя.
+        :param samples: Количество сэмплов.
+        :param iterations: Количество итераций хаос-игры.
+        :param seconds: Время работы в секундах.
+        """
+        totals = self.workers.setdefault(worker, {"samples": 0, "iterations": 0, "seconds": 0.0})
+        totals["samples"] += samples
+        totals["iterations"] += iterations
+        totals["seconds"] += seconds
+
+    def merge(self, other: "RenderMetrics") -> None:
+        """
+        Добавляет метрики другого объекта, например собранные в процессе рендерера.
+
+        :param other: Метрики.
+        """
+        for stage, seconds in other.stages.items():
+            self.add_time(stage, seconds)
+        for counter, value in other.counters.items():
+            self.count(counter, value)
+        for worker, totals in other.workers.items():
+            self.add_worker(worker, int(totals["samples"]), int(totals["iterations"]), totals["seconds"])
+
+    def to_dict(self, total_seconds: Optional[float] = None) -> dict[str, Any]:
+        """
+        Возвращает отчёт, сериализуемый в JSON.
+
+        Количество точек, отброшенных за пределами изображения, выводится из
+        количества нарисованных копий точек и попаданий.
+
+        :param total_seconds: Общее время работы по часам.
+        :return: Словарь с временем этапов, счётчиками и скоростью исполнителей.
+        """
+        order = {stage: index for index, stage in enumerate(self.STAGES)}
+        stages = dict(sorted(self.stages.items(), key=lambda item: order.get(item[0], len(order))))
+        counters = dict(self.counters)
+        if "plotted" in counters and "hits" in counters:
+            counters["out_of_bounds"] = counters["plotted"] - counters["hits"]
+        workers = [{"worker": worker, "samples": int(totals["samples"]), "iterations": int(totals["iterations"]),
+                    "seconds": totals["seconds"],
+                    "points_per_second": totals["iterations"] / totals["seconds"] if totals["seconds"] > 0 else 0.0}
+                   for worker, totals in sorted(self.workers.items())]
+        report: dict[str, Any] = {"stages": stages, "counters": counters, "workers": workers}
+        if total_seconds is not None:
+            report = {"total_seconds": total_seconds, **report}
+        return report
+
+    def write(self, path: Path, total_seconds: Optional[float] = None) -> None:
+        """
+        Сохраняет отчёт в JSON-файл.
+
+        :param path: Путь файла.
+        :param total_seconds: Общее время работы по часам.
+        """
+        path.write_text(json.dumps(self.to_dict(total_seconds), indent=2), encoding="utf-8")
@@ -0,0 +1,117 @@
+from pathlib import Path
+
+import pytest
+
+from src.animation.animation import Animation
+from src.animation.animation_renderer import AnimationRenderer
+from src.animation.easing import Easing
+from src.animation.keyframe import Keyframe
+from src.generator.fractal_generator import FractalGenerator
+from src.model.affine_coef import AffineCoefficient
+from src.model.color import Color
+from src.model.rect import Rect
+from src.transforms.affine_transformation import AffineTransformation
+from src.ui.command_line_args import CommandLineArgs
+
+OPTIONS = {
+    "image.width": 20,
+    "image.height": 14,
+    "rect.cordX": -1,
+    "rect.cordY": -1,
+    "rect.width": 2,
+    "rect.height": 2,
+    "renderer.type": "numpy",
+    "affineCount": 3,
+    "samples": 4,
+    "iterSamples": 80,
+    "symmetry": 1,
+    "steps": 5,
+    "processor.gamma": 2.2,
+    "transformations.LinearTrans": True,
+    "saver.format": "png",
+    "seed": 11,
+}
+
+
+def _affine(value: float, color: Color) -> AffineTransformation:
+    return AffineTransformation(AffineCoefficient(dict.fromkeys("abcdef", value), color))
+
+
+def _animation(easing: Easing = Easing.linear) -> Animation:
+    return Animation([
+        Keyframe(4, Rect(2, 2, 4, 4), [_affine(0.4, Color(200, 100, 0))]),
+        Keyframe(0, Rect(0, 0, 2, 2), [_affine(0.0, Color(0, 0, 0))]),
+    ], easing)
+
+
+def test_keyframes_are_returned_unchanged() -> None:
+    animation = _animation()
+    assert animation.frame_count == 5
+    world, affines = animation.frame(4)
+    assert (world.x, world.width) == (2, 4)
+    assert affines[0].affine_coef.a == 0.4
+
+
+def test_linear_interpolation() -> None:
+    world, affines = _animation().frame(2)
+    assert (world.x, world.y, world.width, world.height) == pytest.approx((1, 1, 3, 3))
+    assert affines[0].affine_coef.e == pytest.approx(0.2)
+    assert affines[0].affine_coef.color == Color(100, 50, 0)
+
+
+def test_smooth_easing_is_slower_near_keyframes() -> None:
+    linear, _ = _animation().frame(1)
+    smooth, _ = _animation(Easing.smooth).frame(1)
+    middle, _ = _animation(Easing.smooth).frame(2)
+    assert 0 < smooth.x < linear.x
+    assert middle.x == pytest.approx(1)
+
+
+def test_invalid_animations_rejected() -> None:
+    with pytest.raises(ValueError, match="frame 0"):
+        Animation([Keyframe(1, Rect(0, 0, 1, 1), [])])
+    animation = Animation([Keyframe(0, Rect(0, 0, 1, 1), []),
+                           Keyframe(2, Rect(0, 0, 1, 1), [_affine(0, Color(0, 0, 0))])])
+    with pytest.raises(ValueError, match="affine counts"):
+        animation.frame(1)
+    with pytest.raises(ValueError, match="out of range"):
+        animation.frame(3)
+
+
+def test_from_dict_builds_affines_from_seed() -> None:
+    config = CommandLineArgs.from_dict({**OPTIONS, "saver.path": "frame"})
+    renderer = config.get_renderer()
+    animation = Animation.from_dict({
+        "easing": "smooth",
+        "keyframes": [
+            {"frame": 0, "seed": 11},
+            {"frame": 3, "rect": [-0.5, -0.5, 1, 1],
+             "affines": [{"a": 0.1, "b": 0.2, "c": 0.3, "d": 0.4, "e": 0.5, "f": 0.6, "color": [1, 2, 3]}] * 3},
+        ],
+    }, renderer, config.get_rect())
+
+    assert animation.easing is Easing.smooth
+    first = animation.keyframes[0]
+    assert (first.world.x, first.world.width) == (-1, 2)
+    assert len(first.affine_transformations) == 3
+    assert animation.keyframes[1].affine_transformations[0].affine_coef.color == Color(1, 2, 3)
+
+
+def test_frames_render_in_processes(tmp_path: Path) -> None:
+    options = {**OPTIONS, "saver.path": str(tmp_path / "frame")}
+    renderer = AnimationRenderer(options, workers=2)
+    config = renderer.config
+    animation = Animation.from_dict({"keyframes": [{"frame": 0, "seed": 11}, {"frame": 2, "seed": 12}]},
+                                    config.get_renderer(), config.get_rect())
+
+    paths = renderer.render(animation)
+
+    assert [path.name for path in paths] == ["frame_00000.png", "frame_00001.png", "frame_00002.png"]
+    FractalGenerator().execute(CommandLineArgs.from_dict({**options, "saver.path": str(tmp_path / "single")}))
+    assert paths[0].read_bytes() == (tmp_path / "single.png").read_bytes()
+    assert paths[1].read_bytes() != paths[0].read_bytes()
+
+
+def test_process_renderer_rejected() -> None:
+    with pytest.raises(ValueError, match="processes"):
+        AnimationRenderer({**OPTIONS, "saver.path": "frame", "renderer.type": "process"})
@@ -0,0 +1,126 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from src.batch.batch_manifest import BatchManifest
+from src.batch.batch_runner import BatchRunner
+from src.generator.fractal_generator import FractalGenerator
+from src.ui.command_line_args import CommandLineArgs
+
+DEFAULTS = {
+    "image.width": 24,
+    "image.height": 16,
+    "rect.cordX": -1,
+    "rect.cordY": -1,
+    "rect.width": 2,
+    "rect.height": 2,
+    "renderer.type": "process",
+    "affineCount": 3,
+    "samples": 4,
+    "iterSamples": 60,
+    "symmetry": 1,
+    "steps": 5,
+    "workers": 2,
+    "processor.gamma": 2.2,
+    "transformations.LinearTrans": True,
+    "saver.format": "png",
+}
+
+
+def test_from_dict_mirrors_command_line() -> None:
+    options = {**DEFAULTS, "saver.path": "out", "seed": 7, "transformations.DiskTrans": False}
+    config = CommandLineArgs.from_dict(options)
+
+    assert config.get_int("image.width") == 24
+    assert config.get("seed") == 7
+    assert config.get("transformations.LinearTrans")
+    assert not config.get("transformations.DiskTrans")
+    assert config.get("workers") == 2
+
+
+def test_manifest_merges_defaults(tmp_path: Path) -> None:
+    manifest = tmp_path / "jobs.json"
+    manifest.write_text(json.dumps({
+        "defaults": DEFAULTS,
+        "jobs": [{"saver.path": "a", "seed": 1}, {"saver.path": "b", "seed": 2, "samples": 8}],
+    }), encoding="utf-8")
+
+    jobs = BatchManifest.load(manifest)
+
+    assert [job.name for job in jobs] == ["a.png", "b.png"]
+    assert [job.config.get_int("samples") for job in jobs] == [4, 8]
+    assert jobs[1].points == 2 * jobs[0].points
+
+
+def test_manifest_list_form() -> None:
+    jobs = BatchManifest.parse([{**DEFAULTS, "saver.path": "a"}])
+    assert [job.name for job in jobs] == ["a.png"]
+
+
+def test_manifest_rejects_invalid_job() -> None:
+    with pytest.raises(ValueError, match="batch job 1"):
+        BatchManifest.parse([{**DEFAULTS, "saver.path": "a"}, {"saver.path": "b"}])
+    with pytest.raises(TypeError):
+        BatchManifest.parse({"defaults": DEFAULTS})
+
+
+def test_manifest_rejects_mixed_precision() -> None:
+    with pytest.raises(ValueError, match="precision"):
+        BatchManifest.parse([{**DEFAULTS, "saver.path": "a"},
+                             {**DEFAULTS, "saver.path": "b", "precision": "decimal"}])
+
+
+def test_batch_matches_separate_runs(tmp_path: Path) -> None:
+    jobs = BatchManifest.parse({
+        "defaults": DEFAULTS,
+        "jobs": [
+            {"saver.path": str(tmp_path / "batch_a"), "seed": 1},
+            {"saver.path": str(tmp_path / "batch_b"), "seed": 2, "samples": 6},
+            {"saver.path": str(tmp_path / "batch_c"), "seed": 3, "renderer.type": "numpy"},
+        ],
+    })
+
+    results = BatchRunner(workers=2, concurrency=2).run(jobs)
+
+    assert [result.name for result in results] == [job.name for job in jobs]
+    assert all(result.ok for result in results)
+    for index, job in enumerate(jobs):
+        separate = tmp_path / f"single_{index}"
+        FractalGenerator().execute(CommandLineArgs.from_dict({**job.options, "saver.path": str(separate)}))
+        assert Path(job.name).read_bytes() == separate.with_suffix(".png").read_bytes()
+
+
+def test_batch_reports_failed_job(tmp_path: Path) -> None:
+    jobs = BatchManifest.parse([
+        {**DEFAULTS, "saver.path": str(tmp_path / "ok"), "seed": 1},
+        {**DEFAULTS, "saver.path": str(tmp_path / "bad"), "seed": 1, "resume": True},
+    ])
+
+    results = BatchRunner(workers=1).run(jobs)
+
+    assert results[0].ok
+    assert not results[1].ok
+    assert "checkpoint" in results[1].error
+
+
+def test_batch_writes_metrics_only_for_jobs_that_request_them(tmp_path: Path) -> None:
+    jobs = BatchManifest.parse({
+        "defaults": {**DEFAULTS, "renderer.type": "single"},
+        "jobs": [
+            {"saver.path": str(tmp_path / "big"), "seed": 1, "samples": 40,
+             "metrics.path": str(tmp_path / "big_metrics.json")},
+            {"saver.path": str(tmp_path / "small"), "seed": 2},
+            {"saver.path": str(tmp_path / "other"), "seed": 3, "metrics.path": str(tmp_path / "other_metrics.json")},
+        ],
+    })
+
+    results = BatchRunner(workers=1, concurrency=3).run(jobs)
+
+    assert all(result.ok for result in results)
+    assert sorted(path.name for path in tmp_path.glob("*.json")) == ["big_metrics.json", "other_metrics.json"]
+    big = json.loads((tmp_path / "big_metrics.json").read_text(encoding="utf-8"))
+    other = json.loads((tmp_path / "other_metrics.json").read_text(encoding="utf-8"))
+    # Каждый отчёт содержит только своё задание
+    assert big["counters"]["iterations"] == 40 * (5 + 60)
+    assert other["counters"]["iterations"] == 4 * (5 + 60)
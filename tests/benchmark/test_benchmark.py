@@ -0,0 +1,44 @@
+import copy
+
+import pytest
+
+from src.benchmark.benchmark_case import BenchmarkCase
+from src.benchmark.benchmark_runner import BenchmarkRunner
+from src.benchmark.report_comparator import ReportComparator
+
+
+@pytest.fixture
+def report() -> dict:
+    runner = BenchmarkRunner(repeat=2, seed=1)
+    cases = [BenchmarkCase(renderer_type, 16, 16, 3, 40, 2, ("LinearTrans", "DiskTrans"))
+             for renderer_type in ("simple", "numpy")]
+    return runner.run(cases)
+
+
+def test_report_has_stage_metrics(report: dict) -> None:
+    assert [case["params"]["renderer_type"] for case in report["cases"]] == ["simple", "numpy"]
+    for case in report["cases"]:
+        assert case["points"] == 3 * 39 * 2
+        assert case["points_per_second"] > 0
+        assert set(case["stages"]) == {"render", "process", "save"}
+        for stage in case["stages"].values():
+            assert 0 < stage["seconds"] <= stage["mean_seconds"]
+            assert stage["peak_memory_bytes"] > 0
+
+
+def test_compare_flags_slowdown(report: dict) -> None:
+    slower = copy.deepcopy(report)
+    slower["cases"][1]["stages"]["process"]["seconds"] *= 2
+    regressions = ReportComparator(threshold=0.5).compare(report, slower)
+    assert [(regression.case, regression.stage, regression.metric) for regression in regressions] == [
+        (report["cases"][1]["name"], "process", "seconds")
+    ]
+    assert regressions[0].ratio == pytest.approx(2)
+
+
+def test_compare_ignores_speedups_and_unknown_cases(report: dict) -> None:
+    faster = copy.deepcopy(report)
+    for case in faster["cases"]:
+        case["stages"]["render"]["seconds"] /= 2
+    faster["cases"].append({**faster["cases"][0], "name": "new"})
+    assert ReportComparator().compare(report, faster) == []
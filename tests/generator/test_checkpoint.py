@@ -0,0 +1,106 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from src.generator.checkpoint import Checkpoint
+from src.generator.fractal_generator import FractalGenerator
+from src.model.fractal_image import FractalImage
+from src.model.precision import Precision, set_precision
+from src.model.rect import Rect
+from src.processor.image_processor import ImageProcessor
+from src.renderer.abstract_renderer import AbstractRenderer
+from src.renderer.multi_thread_renderer import MultiThreadRenderer
+from src.renderer.numpy_renderer import NumpyRenderer
+from src.renderer.single_thread_renderer import SingleThreadRenderer
+from src.transforms.disk_transformation import DiskTransformation
+
+
+class _NoProcessor(ImageProcessor):
+    def processor(self, image: FractalImage) -> None:
+        pass
+
+
+def _renderer(samples: int) -> SingleThreadRenderer:
+    return SingleThreadRenderer(5, 4, samples, 60, 2, [DiskTransformation()], seed=2**100 + 5)
+
+
+def test_save_and_load(tmp_path: Path) -> None:
+    path = tmp_path / "state.npz"
+    checkpoint = Checkpoint.start(_renderer(4), 8, 6, Rect(-1, -1, 2, 2))
+    checkpoint.image.hits[2, 3] = 7
+    checkpoint.image.sums[2, 3] = (7, 14, 21)
+    checkpoint.samples_done = 3
+    checkpoint.save(path)
+
+    loaded = Checkpoint.load(path)
+    assert np.array_equal(loaded.image.hits, checkpoint.image.hits)
+    assert np.array_equal(loaded.image.sums, checkpoint.image.sums)
+    assert loaded.entropy == checkpoint.entropy == 2**100 + 5
+    assert loaded.samples_done == 3
+    assert loaded.settings == checkpoint.settings
+    assert [vars(t.affine_coef) for t in loaded.affine_transformations] == \
+           [vars(t.affine_coef) for t in checkpoint.affine_transformations]
+    loaded.check_compatible(_renderer(10), 8, 6, Rect(-1, -1, 2, 2))
+
+
+def test_load_rejects_other_version(tmp_path: Path) -> None:
+    path = tmp_path / "state.npz"
+    Checkpoint.start(_renderer(4), 8, 6, Rect(-1, -1, 2, 2)).save(path)
+    with np.load(path) as data:
+        arrays = {name: data[name] for name in data.files}
+    arrays["version"] = np.array(1)
+    np.savez_compressed(path, **arrays)
+    with pytest.raises(ValueError, match="version"):
+        Checkpoint.load(path)
+
+
+def test_resume_adds_only_missing_samples(tmp_path: Path) -> None:
+    world = Rect(-1, -1, 2, 2)
+    path = tmp_path / "state.npz"
+    FractalGenerator.generate_resumable(16, 16, world, _renderer(6), _NoProcessor(), path, passes=3)
+    assert Checkpoint.load(path).samples_done == 6
+
+    calls = []
+    resumed = FractalGenerator.generate_resumable(16, 16, world, _renderer(12), _NoProcessor(), path, resume=True,
+                                                  passes=2, callbacks=[lambda _, *progress: calls.append(progress)])
+    assert calls == [(1, 2, 9), (2, 2, 12)]
+    expected = _renderer(12).render(16, 16, world)
+    assert np.array_equal(resumed.hits, expected.hits)
+    assert np.array_equal(resumed.sums, expected.sums)
+    assert Checkpoint.load(path).samples_done == 12
+
+
+def test_resume_rejects_other_world(tmp_path: Path) -> None:
+    path = tmp_path / "state.npz"
+    FractalGenerator.generate_resumable(8, 8, Rect(-1, -1, 2, 2), _renderer(2), _NoProcessor(), path)
+    with pytest.raises(ValueError, match="world"):
+        FractalGenerator.generate_resumable(8, 8, Rect(0, 0, 1, 1), _renderer(4), _NoProcessor(), path, resume=True)
+
+
+def _numpy_renderer(batch_size: int = 64) -> NumpyRenderer:
+    return NumpyRenderer(5, 4, 4, 60, 2, [DiskTransformation()], batch_size=batch_size, seed=2**100 + 5)
+
+
+@pytest.mark.parametrize("other", [_renderer(4), _numpy_renderer(32)])
+def test_resume_rejects_other_random_streams(other: AbstractRenderer) -> None:
+    checkpoint = Checkpoint.start(_numpy_renderer(), 8, 8, Rect(-1, -1, 2, 2))
+    checkpoint.check_compatible(_numpy_renderer(), 8, 8, Rect(-1, -1, 2, 2))
+    with pytest.raises(ValueError, match="settings"):
+        checkpoint.check_compatible(other, 8, 8, Rect(-1, -1, 2, 2))
+
+
+def test_resume_accepts_other_parallel_renderer() -> None:
+    checkpoint = Checkpoint.start(_renderer(4), 8, 8, Rect(-1, -1, 2, 2))
+    checkpoint.check_compatible(MultiThreadRenderer(5, 4, 8, 60, 2, [DiskTransformation()], workers=2),
+                                8, 8, Rect(-1, -1, 2, 2))
+
+
+def test_resume_rejects_other_precision() -> None:
+    checkpoint = Checkpoint.start(_renderer(4), 8, 8, Rect(-1, -1, 2, 2))
+    set_precision(Precision.decimal)
+    try:
+        with pytest.raises(ValueError, match="settings"):
+            checkpoint.check_compatible(_renderer(4), 8, 8, Rect(-1, -1, 2, 2))
+    finally:
+        set_precision(Precision.float64)
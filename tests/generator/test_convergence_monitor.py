@@ -0,0 +1,113 @@
+import logging
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from src.generator.checkpoint import Checkpoint
+from src.generator.convergence_monitor import ConvergenceMonitor
+from src.generator.fractal_generator import FractalGenerator
+from src.model.fractal_image import FractalImage
+from src.model.rect import Rect
+from src.processor.image_processor import ImageProcessor
+from src.renderer.single_thread_renderer import SingleThreadRenderer
+from src.transforms.disk_transformation import DiskTransformation
+from src.ui.command_line_args import CommandLineArgs
+
+WORLD = Rect(-1, -1, 2, 2)
+
+
+class _NoProcessor(ImageProcessor):
+    def processor(self, image: FractalImage) -> None:
+        pass
+
+
+def _renderer(samples: int) -> SingleThreadRenderer:
+    return SingleThreadRenderer(5, 3, samples, 200, 1, [DiskTransformation()], seed=11)
+
+
+def test_density_is_normalized_log() -> None:
+    image = FractalImage.create(3, 1)
+    image.hits[0] = [0, 9, 99]
+    assert ConvergenceMonitor.density(image)[0].tolist() == pytest.approx([0.0, 0.5, 1.0])
+    assert not ConvergenceMonitor.density(FractalImage.create(2, 2)).any()
+
+
+def test_stops_when_image_converges() -> None:
+    renderer = _renderer(400)
+    monitor = ConvergenceMonitor(target=0.02)
+    passes: list[tuple[int, int, int]] = []
+    image = renderer.render(16, 16, WORLD, 40, lambda _, done, total, samples: passes.append((done, total, samples)),
+                            until=monitor)
+
+    assert monitor.converged
+    assert monitor.change < 0.02
+    assert renderer.samples_done == monitor.samples_done < 400
+    # Проход, на котором рендеринг остановился, передаётся как последний
+    assert passes[-1] == (len(passes), len(passes), renderer.samples_done)
+
+    # Сэмплы берут поток по индексу: результат равен рендерингу только samples_done сэмплов
+    expected = _renderer(renderer.samples_done).render(16, 16, WORLD)
+    assert np.array_equal(image.hits, expected.hits)
+    assert np.array_equal(image.sums, expected.sums)
+
+
+def test_stops_when_time_budget_runs_out() -> None:
+    renderer = _renderer(40)
+    monitor = ConvergenceMonitor(seconds=1e-9)
+    renderer.render(8, 8, WORLD, 4, until=monitor)
+    assert renderer.samples_done == monitor.samples_done == 10
+    assert not monitor.converged
+
+
+def test_renders_all_samples_without_convergence() -> None:
+    renderer = _renderer(40)
+    monitor = ConvergenceMonitor(target=1e-12)
+    renderer.render(8, 8, WORLD, 4, until=monitor)
+    assert renderer.samples_done == monitor.samples_done == 40
+
+
+def test_rejects_bad_settings() -> None:
+    with pytest.raises(ValueError, match="target change or a time budget"):
+        ConvergenceMonitor()
+    with pytest.raises(ValueError, match="target"):
+        ConvergenceMonitor(target=0)
+    with pytest.raises(ValueError, match="Time budget"):
+        ConvergenceMonitor(seconds=-1)
+
+
+def test_checkpoint_is_saved_when_render_stops(tmp_path: Path) -> None:
+    path = tmp_path / "state.npz"
+    renderer = _renderer(40)
+    FractalGenerator.generate_resumable(8, 8, WORLD, renderer, _NoProcessor(), path, passes=4,
+                                        until=ConvergenceMonitor(seconds=1e-9))
+    assert Checkpoint.load(path).samples_done == 10
+
+
+def test_generator_reports_used_samples(tmp_path: Path, caplog: pytest.LogCaptureFixture) -> None:
+    config = CommandLineArgs.from_dict({
+        "image.width": 16, "image.height": 16, "rect.cordX": -1, "rect.cordY": -1, "rect.width": 2,
+        "rect.height": 2, "renderer.type": "single", "affineCount": 3, "samples": 400, "iterSamples": 200,
+        "symmetry": 1, "steps": 5, "processor.gamma": 2.2, "transformations.DiskTrans": True,
+        "saver.format": "png", "saver.path": str(tmp_path / "out"), "seed": 11,
+        "convergence.target": 0.02, "convergence.passes": 40,
+    })
+    with caplog.at_level(logging.INFO):
+        FractalGenerator().execute(config)
+    assert (tmp_path / "out.png").exists()
+    assert any("Convergence: converged after" in record.getMessage() for record in caplog.records)
+    assert FractalGenerator.convergence_spec(config) == {"convergence": {"target": 0.02, "passes": 40}}
+
+
+def test_cached_generation_reports_used_samples(tmp_path: Path, caplog: pytest.LogCaptureFixture) -> None:
+    config = CommandLineArgs.from_dict({
+        "image.width": 16, "image.height": 16, "rect.cordX": -1, "rect.cordY": -1, "rect.width": 2,
+        "rect.height": 2, "renderer.type": "single", "affineCount": 3, "samples": 400, "iterSamples": 200,
+        "symmetry": 1, "steps": 5, "processor.gamma": 2.2, "transformations.DiskTrans": True,
+        "saver.format": "png", "saver.path": str(tmp_path / "out"), "seed": 11,
+        "convergence.target": 0.02, "convergence.passes": 40, "cache.dir": str(tmp_path / "cache"),
+    })
+    with caplog.at_level(logging.INFO):
+        FractalGenerator().execute(config)
+    assert (tmp_path / "out.png").exists()
+    assert any("Convergence: converged after" in record.getMessage() for record in caplog.records)
@@ -0,0 +1,49 @@
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+from src.generator.preview_writer import PreviewWriter
+from src.model.rect import Rect
+from src.processor.log_gamma_correction_image_processor import LogGammaCorrectionImageProcessor
+from src.renderer.single_thread_renderer import SingleThreadRenderer
+from src.saver.encoder_options import EncoderOptions
+from src.saver.fornat_image_saver import FormatImageSaver
+from src.transforms.disk_transformation import DiskTransformation
+
+
+def _renderer() -> SingleThreadRenderer:
+    return SingleThreadRenderer(5, 4, 10, 60, 2, [DiskTransformation()], seed=11)
+
+
+def test_passes_do_not_change_result() -> None:
+    world = Rect(-1, -1, 2, 2)
+    calls = []
+    whole = _renderer().render(16, 16, world)
+    progressive = _renderer().render(16, 16, world, 4, lambda _, *progress: calls.append(progress))
+    assert calls == [(1, 4, 3), (2, 4, 6), (3, 4, 8), (4, 4, 10)]
+    assert np.array_equal(whole.hits, progressive.hits)
+    assert np.array_equal(whole.sums, progressive.sums)
+
+
+def test_preview_is_saved_from_copy(tmp_path: Path) -> None:
+    path = tmp_path / "preview.png"
+    writer = PreviewWriter(LogGammaCorrectionImageProcessor(2.2), FormatImageSaver("png", EncoderOptions.fast()),
+                           path, every_passes=2)
+    image = _renderer().render(16, 16, Rect(-1, -1, 2, 2))
+    sums, rgb, normal = image.sums.copy(), image.rgb.copy(), image.normal.copy()
+
+    writer(image, 1, 5, 2)
+    assert not path.exists()
+    writer(image, 2, 5, 4)
+    assert path.exists()
+    assert np.array_equal(image.sums, sums)
+    assert np.array_equal(image.rgb, rgb)
+    assert np.array_equal(image.normal, normal)
+    writer(image, 4, 5, 8)
+    writer(image, 5, 5, 10)
+    assert writer.saved == 2
+    with Image.open(path) as saved:
+        assert saved.size == (16, 16)
+    assert list(tmp_path.iterdir()) == [path]
+
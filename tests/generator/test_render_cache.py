@@ -0,0 +1,104 @@
+import os
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from src.generator.fractal_generator import FractalGenerator
+from src.generator.render_cache import RenderCache
+from src.model.fractal_image import FractalImage
+from src.renderer.abstract_renderer import AbstractRenderer
+from src.ui.command_line_args import CommandLineArgs
+
+OPTIONS = {
+    "image.width": 20,
+    "image.height": 14,
+    "rect.cordX": -1,
+    "rect.cordY": -1,
+    "rect.width": 2,
+    "rect.height": 2,
+    "renderer.type": "numpy",
+    "affineCount": 3,
+    "samples": 4,
+    "iterSamples": 80,
+    "symmetry": 2,
+    "steps": 5,
+    "processor.gamma": 2.2,
+    "transformations.DiskTrans": True,
+    "saver.format": "png",
+    "seed": 3,
+}
+
+
+def test_key_is_canonical() -> None:
+    assert RenderCache.key({"a": 1, "b": [1.5, 2]}) == RenderCache.key({"b": [1.5, 2], "a": 1})
+    assert RenderCache.key({"a": 1}) != RenderCache.key({"a": 2})
+
+
+def test_image_and_output_roundtrip(tmp_path: Path) -> None:
+    cache = RenderCache(tmp_path / "cache")
+    image = FractalImage.create(4, 3)
+    image.hits[1, 2] = 5
+    image.sums[1, 2] = (5, 10, 15)
+    assert cache.load_image("render") is None
+
+    cache.store_image("render", image)
+    loaded = cache.load_image("render")
+    assert np.array_equal(loaded.hits, image.hits)
+    assert np.array_equal(loaded.sums, image.sums)
+
+    output = tmp_path / "image.png"
+    output.write_bytes(b"encoded")
+    cache.store_output("output", output)
+    copy = tmp_path / "copy.png"
+    assert cache.load_output("output", copy)
+    assert copy.read_bytes() == b"encoded"
+    assert not cache.load_output("other", tmp_path / "other.png")
+
+
+def test_evicts_least_recently_used(tmp_path: Path) -> None:
+    cache = RenderCache(tmp_path / "cache", max_bytes=25)
+    source = tmp_path / "file.bin"
+    source.write_bytes(b"x" * 10)
+    for index, key in enumerate(("first", "second")):
+        cache.store_output(key, source)
+        os.utime(cache.directory / f"{key}.bin", ns=(index, index))
+    assert cache.load_output("first", tmp_path / "out.bin")
+
+    cache.store_output("third", source)
+
+    assert sorted(path.name for path in cache.directory.iterdir()) == ["first.bin", "third.bin"]
+
+
+def _run(tmp_path: Path, name: str, **options: object) -> Path:
+    config = CommandLineArgs.from_dict({**OPTIONS, "cache.dir": str(tmp_path / "cache"),
+                                        "saver.path": str(tmp_path / name), **options})
+    FractalGenerator().execute(config)
+    return tmp_path / f"{name}.{config.get('saver.format')}"
+
+
+def test_generator_reuses_cached_output_and_histogram(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    first = _run(tmp_path, "first")
+    assert sorted(path.suffix for path in (tmp_path / "cache").iterdir()) == [".npz", ".png"]
+
+    def fail(*args: object, **kwargs: object) -> None:
+        raise AssertionError
+
+    monkeypatch.setattr(AbstractRenderer, "render", fail)
+    repeat = _run(tmp_path, "repeat")
+    assert repeat.read_bytes() == first.read_bytes()
+
+    regamma = _run(tmp_path, "regamma", **{"processor.gamma": 1.0})
+    assert len(list((tmp_path / "cache").iterdir())) == 3
+    monkeypatch.undo()
+    expected = _run(tmp_path, "expected", **{"processor.gamma": 1.0, "cache.dir": None})
+    assert regamma.read_bytes() == expected.read_bytes() != first.read_bytes()
+
+    webp = _run(tmp_path, "webp", **{"saver.format": "webp"})
+    assert webp.exists()
+    assert len(list((tmp_path / "cache").iterdir())) == 4
+
+
+def test_generator_does_not_cache_unseeded_renders(tmp_path: Path) -> None:
+    _run(tmp_path, "unseeded", seed=None)
+    assert not (tmp_path / "cache").exists()
@@ -0,0 +1,55 @@
+import json
+import pstats
+from pathlib import Path
+
+import pytest
+
+from src.generator.fractal_generator import FractalGenerator
+from src.ui.command_line_args import CommandLineArgs
+from src.utils.render_metrics import RenderMetrics
+
+OPTIONS = {
+    "image.width": 20,
+    "image.height": 14,
+    "rect.cordX": -1,
+    "rect.cordY": -1,
+    "rect.width": 2,
+    "rect.height": 2,
+    "affineCount": 3,
+    "samples": 4,
+    "iterSamples": 80,
+    "symmetry": 2,
+    "steps": 5,
+    "processor.gamma": 2.2,
+    "transformations.DiskTrans": True,
+    "saver.format": "png",
+    "seed": 3,
+}
+
+
+@pytest.mark.parametrize("renderer_type", ["single", "numpy"])
+def test_generator_writes_metrics_report(tmp_path: Path, renderer_type: str) -> None:
+    report_path = tmp_path / "metrics.json"
+    config = CommandLineArgs.from_dict({**OPTIONS, "renderer.type": renderer_type,
+                                        "saver.path": str(tmp_path / "image"), "metrics.path": str(report_path)})
+    FractalGenerator().execute(config)
+
+    report = json.loads(report_path.read_text(encoding="utf-8"))
+    expected = {"affine_generation", "warmup", "iteration", "tone_mapping", "pil_conversion", "encoding"}
+    assert expected <= set(report["stages"])
+    assert list(report["stages"]) == [stage for stage in RenderMetrics.STAGES if stage in report["stages"]]
+    # NumpyRenderer делит сэмпл на полосы, и каждая полоса проходит свою нормализацию
+    assert report["counters"]["iterations"] >= 4 * (5 + 80)
+    assert report["counters"]["out_of_bounds"] >= 0
+    assert report["total_seconds"] >= sum(report["stages"].values()) > 0
+    assert report["workers"][0]["points_per_second"] > 0
+
+
+def test_generator_writes_profile(tmp_path: Path) -> None:
+    profile_path = tmp_path / "render.prof"
+    config = CommandLineArgs.from_dict({**OPTIONS, "renderer.type": "single",
+                                        "saver.path": str(tmp_path / "image"), "profile": str(profile_path)})
+    FractalGenerator().execute(config)
+    assert (tmp_path / "image.png").exists()
+    stats = pstats.Stats(str(profile_path))
+    assert any(function == "render_sample" for _, _, function in stats.stats)  # type: ignore[attr-defined]
@@ -0,0 +1,43 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from src.generator.fractal_generator import FractalGenerator
+from src.generator.tiled_generator import TiledGenerator
+from src.model.rect import Rect
+from src.processor.log_gamma_correction_image_processor import LogGammaCorrectionImageProcessor
+from src.renderer.abstract_renderer import AbstractRenderer
+from src.renderer.numpy_renderer import NumpyRenderer
+from src.renderer.single_thread_renderer import SingleThreadRenderer
+from src.saver.fornat_image_saver import FormatImageSaver
+from src.transforms.disk_transformation import DiskTransformation
+from src.transforms.spherical_transformation import SphericalTransformation
+
+
+def _renderer(renderer_type: str) -> AbstractRenderer:
+    variations = [DiskTransformation(), SphericalTransformation()]
+    if renderer_type == "numpy":
+        return NumpyRenderer(5, 4, 20, 100, 3, variations, batch_size=64, seed=8)
+    return SingleThreadRenderer(5, 4, 20, 100, 3, variations, seed=8)
+
+
+@pytest.mark.parametrize("renderer_type", ["simple", "numpy"])
+def test_tiled_image_matches_whole_image(tmp_path: Path, renderer_type: str) -> None:
+    world = Rect(-1, -1, 2, 2)
+    processor = LogGammaCorrectionImageProcessor(2.2)
+    whole = FractalGenerator.generate(37, 29, world, _renderer(renderer_type), processor)
+    FormatImageSaver("png").save(whole, tmp_path / "whole.png")
+    TiledGenerator(_renderer(renderer_type), processor, 16, tmp_path).generate(37, 29, world, tmp_path / "tiled.png")
+
+    with Image.open(tmp_path / "whole.png") as expected, Image.open(tmp_path / "tiled.png") as actual:
+        assert np.asarray(expected).any()
+        assert np.array_equal(np.asarray(expected), np.asarray(actual))
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["tiled.png", "whole.png"]
+
+
+def test_split_covers_canvas() -> None:
+    tiles = TiledGenerator(_renderer("simple"), LogGammaCorrectionImageProcessor(2.2), 16).split(37, 20)
+    assert tiles == [(0, 0, 16, 16), (16, 0, 16, 16), (32, 0, 5, 16),
+                     (0, 16, 16, 4), (16, 16, 16, 4), (32, 16, 5, 4)]
@@ -0,0 +1,95 @@
+from pathlib import Path
+
+import numpy as np
+
+from src.model.color import Color
+from src.model.fractal_image import FractalImage
+from src.model.point import Point
+from src.model.rect import Rect
+
+
+def test_pixel_is_view_of_image_arrays() -> None:
+    image = FractalImage.create(4, 3)
+    pixel = image.pixel(2, 1)
+    pixel.saturate_hit_count(Color(100, 50, 10))
+    pixel.saturate_hit_count(Color(200, 150, 30))
+    assert image.hits[1, 2] == 2
+    assert image.sums[1, 2].tolist() == [300, 200, 40]
+    image.resolve_colors()
+    assert (pixel.red, pixel.green, pixel.blue) == (150, 100, 20)
+    assert image.resolve_pixel(Rect(0, 0, 4, 3), Point(2.5, 1.5)).hit_count == 2
+    assert image.pixel(4, 0) is None
+
+
+def test_accumulate_merges_weighted_colors() -> None:
+    image = FractalImage.create(2, 1)
+    image.pixel(0, 0).saturate_hit_count(Color(90, 0, 0))
+    hits = np.array([2, 0])
+    color_sums = np.array([[0, 0], [60, 0], [0, 0]], dtype=np.float64)
+    image.accumulate(hits, color_sums)
+    assert image.hits.tolist() == [[3, 0]]
+    image.resolve_colors()
+    assert image.rgb.tolist() == [[[30, 20, 0], [0, 0, 0]]]
+
+
+def test_color_does_not_depend_on_hit_order() -> None:
+    colors = [Color(255, 0, 0), Color(0, 255, 0), Color(0, 0, 255), Color(30, 60, 90)]
+    forward = FractalImage.create(1, 1)
+    backward = FractalImage.create(1, 1)
+    for color in colors:
+        forward.saturate(0, color)
+    for color in reversed(colors):
+        backward.saturate(0, color)
+    assert np.array_equal(forward.sums, backward.sums)
+    forward.resolve_colors()
+    assert forward.rgb[0, 0].tolist() == [71, 78, 86]
+
+
+def test_copy_is_independent() -> None:
+    image = FractalImage.create(2, 2)
+    copy = image.copy()
+    copy.hits[0, 0] = 5
+    assert image.hits[0, 0] == 0
+
+
+def test_window_discards_points_outside() -> None:
+    window = FractalImage.create(2, 2, 4, 4, 2, 0)
+    world = Rect(0, 0, 4, 4)
+    assert window.is_window
+    assert window.resolve_pixel(world, Point(1.5, 0.5)) is None
+    window.resolve_pixel(world, Point(3.5, 1.5)).saturate_hit_count(Color(1, 2, 3))
+    assert window.hits.tolist() == [[0, 0], [0, 1]]
+    assert FractalImage.create(*window.geometry).geometry == (2, 2, 4, 4, 2, 0)
+
+
+def test_merge_matches_accumulate(tmp_path: Path) -> None:
+    rng = np.random.default_rng(4)
+    source = FractalImage.create(5, 3)
+    source.hits[...] = rng.integers(0, 4, source.hits.shape)
+    source.sums[...] = rng.integers(0, 256, source.sums.shape) * source.hits[..., np.newaxis]
+    expected = FractalImage.create(5, 3)
+    expected.pixel(1, 1).saturate_hit_count(Color(10, 20, 30))
+    expected.accumulate(*source.histogram())
+
+    merged = FractalImage.create_mapped(tmp_path, 5, 3)
+    merged.pixel(1, 1).saturate_hit_count(Color(10, 20, 30))
+    merged.MERGE_BLOCK_PIXELS = 5
+    merged.merge(source)
+    merged.flush()
+    reopened = FractalImage.open_mapped(tmp_path)
+    assert np.array_equal(reopened.hits, expected.hits)
+    assert np.array_equal(reopened.sums, expected.sums)
+
+
+def test_hit_counts_do_not_wrap_at_32_bits(tmp_path: Path) -> None:
+    large = 3 << 31
+    hits = np.full(2, large, dtype=np.int64)
+    image = FractalImage.create(2, 1)
+    image.accumulate(hits, np.zeros((3, 2)))
+    image.accumulate(hits, np.zeros((3, 2)))
+    assert image.hits.tolist() == [[2 * large, 2 * large]]
+
+    mapped = FractalImage.create_mapped(tmp_path, 2, 1)
+    mapped.merge(image)
+    mapped.merge(image)
+    assert mapped.hits.tolist() == [[4 * large, 4 * large]]
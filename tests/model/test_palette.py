@@ -0,0 +1,70 @@
+import colorsys
+
+import numpy as np
+import pytest
+
+from src.model.affine_coef import AffineCoefficient
+from src.model.color import Color
+from src.model.fractal_image import FractalImage
+from src.model.palette import Palette
+from src.processor.log_gamma_correction_image_processor import LogGammaCorrectionImageProcessor
+
+
+def test_lookup_clips_and_rounds_coordinates() -> None:
+    palette = Palette(np.array([[0, 0, 0], [100, 100, 100], [200, 200, 200]], dtype=np.uint8))
+    result = palette.lookup(np.array([-1.0, 0.0, 0.3, 0.5, 1.0, 2.0]))
+    assert result[:, 0].tolist() == [0, 0, 100, 100, 200, 200]
+
+
+@pytest.mark.parametrize("name", Palette.names())
+@pytest.mark.parametrize("size", [256, 1024])
+def test_named_palettes_have_requested_size(name: str, size: int) -> None:
+    palette = Palette.from_name(name, size)
+    assert palette.size == size
+    assert palette.table.dtype == np.uint8
+
+
+def test_palette_rejects_bad_tables() -> None:
+    with pytest.raises(ValueError, match="shape"):
+        Palette(np.zeros((4, 4), dtype=np.uint8))
+    with pytest.raises(ValueError, match="Unknown palette"):
+        Palette.from_name("missing")
+
+
+def test_color_coordinate_is_hue() -> None:
+    coef = AffineCoefficient({"a": 0, "b": 0, "c": 0, "d": 0, "e": 0, "f": 0}, Color(0, 255, 255))
+    assert coef.color_coordinate == pytest.approx(colorsys.rgb_to_hsv(0, 1, 1)[0])
+
+
+def test_one_accumulator_recolors_with_any_palette() -> None:
+    image = FractalImage.create(2, 1, channels=1)
+    image.saturate_coordinate(0, 0.0)
+    image.saturate_coordinate(0, 1.0)
+    image.saturate_coordinate(1, 1.0)
+    assert image.sums.shape == (1, 2, 1)
+
+    images = []
+    for name in ("grayscale", "fire"):
+        copy = FractalImage.create(2, 1, channels=1)
+        copy.assign(image.hits, image.sums)
+        LogGammaCorrectionImageProcessor(1.0, palette=Palette.from_name(name)).processor(copy)
+        images.append(copy.rgb.copy())
+    assert not np.array_equal(images[0], images[1])
+    # Средняя координата самого яркого пикселя — середина палитры
+    assert images[0][0, 0].tolist() == Palette.from_name("grayscale").lookup(np.array([0.5]))[0].tolist()
+
+
+def test_palette_image_needs_palette() -> None:
+    image = FractalImage.create(1, 1, channels=1)
+    image.saturate_coordinate(0, 0.5)
+    with pytest.raises(ValueError, match="palette"):
+        image.resolve_colors()
+
+
+def test_pixel_adds_color_coordinate_to_palette_image() -> None:
+    image = FractalImage.create(3, 2, channels=1)
+    image.pixel(1, 1).saturate_hit_count(0.25)
+    image.pixel(1, 1).saturate_hit_count(0.75)
+    image.pixel(2, 0).saturate_hit_count(1.0)
+    assert image.hits.tolist() == [[0, 0, 1], [0, 2, 0]]
+    assert image.sums[..., 0].tolist() == [[0.0, 0.0, 1.0], [0.0, 1.0, 0.0]]
@@ -0,0 +1,34 @@
+from collections.abc import Iterator
+from decimal import Decimal
+
+import pytest
+
+from src.model.affine_coef import AffineCoefficient
+from src.model.color import Color
+from src.model.point import Point
+from src.model.precision import Precision, get_precision, set_precision
+from src.model.rect import Rect
+from src.transforms.affine_transformation import AffineTransformation
+
+
+@pytest.fixture
+def decimal_precision() -> Iterator[None]:
+    set_precision(Precision.decimal)
+    yield
+    set_precision(Precision.float64)
+
+
+def test_float_precision_by_default() -> None:
+    assert get_precision() is Precision.float64
+    point = Point(Decimal("0.5"), 1)
+    assert isinstance(point.x, float)
+    assert isinstance(point.y, float)
+
+
+def test_decimal_precision(decimal_precision: None) -> None:
+    coef = {"a": 1, "b": 0, "c": 0, "d": 0, "e": 1, "f": Decimal("0.1")}
+    affine = AffineTransformation(AffineCoefficient(coef, Color(0, 0, 0)))
+    point = affine.apply(Point(Decimal("0.2"), Decimal("0.2")))
+    assert point.y == Decimal("0.3")
+    rotated = Rect(-1, -1, 2, 2).rotate_point(point, 0.5)
+    assert isinstance(rotated.x, Decimal)
@@ -0,0 +1,53 @@
+import math
+
+import numpy as np
+import pytest
+
+from src.model.point import Point
+from src.model.rect import Rect
+from src.model.symmetry_table import SymmetryTable
+
+
+@pytest.fixture
+def world() -> Rect:
+    return Rect(-1, -2, 4, 3)
+
+
+@pytest.mark.parametrize("symmetry", [2, 3, 4, 7])
+def test_apply_matches_rotate_point(world: Rect, symmetry: int) -> None:
+    table = SymmetryTable(world, symmetry)
+    point = Point(0.3, -0.7)
+    expected = [world.rotate_point(point, 2 * math.pi * k / symmetry) for k in range(1, symmetry + 1)]
+    actual = table.apply(point)
+    assert len(actual) == symmetry
+    for got, want in zip(actual, expected, strict=True):
+        assert got.x == pytest.approx(want.x, abs=1e-12)
+        assert got.y == pytest.approx(want.y, abs=1e-12)
+
+
+def test_apply_batch_matches_apply(world: Rect) -> None:
+    table = SymmetryTable(world, 5)
+    x = np.array([0.3, -0.9, 2.5])
+    y = np.array([-0.7, 0.1, -1.5])
+    sym_x, sym_y = table.apply_batch(x, y)
+    assert sym_x.shape == (15,)
+    for index in range(len(x)):
+        for k, point in enumerate(table.apply(Point(x[index], y[index]))):
+            assert sym_x[k * len(x) + index] == pytest.approx(point.x)
+            assert sym_y[k * len(x) + index] == pytest.approx(point.y)
+
+
+def test_quarter_turns_are_exact(world: Rect) -> None:
+    table = SymmetryTable(world, 4)
+    assert table.rotations == [(0.0, 1.0), (-1.0, 0.0), (0.0, -1.0), (1.0, 0.0)]
+
+
+def test_single_symmetry_returns_point(world: Rect) -> None:
+    table = SymmetryTable(world, 1)
+    point = Point(0.3, -0.7)
+    assert table.apply(point) == [point]
+
+
+def test_invalid_symmetry(world: Rect) -> None:
+    with pytest.raises(ValueError, match="Symmetry"):
+        SymmetryTable(world, 0)
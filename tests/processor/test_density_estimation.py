@@ -0,0 +1,82 @@
+import numpy as np
+import pytest
+
+from src.model.fractal_image import FractalImage
+from src.processor.density_estimation_image_processor import DensityEstimationImageProcessor
+
+
+def test_single_hit_is_spread_and_mass_preserved() -> None:
+    image = FractalImage.create(21, 21)
+    image.hits[10, 10] = 100
+    image.sums[10, 10] = (25500, 12800, 0)
+
+    DensityEstimationImageProcessor(max_radius=20, curve=0.5).processor(image)
+    image.resolve_colors()
+
+    assert image.hits[10, 10] < 100
+    assert image.hits[10, 11] > 0
+    assert image.hits[11, 10] == pytest.approx(image.hits[10, 11])
+    assert abs(int(image.hits.sum()) - 100) <= 10
+    assert image.rgb[image.hits > 0].tolist()[0] == [255, 128, 0]
+
+
+def test_dense_pixels_stay_sharp() -> None:
+    image = FractalImage.create(5, 5)
+    image.hits[2, 2] = 10000
+    image.sums[2, 2] = (100000, 200000, 300000)
+
+    DensityEstimationImageProcessor(max_radius=2, curve=0.5).processor(image)
+    image.resolve_colors()
+
+    assert image.hits[2, 2] == 10000
+    assert int(image.hits.sum()) == 10000
+    assert image.rgb[2, 2].tolist() == [10, 20, 30]
+
+
+def test_sparse_hits_blurred_more_than_dense() -> None:
+    image = FractalImage.create(40, 20)
+    image.hits[10, 10] = 1
+    image.hits[10, 30] = 10000
+
+    DensityEstimationImageProcessor(max_radius=4, curve=0.5).processor(image)
+
+    assert 0 < image.hits[10, 10] < 1
+    assert image.hits[:, :20].sum() == pytest.approx(1)
+    assert np.count_nonzero(image.hits[:, :20]) > 1
+    assert image.hits[10, 30] == 10000
+    assert image.hits[:, 20:].sum() == 10000
+
+
+def test_sparse_hits_are_not_lost() -> None:
+    image = FractalImage.create(21, 21)
+    for y, x in [(5, 5), (5, 15), (15, 5)]:
+        image.hits[y, x] = 1
+        image.sums[y, x] = (200, 100, 50)
+    image.hits[15, 15] = 50
+    image.sums[15, 15] = (0, 0, 50 * 255)
+
+    DensityEstimationImageProcessor(max_radius=3, curve=0.5).processor(image)
+    image.resolve_colors()
+
+    assert image.hits.sum() == pytest.approx(53)
+    assert image.hits[2:9, 2:9].sum() == pytest.approx(1)
+    assert np.count_nonzero(image.hits[2:9, 2:9]) == 49
+    assert image.rgb[4, 4].tolist() == [200, 100, 50]
+
+
+def test_empty_image_unchanged() -> None:
+    image = FractalImage.create(4, 3)
+    DensityEstimationImageProcessor(3).processor(image)
+    assert not image.hits.any()
+
+
+@pytest.mark.parametrize("radius", [0.5, 1.0, 2.5, 6.0])
+def test_kernel_is_normalized(radius: float) -> None:
+    weights = DensityEstimationImageProcessor.kernel(radius)
+    assert weights.sum() == pytest.approx(1.0)
+    assert np.allclose(weights, weights[::-1])
+
+
+def test_negative_radius_rejected() -> None:
+    with pytest.raises(ValueError, match="radius"):
+        DensityEstimationImageProcessor(-1)
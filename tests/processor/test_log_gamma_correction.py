@@ -0,0 +1,41 @@
+import math
+
+import numpy as np
+import pytest
+
+from src.model.fractal_image import FractalImage
+from src.processor.log_gamma_correction_image_processor import LogGammaCorrectionImageProcessor
+
+
+def _reference(hits: np.ndarray, rgb: np.ndarray, gamma: float) -> np.ndarray:
+    normal = np.zeros(hits.shape)
+    max_value = 0.00000001
+    for index, hit_count in np.ndenumerate(hits):
+        if hit_count > 0:
+            normal[index] = math.log10(hit_count)
+            max_value = max(max_value, normal[index])
+    result = np.zeros_like(rgb)
+    for index, value in np.ndenumerate(normal):
+        correction_factor = math.pow(value / max_value, 1.0 / gamma)
+        result[index] = [int(int(channel) * correction_factor) for channel in rgb[index]]
+    return result
+
+
+@pytest.mark.parametrize("gamma", [0.45, 1.0, 2.2])
+def test_log_gamma_matches_per_pixel_reference(gamma: float) -> None:
+    rng = np.random.default_rng(7)
+    image = FractalImage.create(40, 30)
+    image.hits[...] = rng.integers(0, 5000, image.hits.shape) * rng.integers(0, 2, image.hits.shape)
+    colors = rng.integers(0, 256, image.rgb.shape)
+    image.sums[...] = colors * image.hits[..., np.newaxis]
+    expected = _reference(image.hits, colors, gamma)
+
+    LogGammaCorrectionImageProcessor(gamma).processor(image)
+
+    assert np.array_equal(image.rgb, expected)
+
+
+def test_log_gamma_empty_image() -> None:
+    image = FractalImage.create(3, 2)
+    LogGammaCorrectionImageProcessor(2.2).processor(image)
+    assert not image.rgb.any()
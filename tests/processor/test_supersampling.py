@@ -0,0 +1,76 @@
+import numpy as np
+import pytest
+
+from src.model.fractal_image import FractalImage
+from src.processor.composite_image_processor import CompositeImageProcessor
+from src.processor.log_gamma_correction_image_processor import LogGammaCorrectionImageProcessor
+from src.processor.supersampling_image_processor import SupersamplingImageProcessor
+from src.processor.supersampling_kernel import SupersamplingKernel
+
+
+def _random_image(width: int, height: int, seed: int = 3) -> FractalImage:
+    rng = np.random.default_rng(seed)
+    image = FractalImage.create(width, height)
+    image.hits[...] = rng.integers(0, 50, image.hits.shape)
+    image.sums[...] = rng.integers(0, 256, image.sums.shape) * image.hits[..., np.newaxis]
+    return image
+
+
+def test_box_sums_hits_and_averages_colors() -> None:
+    image = FractalImage.create(2, 2)
+    image.hits[...] = [[1, 3], [0, 0]]
+    image.sums[0, 0] = (200, 0, 0)
+    image.sums[0, 1] = (0, 300, 120)
+
+    SupersamplingImageProcessor(2).processor(image)
+    image.resolve_colors()
+
+    assert (image.width, image.height) == (1, 1)
+    assert image.hits.tolist() == [[4]]
+    assert image.rgb[0, 0].tolist() == [50, 75, 30]
+
+
+@pytest.mark.parametrize("kernel", list(SupersamplingKernel))
+def test_kernels_preserve_total_hits(kernel: SupersamplingKernel) -> None:
+    image = FractalImage.create(24, 18)
+    rng = np.random.default_rng(5)
+    image.hits[4:14, 5:19] = rng.integers(0, 50, (10, 14))
+    total = int(image.hits.sum())
+
+    SupersamplingImageProcessor(3, kernel).processor(image)
+
+    assert (image.width, image.height) == (8, 6)
+    assert abs(int(image.hits.sum()) - total) <= image.hits.size
+
+
+@pytest.mark.parametrize("kernel", list(SupersamplingKernel))
+@pytest.mark.parametrize("factor", [1, 2, 3, 4])
+def test_kernel_weights_sum_to_factor(kernel: SupersamplingKernel, factor: int) -> None:
+    assert kernel.weights(factor).sum() == pytest.approx(factor)
+
+
+def test_factor_one_box_is_noop() -> None:
+    image = _random_image(6, 4)
+    expected = image.copy()
+
+    SupersamplingImageProcessor(1).processor(image)
+
+    assert np.array_equal(image.hits, expected.hits)
+    assert np.array_equal(image.sums, expected.sums)
+
+
+def test_size_must_be_multiple_of_factor() -> None:
+    with pytest.raises(ValueError, match="multiple"):
+        SupersamplingImageProcessor(2).processor(FractalImage.create(3, 4))
+
+
+def test_composite_applies_processors_in_order() -> None:
+    image = _random_image(8, 8)
+    expected = image.copy()
+    SupersamplingImageProcessor(2).processor(expected)
+    LogGammaCorrectionImageProcessor(2.2).processor(expected)
+
+    CompositeImageProcessor([SupersamplingImageProcessor(2), LogGammaCorrectionImageProcessor(2.2)]).processor(image)
+
+    assert np.array_equal(image.hits, expected.hits)
+    assert np.array_equal(image.rgb, expected.rgb)
@@ -0,0 +1,31 @@
+from decimal import Decimal
+
+import pytest
+
+from src.model.affine_coef import AffineCoefficient
+from src.model.color import Color
+from src.model.rect import Rect
+from src.transforms.affine_transformation import AffineTransformation
+
+
+@pytest.fixture
+def world() -> Rect:
+    return Rect(0, 0, 1, 1)
+
+
+@pytest.fixture
+def sierpinski_transformations() -> list[AffineTransformation]:
+    shifts = [(0, 0), (Decimal("0.5"), 0), (0, Decimal("0.5"))]
+    colors = [Color(255, 0, 0), Color(0, 255, 0), Color(0, 0, 255)]
+    transformations = []
+    for (c, f), color in zip(shifts, colors, strict=True):
+        coef: dict[str, Decimal] = {
+            "a": Decimal("0.5"),
+            "b": Decimal(0),
+            "c": Decimal(c),
+            "d": Decimal(0),
+            "e": Decimal("0.5"),
+            "f": Decimal(f)
+        }
+        transformations.append(AffineTransformation(AffineCoefficient(coef, color)))
+    return transformations
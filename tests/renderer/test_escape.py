@@ -0,0 +1,64 @@
+from collections.abc import Callable
+from decimal import Decimal
+
+import pytest
+
+from src.model.affine_coef import AffineCoefficient
+from src.model.color import Color
+from src.model.fractal_image import FractalImage
+from src.model.precision import Precision, set_precision
+from src.model.rect import Rect
+from src.renderer.abstract_renderer import AbstractRenderer
+from src.renderer.multi_thread_renderer import MultiThreadRenderer
+from src.renderer.numpy_renderer import NumpyRenderer
+from src.renderer.single_thread_renderer import SingleThreadRenderer
+from src.transforms.affine_transformation import AffineTransformation
+from src.transforms.spherical_transformation import SphericalTransformation
+
+RENDERERS: list[Callable[..., AbstractRenderer]] = [
+    lambda **kwargs: SingleThreadRenderer(**kwargs),
+    lambda **kwargs: MultiThreadRenderer(workers=2, **kwargs),
+    lambda **kwargs: NumpyRenderer(batch_size=16, **kwargs),
+]
+
+
+def _collapse() -> AffineTransformation:
+    # Сжатие в начало координат: Spherical делит на ноль, точка улетает
+    coef = {name: Decimal(0) for name in "abcdef"}
+    return AffineTransformation(AffineCoefficient(coef, Color(255, 255, 255)))
+
+
+@pytest.mark.parametrize("create", RENDERERS)
+def test_escaped_points_are_reseeded_and_never_plotted(create: Callable[..., AbstractRenderer], world: Rect) -> None:
+    renderer = create(steps_for_normalization=5, affine_count=1, samples=4, iter_per_sample=30, symmetry=2,
+                      variations=[SphericalTransformation()], seed=1)
+    image = FractalImage.create(8, 8)
+    renderer.render_image(image, world, [_collapse()])
+    assert image.hits.sum() == 0
+    assert renderer.discarded > 0
+
+
+def test_every_escaped_step_is_counted(world: Rect) -> None:
+    renderer = SingleThreadRenderer(5, 1, 4, 30, 1, [SphericalTransformation()], seed=1)
+    renderer.render_image(FractalImage.create(8, 8), world, [_collapse()])
+    assert renderer.discarded == 4 * (5 + 30)
+
+
+@pytest.mark.parametrize("precision", list(Precision))
+@pytest.mark.parametrize("create", RENDERERS)
+def test_escapes_do_not_stop_other_points(create: Callable[..., AbstractRenderer], precision: Precision,
+                                          sierpinski_transformations: list[AffineTransformation]) -> None:
+    set_precision(precision)
+    try:
+        # Коэффициенты пересоздаются, чтобы их тип соответствовал режиму точности
+        affines = [AffineTransformation(AffineCoefficient({name: getattr(t.affine_coef, name) for name in "abcdef"},
+                                                          t.affine_coef.color))
+                   for t in sierpinski_transformations]
+        renderer = create(steps_for_normalization=5, affine_count=4, samples=8, iter_per_sample=100, symmetry=1,
+                          variations=[SphericalTransformation()], seed=2)
+        image = FractalImage.create(16, 16)
+        renderer.render_image(image, Rect(-4, -4, 8, 8), [*affines, _collapse()])
+    finally:
+        set_precision(Precision.float64)
+    assert renderer.discarded > 0
+    assert image.hits.sum() > 0
@@ -0,0 +1,45 @@
+import numpy as np
+
+from src.model.fractal_image import FractalImage
+from src.model.rect import Rect
+from src.renderer.numpy_renderer import NumpyRenderer
+from src.renderer.single_thread_renderer import SingleThreadRenderer
+from src.transforms.affine_transformation import AffineTransformation
+from src.transforms.linear_transformation import LinearTransformation
+from src.utils.render_metrics import RenderMetrics
+
+
+def _hits(image: FractalImage) -> np.ndarray:
+    return image.hits.reshape(-1).astype(np.float64)
+
+
+def test_numpy_renderer_plots_every_point(world: Rect,
+                                          sierpinski_transformations: list[AffineTransformation]) -> None:
+    renderer = NumpyRenderer(5, 3, 16, 101, 1, [LinearTransformation()], batch_size=64)
+    image = FractalImage.create(16, 16)
+    renderer.render_image(image, world, sierpinski_transformations)
+    assert _hits(image).sum() == 16 * 100
+
+
+def test_numpy_renderer_matches_single_thread(world: Rect,
+                                              sierpinski_transformations: list[AffineTransformation]) -> None:
+    single_image = FractalImage.create(8, 8)
+    SingleThreadRenderer(5, 3, 20, 500, 1, [LinearTransformation()]).render_image(
+        single_image, world, sierpinski_transformations)
+    numpy_image = FractalImage.create(8, 8)
+    NumpyRenderer(5, 3, 20, 500, 1, [LinearTransformation()]).render_image(
+        numpy_image, world, sierpinski_transformations)
+
+    single_hits = _hits(single_image)
+    numpy_hits = _hits(numpy_image)
+    assert np.corrcoef(single_hits, numpy_hits)[0, 1] > 0.9
+    assert np.array_equal(single_hits == 0, numpy_hits == 0)
+
+
+def test_numpy_renderer_keeps_warmup_small(world: Rect,
+                                           sierpinski_transformations: list[AffineTransformation]) -> None:
+    renderer = NumpyRenderer(10, 3, 20, 200, 1, [LinearTransformation()])
+    renderer.metrics = RenderMetrics()
+    renderer.render_image(FractalImage.create(8, 8), world, sierpinski_transformations)
+    scalar_iterations = 20 * (10 + 200)
+    assert scalar_iterations <= renderer.metrics.counters["iterations"] <= 1.1 * scalar_iterations
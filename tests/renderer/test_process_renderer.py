@@ -0,0 +1,56 @@
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from src.model.fractal_image import FractalImage
+from src.model.rect import Rect
+from src.renderer import process_renderer
+from src.renderer.process_renderer import ProcessRenderer
+from src.transforms.affine_transformation import AffineTransformation
+from src.transforms.linear_transformation import LinearTransformation
+
+
+def test_process_renderer_merges_all_workers(world: Rect,
+                                             sierpinski_transformations: list[AffineTransformation]) -> None:
+    renderer = ProcessRenderer(5, 3, 7, 51, 1, [LinearTransformation()], workers=3)
+    image = FractalImage.create(8, 8)
+    renderer.render_image(image, world, sierpinski_transformations)
+    hits, color_sums = image.histogram()
+    assert hits.sum() == 7 * 50
+    assert np.all(color_sums[:, hits == 0] == 0)
+
+
+def test_process_renderer_writes_mapped_image(tmp_path: Path, world: Rect,
+                                              sierpinski_transformations: list[AffineTransformation]) -> None:
+    renderer = ProcessRenderer(5, 3, 7, 51, 1, [LinearTransformation()], workers=3, seed=4)
+    expected = FractalImage.create(8, 8)
+    renderer.render_image(expected, world, sierpinski_transformations)
+    image = FractalImage.create_mapped(tmp_path, 8, 8)
+    renderer.render_image(image, world, sierpinski_transformations)
+    assert np.array_equal(image.hits, expected.hits)
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["hits.npy", "normal.npy", "rgb.npy", "sums.npy"]
+    assert np.array_equal(FractalImage.open_mapped(tmp_path).hits, expected.hits)
+    assert np.array_equal(FractalImage.open_mapped(tmp_path).sums, expected.sums)
+
+
+def test_process_pool_is_created_once_for_all_passes(monkeypatch: pytest.MonkeyPatch, world: Rect,
+                                                     sierpinski_transformations: list[AffineTransformation]) -> None:
+    pools: list[ProcessPoolExecutor] = []
+
+    class CountingPool(ProcessPoolExecutor):
+        def __init__(self, max_workers: int) -> None:
+            super().__init__(max_workers=max_workers)
+            pools.append(self)
+
+    expected = FractalImage.create(8, 8)
+    ProcessRenderer(5, 3, 8, 51, 1, [LinearTransformation()], workers=2, seed=4).render_image(
+        expected, world, sierpinski_transformations)
+    monkeypatch.setattr(process_renderer, "ProcessPoolExecutor", CountingPool)
+    renderer = ProcessRenderer(5, 3, 8, 51, 1, [LinearTransformation()], workers=2, seed=4)
+    image = FractalImage.create(8, 8)
+    renderer.render_image(image, world, sierpinski_transformations, passes=4)
+    assert len(pools) == 1
+    assert renderer.executor is None
+    assert np.array_equal(image.hits, expected.hits)
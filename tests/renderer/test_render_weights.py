@@ -0,0 +1,111 @@
+import numpy as np
+import pytest
+
+from src.generator.checkpoint import Checkpoint
+from src.model.color_mode import ColorMode
+from src.model.fractal_image import FractalImage
+from src.model.rect import Rect
+from src.model.render_weights import RenderWeights
+from src.renderer.numpy_renderer import NumpyRenderer
+from src.renderer.single_thread_renderer import SingleThreadRenderer
+from src.transforms.affine_transformation import AffineTransformation
+from src.transforms.linear_transformation import LinearTransformation
+from src.ui.command_line_args import CommandLineArgs
+
+
+@pytest.mark.parametrize("renderer_type", [SingleThreadRenderer, NumpyRenderer])
+def test_zero_affine_weight_is_never_used(renderer_type: type, world: Rect,
+                                          sierpinski_transformations: list[AffineTransformation]) -> None:
+    # Остаётся только сжатие к началу координат: все точки попадают в угловой пиксель
+    renderer = renderer_type(5, 3, 8, 50, 1, [LinearTransformation()], seed=3,
+                             weights=RenderWeights(affines=(1.0, 0.0, 0.0)))
+    image = FractalImage.create(16, 16)
+    renderer.render_image(image, world, sierpinski_transformations)
+    assert image.hits[0, 0] == 8 * 49
+    assert image.hits.sum() == image.hits[0, 0]
+    assert image.sums[0, 0].tolist() == [255 * 8 * 49, 0, 0]
+
+
+def test_blend_sums_weighted_variations(world: Rect, sierpinski_transformations: list[AffineTransformation]) -> None:
+    # Половина Linear плюс половина Linear — это Linear; случайная последовательность та же
+    variations = [LinearTransformation(), LinearTransformation()]
+    blend = SingleThreadRenderer(5, 3, 8, 200, 1, variations, seed=5,
+                                 weights=RenderWeights(variations=(0.5, 0.5), blend=True))
+    select = SingleThreadRenderer(5, 3, 8, 200, 1, variations, seed=5)
+    blend_image = FractalImage.create(16, 16)
+    select_image = FractalImage.create(16, 16)
+    blend.render_image(blend_image, world, sierpinski_transformations)
+    select.render_image(select_image, world, sierpinski_transformations)
+    assert np.array_equal(blend_image.hits, select_image.hits)
+    assert np.array_equal(blend_image.sums, select_image.sums)
+
+
+def test_numpy_blend_sums_weighted_variations(world: Rect,
+                                              sierpinski_transformations: list[AffineTransformation]) -> None:
+    blend = NumpyRenderer(5, 3, 8, 200, 1, [LinearTransformation(), LinearTransformation()], batch_size=64, seed=5,
+                          weights=RenderWeights(variations=(0.25, 0.75), blend=True))
+    single = NumpyRenderer(5, 3, 8, 200, 1, [LinearTransformation()], batch_size=64, seed=5)
+    blend_image = FractalImage.create(16, 16)
+    single_image = FractalImage.create(16, 16)
+    blend.render_image(blend_image, world, sierpinski_transformations)
+    single.render_image(single_image, world, sierpinski_transformations)
+    assert np.array_equal(blend_image.hits, single_image.hits)
+
+
+def test_weights_count_is_validated() -> None:
+    with pytest.raises(ValueError, match="variation weights"):
+        SingleThreadRenderer(5, 3, 8, 50, 1, [LinearTransformation()], weights=RenderWeights(variations=(1.0, 2.0)))
+    with pytest.raises(ValueError, match="Affine weights"):
+        NumpyRenderer(5, 2, 8, 50, 1, [LinearTransformation()], weights=RenderWeights(affines=(0.0, 0.0)))
+
+
+def test_command_line_weights() -> None:
+    base = ["--image.width", "8", "--image.height", "8", "--renderer.type", "numpy", "--affineCount", "2",
+            "--steps", "5", "--samples", "4", "--iterSamples", "10", "--symmetry", "1", "--batchSize", "16",
+            "--rect.cordX", "0", "--rect.cordY", "0", "--rect.width", "1", "--rect.height", "1",
+            "--processor.gamma", "2.2", "--saver.format", "png", "--saver.path", "out"]
+    default = CommandLineArgs([*base, "--transformations.LinearTrans", "--transformations.DiskTrans"])
+    assert default.get_weights().is_default
+    assert Checkpoint.renderer_settings(default.get_renderer())["weights"] == default.get_weights().to_dict()
+
+    weighted = CommandLineArgs([*base, "--transformations.LinearTrans", "3", "--transformations.DiskTrans",
+                                "--variations.blend", "--affineWeights", "1", "0.5"])
+    weights = weighted.get_weights()
+    # Порядок весов — порядок списка трансформаций
+    assert weights == RenderWeights(variations=(1.0, 3.0), affines=(1.0, 0.5), blend=True)
+    renderer = weighted.get_renderer()
+    assert renderer.weights == weights
+    assert Checkpoint.renderer_settings(renderer)["weights"] == weights.to_dict()
+
+
+@pytest.mark.parametrize("renderer_type", [SingleThreadRenderer, NumpyRenderer])
+def test_palette_mode_accumulates_color_coordinates(renderer_type: type, world: Rect,
+                                                    sierpinski_transformations: list[AffineTransformation]) -> None:
+    renderer = renderer_type(5, 3, 8, 100, 1, [LinearTransformation()], seed=3, color_mode=ColorMode.palette)
+    image = FractalImage.create(16, 16, channels=ColorMode.palette.channels)
+    renderer.render_image(image, world, sierpinski_transformations)
+    assert image.sums.shape == (16, 16, 1)
+    hit = image.hits > 0
+    average = image.sums[hit][:, 0] / image.hits[hit]
+    assert hit.any()
+    assert ((average >= 0) & (average <= 1)).all()
+
+    with pytest.raises(ValueError, match="color channels"):
+        renderer.render_image(FractalImage.create(16, 16), world, sierpinski_transformations)
+
+
+def test_command_line_palette() -> None:
+    base = ["--image.width", "8", "--image.height", "8", "--renderer.type", "numpy", "--affineCount", "2",
+            "--steps", "5", "--samples", "4", "--iterSamples", "10", "--symmetry", "1", "--batchSize", "16",
+            "--rect.cordX", "0", "--rect.cordY", "0", "--rect.width", "1", "--rect.height", "1",
+            "--processor.gamma", "2.2", "--saver.format", "png", "--saver.path", "out",
+            "--transformations.LinearTrans"]
+    default = CommandLineArgs(base)
+    assert default.get_color_mode() is ColorMode.rgb
+    assert Checkpoint.renderer_settings(default.get_renderer())["color_mode"] == "rgb"
+
+    config = CommandLineArgs([*base, "--colorMode", "palette", "--palette.name", "fire", "--palette.size", "1024"])
+    renderer = config.get_renderer()
+    assert renderer.color_mode is ColorMode.palette
+    assert Checkpoint.renderer_settings(renderer)["color_mode"] == "palette"
+    assert config.get_palette().size == 1024
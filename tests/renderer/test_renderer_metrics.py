@@ -0,0 +1,66 @@
+from collections.abc import Callable
+
+import numpy as np
+import pytest
+
+from src.model.color_mode import ColorMode
+from src.model.fractal_image import FractalImage
+from src.model.rect import Rect
+from src.renderer.abstract_renderer import AbstractRenderer
+from src.renderer.multi_thread_renderer import MultiThreadRenderer
+from src.renderer.numpy_renderer import NumpyRenderer
+from src.renderer.process_renderer import ProcessRenderer
+from src.renderer.single_thread_renderer import SingleThreadRenderer
+from src.transforms.affine_transformation import AffineTransformation
+from src.transforms.linear_transformation import LinearTransformation
+from src.utils.render_metrics import RenderMetrics
+
+RENDERERS: dict[str, Callable[..., AbstractRenderer]] = {
+    "single": lambda **kwargs: SingleThreadRenderer(**kwargs),
+    "multi": lambda **kwargs: MultiThreadRenderer(workers=2, **kwargs),
+    "process": lambda **kwargs: ProcessRenderer(workers=2, **kwargs),
+    "numpy": lambda **kwargs: NumpyRenderer(batch_size=4, **kwargs),
+}
+
+
+@pytest.mark.parametrize("name", list(RENDERERS))
+def test_renderer_records_stages_and_counters(name: str, world: Rect,
+                                              sierpinski_transformations: list[AffineTransformation]) -> None:
+    renderer = RENDERERS[name](steps_for_normalization=5, affine_count=3, samples=6, iter_per_sample=41, symmetry=2,
+                               variations=[LinearTransformation()], seed=5)
+    renderer.metrics = RenderMetrics()
+    image = FractalImage.create(8, 8)
+    renderer.render_image(image, world, sierpinski_transformations)
+
+    metrics = renderer.metrics
+    assert {"warmup", "iteration", "symmetry", "pixel_resolution", "histogram"} <= set(metrics.stages)
+    assert metrics.counters["iterations"] == 6 * (5 + 41)
+    assert metrics.counters["plotted"] == 6 * 40 * 2
+    assert metrics.counters["hits"] == image.hits.sum() <= metrics.counters["plotted"]
+    assert metrics.counters["discarded"] == 0
+    assert sum(totals["samples"] for totals in metrics.workers.values()) == 6
+    assert sum(totals["iterations"] for totals in metrics.workers.values()) == 6 * (5 + 41)
+    if name in ("multi", "process"):
+        assert len(metrics.workers) == 2
+
+
+def test_render_without_metrics_records_nothing(world: Rect,
+                                                sierpinski_transformations: list[AffineTransformation]) -> None:
+    renderer = SingleThreadRenderer(5, 3, 2, 20, 1, [LinearTransformation()], seed=5)
+    renderer.render_image(FractalImage.create(8, 8), world, sierpinski_transformations)
+    assert renderer.metrics is None
+
+
+@pytest.mark.parametrize("color_mode", list(ColorMode))
+def test_timed_render_matches_untimed(color_mode: ColorMode, world: Rect,
+                                      sierpinski_transformations: list[AffineTransformation]) -> None:
+    images = []
+    for metrics in (None, RenderMetrics()):
+        renderer = SingleThreadRenderer(5, 3, 3, 50, 3, [LinearTransformation()], seed=8, color_mode=color_mode)
+        renderer.metrics = metrics
+        image = FractalImage.create(8, 8, channels=color_mode.channels)
+        renderer.render_image(image, world, sierpinski_transformations)
+        images.append(image)
+    assert images[0].hits.any()
+    assert np.array_equal(images[0].hits, images[1].hits)
+    assert np.array_equal(images[0].sums, images[1].sums)
@@ -0,0 +1,99 @@
+import numpy as np
+import pytest
+
+from src.model.fractal_image import FractalImage
+from src.model.rect import Rect
+from src.renderer.abstract_renderer import AbstractRenderer
+from src.renderer.multi_thread_renderer import MultiThreadRenderer
+from src.renderer.numpy_renderer import NumpyRenderer
+from src.renderer.process_renderer import ProcessRenderer
+from src.renderer.single_thread_renderer import SingleThreadRenderer
+from src.transforms.disk_transformation import DiskTransformation
+from src.transforms.spherical_transformation import SphericalTransformation
+from src.utils.random_utils import RandomStreams
+
+
+def _renderer(renderer_type: str, seed: int) -> AbstractRenderer:
+    variations = [DiskTransformation(), SphericalTransformation()]
+    if renderer_type == "numpy":
+        return NumpyRenderer(5, 4, 8, 60, 2, variations, batch_size=32, seed=seed)
+    if renderer_type == "process":
+        return ProcessRenderer(5, 4, 8, 60, 2, variations, workers=3, seed=seed)
+    if renderer_type == "multi":
+        return MultiThreadRenderer(5, 4, 8, 60, 2, variations, workers=3, seed=seed)
+    return SingleThreadRenderer(5, 4, 8, 60, 2, variations, seed=seed)
+
+
+@pytest.mark.parametrize("renderer_type", ["simple", "multi", "numpy", "process"])
+def test_same_seed_gives_identical_image(renderer_type: str) -> None:
+    world = Rect(-1, -1, 2, 2)
+    first = _renderer(renderer_type, 42).render(16, 16, world)
+    second = _renderer(renderer_type, 42).render(16, 16, world)
+    assert first.hits.any()
+    assert np.array_equal(first.hits, second.hits)
+    assert np.array_equal(first.sums, second.sums)
+
+
+def test_different_seeds_differ() -> None:
+    world = Rect(-1, -1, 2, 2)
+    first = _renderer("numpy", 1).render(16, 16, world)
+    second = _renderer("numpy", 2).render(16, 16, world)
+    assert not np.array_equal(first.hits, second.hits)
+
+
+@pytest.mark.parametrize("renderer_type", ["multi", "process"])
+def test_hits_do_not_depend_on_parallelism(renderer_type: str) -> None:
+    world = Rect(-1, -1, 2, 2)
+    expected = _renderer("simple", 7).render(16, 16, world)
+    actual = _renderer(renderer_type, 7).render(16, 16, world)
+    assert np.array_equal(expected.hits, actual.hits)
+    assert np.array_equal(expected.sums, actual.sums)
+
+
+@pytest.mark.parametrize("renderer_type", ["simple", "numpy"])
+def test_render_samples_in_parts_matches_whole(renderer_type: str) -> None:
+    renderer = _renderer(renderer_type, 3)
+    world = Rect(-1, -1, 2, 2)
+    streams = RandomStreams(3)
+    affine_transformations = renderer.generate_affine_transformations(streams.affine_random())
+    whole = FractalImage.create(16, 16)
+    renderer.render_samples(whole, world, affine_transformations, streams, 0, 8)
+    parts = FractalImage.create(16, 16)
+    renderer.render_samples(parts, world, affine_transformations, streams, 0, 3)
+    renderer.render_samples(parts, world, affine_transformations, streams, 3, 5)
+    assert whole.hits.any()
+    assert np.array_equal(whole.hits, parts.hits)
+    assert np.array_equal(whole.sums, parts.sums)
+
+
+def test_numpy_passes_do_not_change_image() -> None:
+    # Сэмплы делятся на несколько дорожек, и проходы разрезают пачку посередине
+    renderer = NumpyRenderer(2, 4, 6, 200, 2, [DiskTransformation(), SphericalTransformation()], batch_size=64,
+                             seed=5)
+    world = Rect(-1, -1, 2, 2)
+    whole = renderer.render(16, 16, world)
+    passes = renderer.render(16, 16, world, 3)
+    assert whole.hits.any()
+    assert np.array_equal(whole.hits, passes.hits)
+    assert np.array_equal(whole.sums, passes.sums)
+
+
+def test_numpy_added_samples_do_not_replay_earlier_lanes() -> None:
+    variations = [DiskTransformation(), SphericalTransformation()]
+    world = Rect(-1, -1, 2, 2)
+    streams = RandomStreams(6)
+    first = NumpyRenderer(2, 4, 8, 2001, 1, variations, batch_size=64, seed=6)
+    affine_transformations = first.generate_affine_transformations(streams.affine_random())
+    # Продолжение при большем количестве сэмплов и другом размере пачки
+    resumed = FractalImage.create(16, 16)
+    first.render_samples(resumed, world, affine_transformations, streams, 0, 8)
+    added = FractalImage.create(16, 16)
+    NumpyRenderer(2, 4, 16, 2001, 1, variations, batch_size=100, seed=6).render_samples(
+        added, world, affine_transformations, streams, 8, 8)
+    resumed.merge(added)
+
+    whole = FractalImage.create(16, 16)
+    NumpyRenderer(2, 4, 16, 2001, 1, variations, batch_size=64, seed=6).render_samples(
+        whole, world, affine_transformations, streams, 0, 16)
+    assert np.array_equal(resumed.hits, whole.hits)
+    assert np.array_equal(resumed.sums, whole.sums)
@@ -0,0 +1,72 @@
+import random
+
+import numpy as np
+import pytest
+
+from src.model.fractal_image import FractalImage
+from src.model.point import Point
+from src.model.precision import Precision, set_precision
+from src.model.rect import Rect
+from src.model.symmetry_table import SymmetryTable
+from src.renderer.single_thread_renderer import SingleThreadRenderer
+from src.transforms.affine_transformation import AffineTransformation
+from src.transforms.transformation import Transformation
+from src.ui.command_line_args import CommandLineArgs
+from src.utils import random_utils
+from src.utils.random_utils import RandomStreams
+
+
+class _Swap(Transformation):
+    def apply(self, point: Point) -> Point:
+        return Point(point.y / 2, point.x / 2)
+
+
+def _reference_sample(renderer: SingleThreadRenderer, image: FractalImage, world: Rect,
+                      affine_transformations: list[AffineTransformation], random_instance: random.Random) -> None:
+    # Поточечная реализация на объектах Point, которую заменил скомпилированный конвейер
+    symmetry_table = SymmetryTable(world, renderer.symmetry)
+    point = random_utils.get_random_point(world, random_instance)
+    for step in range(-renderer.steps_for_normalization, renderer.iter_per_sample):
+        affine = random_utils.get_random_elem_from_list(affine_transformations, random_instance)
+        variation = random_utils.get_random_elem_from_list(renderer.variations, random_instance)
+        point = variation.apply(affine.apply(point))
+        if step > 0:
+            for symmetric in symmetry_table.apply(point):
+                pixel = image.resolve_pixel(world, symmetric)
+                if pixel:
+                    pixel.saturate_hit_count(affine.affine_coef.color)
+
+
+@pytest.mark.parametrize("precision", list(Precision))
+@pytest.mark.parametrize("symmetry", [1, 3])
+def test_pipeline_matches_point_reference(precision: Precision, symmetry: int) -> None:
+    set_precision(precision)
+    try:
+        world = Rect(-1, -1, 2, 2)
+        variations = [CommandLineArgs.TRANSFORMATIONS[name]() for name in ("LinearTrans", "SphericalTrans")]
+        renderer = SingleThreadRenderer(5, 3, 4, 150, symmetry, [*variations, _Swap()], seed=4)
+        affine_transformations = renderer.generate_affine_transformations(random.Random(1))
+
+        image = FractalImage.create(24, 18)
+        renderer.render_image(image, world, affine_transformations)
+        expected = FractalImage.create(24, 18)
+        streams = RandomStreams(renderer.seed)
+        for index in range(renderer.samples):
+            _reference_sample(renderer, expected, world, affine_transformations, streams.sample_random(index))
+
+        assert image.hits.sum() > 0
+        assert np.array_equal(image.hits, expected.hits)
+        assert np.array_equal(image.sums, expected.sums)
+    finally:
+        set_precision(Precision.float64)
+
+
+@pytest.mark.parametrize("name", sorted(CommandLineArgs.TRANSFORMATIONS))
+def test_apply_xy_matches_apply(name: str) -> None:
+    transformation = CommandLineArgs.TRANSFORMATIONS[name]()
+    point = transformation.apply(Point(0.3, -0.7))
+    assert transformation.apply_xy(0.3, -0.7) == (point.x, point.y)
+
+
+def test_default_apply_xy_uses_apply() -> None:
+    assert _Swap().apply_xy(1.0, 2.0) == (1.0, 0.5)
@@ -0,0 +1,41 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from src.model.fractal_image import FractalImage
+from src.saver.encoder_options import EncoderOptions
+from src.saver.fornat_image_saver import FormatImageSaver
+from src.saver.image_format import ImageFormat
+
+
+@pytest.fixture
+def fractal_image() -> FractalImage:
+    image = FractalImage.create(5, 3)
+    image.rgb[...] = np.random.default_rng(3).integers(0, 256, image.rgb.shape)
+    return image
+
+
+@pytest.mark.parametrize("image_format", ["png", "bmp", "webp"])
+def test_lossless_save_keeps_pixels(tmp_path: Path, fractal_image: FractalImage, image_format: str) -> None:
+    path = tmp_path / f"fractal.{image_format}"
+    FormatImageSaver(image_format, EncoderOptions(png_compress_level=1, webp_lossless=True)).save(fractal_image, path)
+    with Image.open(path) as saved:
+        assert saved.size == (5, 3)
+        assert np.array_equal(np.asarray(saved.convert("RGB")), fractal_image.rgb)
+
+
+def test_jpeg_quality_changes_size(tmp_path: Path) -> None:
+    image = FractalImage.create(64, 64)
+    image.rgb[...] = np.random.default_rng(5).integers(0, 256, image.rgb.shape)
+    low, high = tmp_path / "low.jpg", tmp_path / "high.jpg"
+    FormatImageSaver("jpg", EncoderOptions(jpeg_quality=10)).save(image, low)
+    FormatImageSaver("jpeg", EncoderOptions(jpeg_quality=95)).save(image, high)
+    assert low.stat().st_size < high.stat().st_size
+
+
+def test_parse_unknown_format() -> None:
+    assert ImageFormat.parse("JPG") is ImageFormat.jpeg
+    with pytest.raises(ValueError, match="Unsupported"):
+        ImageFormat.parse("tiff")
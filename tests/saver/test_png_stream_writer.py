@@ -0,0 +1,23 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from src.saver.png_stream_writer import PngStreamWriter
+
+
+def test_streamed_png_matches_rows(tmp_path: Path) -> None:
+    rows = np.random.default_rng(1).integers(0, 256, (37, 21, 3), dtype=np.uint8)
+    path = tmp_path / "streamed.png"
+    with PngStreamWriter(path, 21, 37, compress_level=1) as writer:
+        for start in range(0, 37, 10):
+            writer.write_rows(rows[start:start + 10])
+    with Image.open(path) as saved:
+        assert saved.mode == "RGB"
+        assert np.array_equal(np.asarray(saved), rows)
+
+
+def test_missing_rows_are_rejected(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="Expected 4 rows"), PngStreamWriter(tmp_path / "short.png", 2, 4) as writer:
+        writer.write_rows(np.zeros((3, 2, 3), dtype=np.uint8))
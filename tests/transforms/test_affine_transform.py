@@ -1,5 +1,6 @@
 from decimal import Decimal
 
+import numpy as np
 import pytest
 
 from src.model.point import Point
@@ -19,3 +20,17 @@ def test_affine_transform(affine_transformation: AffineTransformation, x: float,
     exp_point: Point = Point(res_x, res_y)
     assert (abs(affine_transformation.apply(act_point).x - exp_point.x) < Decimal("0.000000001"))
     assert (abs(affine_transformation.apply(act_point).y - exp_point.y) < Decimal("0.000000001"))
+
+
+@pytest.mark.parametrize(
+    ("x", "y", "res_x", "res_y"),
+    [
+        (0, 0, 0.3, 0.6),
+        (1, 1, 0.6, 1.5)
+    ]
+)
+def test_affine_transform_batch(affine_transformation: AffineTransformation, x: float, y: float,
+                                res_x: float, res_y: float) -> None:
+    act_x, act_y = affine_transformation.apply_batch(np.array([x], dtype=float), np.array([y], dtype=float))
+    assert abs(act_x[0] - res_x) < 0.000000001
+    assert abs(act_y[0] - res_y) < 0.000000001
@@ -1,5 +1,7 @@
 from decimal import Decimal
 
+import numpy as np
+
 from src.model.point import Point
 from src.transforms.disk_transformation import DiskTransformation
 
@@ -9,3 +11,9 @@ def test_disk_transform() -> None:
     exp_point: Point = Point(-0.2409756332, -0.0665638355)
     assert abs(DiskTransformation().apply(act_point).x - exp_point.x) < Decimal("0.00000001")
     assert abs(DiskTransformation().apply(act_point).y - exp_point.y) < Decimal("0.00000001")
+
+
+def test_disk_transform_batch() -> None:
+    act_x, act_y = DiskTransformation().apply_batch(np.array([1.0, 1.0]), np.array([1.0, 1.0]))
+    assert np.allclose(act_x, -0.2409756332, atol=0.00000001)
+    assert np.allclose(act_y, -0.0665638355, atol=0.00000001)
@@ -1,5 +1,7 @@
 from decimal import Decimal
 
+import numpy as np
+
 from src.model.point import Point
 from src.transforms.exp_transformation import ExpTransformation
 
@@ -9,3 +11,9 @@ def test_exp_transform() -> None:
     exp_point: Point = Point(-1, 0)
     assert abs(ExpTransformation().apply(act_point).x - exp_point.x) < Decimal("0.00000001")
     assert abs(ExpTransformation().apply(act_point).y - exp_point.y) < Decimal("0.00000001")
+
+
+def test_exp_transform_batch() -> None:
+    act_x, act_y = ExpTransformation().apply_batch(np.array([1.0, 1.0]), np.array([1.0, 1.0]))
+    assert np.allclose(act_x, -1, atol=0.00000001)
+    assert np.allclose(act_y, 0, atol=0.00000001)
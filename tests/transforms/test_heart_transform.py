@@ -1,5 +1,7 @@
 from decimal import Decimal
 
+import numpy as np
+
 from src.model.point import Point
 from src.transforms.heart_transformation import HeartTransformation
 
@@ -9,3 +11,9 @@ def test_heart_transform() -> None:
     exp_point: Point = Point(1.2671621313, -0.6279332232)
     assert abs(HeartTransformation().apply(act_point).x - exp_point.x) < Decimal("0.00000001")
     assert abs(HeartTransformation().apply(act_point).y - exp_point.y) < Decimal("0.00000001")
+
+
+def test_heart_transform_batch() -> None:
+    act_x, act_y = HeartTransformation().apply_batch(np.array([1.0, 1.0]), np.array([1.0, 1.0]))
+    assert np.allclose(act_x, 1.2671621313, atol=0.00000001)
+    assert np.allclose(act_y, -0.6279332232, atol=0.00000001)
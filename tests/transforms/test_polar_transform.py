@@ -1,5 +1,7 @@
 from decimal import Decimal
 
+import numpy as np
+
 from src.model.point import Point
 from src.transforms.polar_transformation import PolarTransformation
 
@@ -9,3 +11,9 @@ def test_polar_transform() -> None:
     exp_point: Point = Point(0.25, 0.4142135623)
     assert abs(PolarTransformation().apply(act_point).x - exp_point.x) < Decimal("0.00000001")
     assert abs(PolarTransformation().apply(act_point).y - exp_point.y) < Decimal("0.00000001")
+
+
+def test_polar_transform_batch() -> None:
+    act_x, act_y = PolarTransformation().apply_batch(np.array([1.0, 1.0]), np.array([1.0, 1.0]))
+    assert np.allclose(act_x, 0.25, atol=0.00000001)
+    assert np.allclose(act_y, 0.4142135623, atol=0.00000001)
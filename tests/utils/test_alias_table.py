@@ -0,0 +1,39 @@
+import random
+
+import numpy as np
+import pytest
+
+from src.utils.alias_table import AliasTable
+
+
+def test_uniform_table_matches_uniform_choice() -> None:
+    table = AliasTable([2.0, 2.0, 2.0])
+    assert table.uniform
+    values = [random.Random(3).random() * 3 for _ in range(100)]
+    assert [table.pick(value) for value in values] == [int(value) for value in values]
+    batch = np.random.default_rng(5).random(50)
+    assert np.array_equal(table.pick_values(batch), (batch * 3).astype(np.int64))
+
+
+@pytest.mark.parametrize("weights", [[1.0, 3.0], [0.5, 0.0, 2.0, 1.5], [10.0, 1.0, 1.0, 1.0, 1.0]])
+def test_frequencies_follow_weights(weights: list[float]) -> None:
+    table = AliasTable(weights)
+    expected = np.array(weights) / sum(weights)
+
+    picks = table.pick_values(np.random.default_rng(1).random(200_000))
+    assert np.allclose(np.bincount(picks, minlength=len(weights)) / picks.shape[0], expected, atol=0.01)
+
+    random_instance = random.Random(2)
+    scalar = [table.pick(random_instance.random() * len(weights)) for _ in range(50_000)]
+    assert np.allclose(np.bincount(scalar, minlength=len(weights)) / len(scalar), expected, atol=0.015)
+
+
+def test_zero_weight_is_never_picked() -> None:
+    table = AliasTable([0.0, 1.0, 0.0])
+    assert set(table.pick_values(np.random.default_rng(0).random(10_000)).tolist()) == {1}
+
+
+@pytest.mark.parametrize("weights", [[], [-1.0, 2.0], [0.0, 0.0]])
+def test_invalid_weights(weights: list[float]) -> None:
+    with pytest.raises(ValueError, match="eight"):
+        AliasTable(weights)
@@ -0,0 +1,54 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from src.utils.render_metrics import RenderMetrics
+
+
+def test_merge_adds_stages_counters_and_workers() -> None:
+    metrics = RenderMetrics()
+    metrics.add_time("iteration", 1.0)
+    metrics.count("iterations", 10)
+    metrics.add_worker(0, 1, 10, 2.0)
+    other = RenderMetrics()
+    other.add_time("iteration", 0.5)
+    other.add_time("warmup", 0.25)
+    other.count("iterations", 5)
+    other.add_worker(0, 1, 6, 1.0)
+    other.add_worker(1, 2, 20, 4.0)
+    metrics.merge(other)
+    assert metrics.stages == {"iteration": 1.5, "warmup": 0.25}
+    assert metrics.counters == {"iterations": 15}
+    assert metrics.workers == {0: {"samples": 2, "iterations": 16, "seconds": 3.0},
+                               1: {"samples": 2, "iterations": 20, "seconds": 4.0}}
+
+
+def test_report_orders_stages_and_derives_counters(tmp_path: Path) -> None:
+    metrics = RenderMetrics()
+    metrics.add_time("encoding", 0.1)
+    metrics.add_time("warmup", 0.2)
+    with metrics.stage("affine_generation"):
+        pass
+    metrics.count("plotted", 12)
+    metrics.count("hits", 9)
+    metrics.add_worker(0, 1, 30, 3.0)
+    metrics.add_worker(1, 0, 0, 0.0)
+    report = metrics.to_dict(1.5)
+    assert list(report["stages"]) == ["affine_generation", "warmup", "encoding"]
+    assert report["counters"]["out_of_bounds"] == 3
+    assert report["workers"][0]["points_per_second"] == pytest.approx(10.0)
+    assert report["workers"][1]["points_per_second"] == 0.0
+
+    path = tmp_path / "metrics.json"
+    metrics.write(path, 1.5)
+    assert json.loads(path.read_text(encoding="utf-8")) == report
+
+
+def test_measure_without_metrics_does_nothing() -> None:
+    with RenderMetrics.measure(None, "iteration"):
+        pass
+    metrics = RenderMetrics()
+    with RenderMetrics.measure(metrics, "iteration"):
+        pass
+    assert list(metrics.stages) == ["iteration"]